@@ -5,11 +5,7 @@ Spectre Build CLI - Execute an agent in a loop, one parent task per iteration.
 The CLI handles the loop; the agent handles task tracking and progress writing.
 """
 
-from .agent import get_agent, CLAUDE_ALLOWED_TOOLS, CLAUDE_DENIED_TOOLS
-from .loop import run_build_loop
-from .prompt import build_prompt
-from .stats import BuildStats
-from .stream import format_tool_call, process_stream_event
+import importlib
 
 
 __all__ = [
@@ -24,6 +20,28 @@ __all__ = [
     "CLAUDE_DENIED_TOOLS",
 ]
 
+# Public names resolved on first access, so `spectre-build --help` and other
+# light paths don't pay for importing the agent runners (and asyncio).
+_LAZY_EXPORTS = {
+    "run_build_loop": ".loop",
+    "build_prompt": ".prompt",
+    "BuildStats": ".stats",
+    "format_tool_call": ".stream",
+    "process_stream_event": ".stream",
+    "get_agent": ".agent",
+    "CLAUDE_ALLOWED_TOOLS": ".agent",
+    "CLAUDE_DENIED_TOOLS": ".agent",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 def main() -> None:
     """Main entry point for Spectre Build CLI."""
@@ -5,6 +5,8 @@ Provides a strategy pattern for executing build iterations with
 different coding agents (Claude Code, Codex CLI).
 """
 
+import asyncio
+import io
 import json
 import logging
 import os
@@ -12,29 +14,184 @@ import shutil
 import subprocess
 import sys
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TypeVar
 
+from .codex_env import setup_codex_home
 from .stats import BuildStats
 from .stream import process_stream_event
 
+T = TypeVar("T")
+
+try:
+    # Optional C parser; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Bytes pulled from the agent's stdout per read; one read typically
+# covers many stream-json events.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Characters of prompt encoded and written to stdin at a time, so a large
+# prompt never needs a full encoded copy alongside the str.
+_PROMPT_CHUNK_CHARS = 64 * 1024
+
+
+# Resolved absolute paths of agent binaries. Only hits are cached, so a CLI
+# installed while a long-running server is up is still picked up.
+_BINARY_PATHS: dict[str, str] = {}
+
+
+def _resolve_binary(name: str) -> str | None:
+    """Return the absolute path of an agent binary, scanning PATH once."""
+    path = _BINARY_PATHS.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _BINARY_PATHS[name] = path
+    return path
+
+
+async def _stream_subprocess(
+    cmd: list[str],
+    prompt: str,
+    on_event: Callable[[dict, Callable[[str], None]], None],
+    timeout: int | None = None,
+    env: dict[str, str] | None = None,
+    skip_prefixes: tuple[bytes, ...] = (),
+) -> tuple[int, str, str]:
+    """Run an agent CLI, feeding it the prompt and streaming its JSON lines.
+
+    Each stdout line is decoded as JSON and handed to ``on_event`` together
+    with an ``emit`` callback that appends text to the iteration output.
+    Non-JSON lines are echoed and emitted as-is. Lines starting with any of
+    ``skip_prefixes`` are dropped unparsed.
+
+    Raises:
+        FileNotFoundError: If the binary is not installed
+        subprocess.TimeoutExpired: If timeout is exceeded
+    """
+    # Pipes stay in bytes mode: JSON lines go to the parser undecoded and
+    # only non-JSON fallback lines are ever decoded to str.
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+    )
+
+    # Drain stderr alongside stdout so a chatty agent can't fill the pipe
+    # and block on a stderr write while we're waiting on stdout.
+    stderr_task = asyncio.create_task(proc.stderr.read())
+    buf = io.StringIO()
+
+    def emit(text: str) -> None:
+        if buf.tell():
+            buf.write("\n")
+        buf.write(text)
+
+    def handle_line(raw: bytes | bytearray) -> None:
+        if skip_prefixes and raw.startswith(skip_prefixes):
+            return
+        # Both parsers take bytes directly, so the common case skips
+        # decode() and strip() entirely.
+        try:
+            event = _json_loads(raw)
+        except json.JSONDecodeError:
+            line = raw.decode(errors="replace").strip()
+            if line:
+                sys.stdout.write(line + "\n")
+                emit(line)
+            return
+        on_event(event, emit)
+
+    async def consume() -> None:
+        # Read in large chunks and split lines ourselves; a line that spans
+        # several chunks accumulates in `partial` until its newline arrives.
+        partial = bytearray()
+        while chunk := await proc.stdout.read(_STREAM_CHUNK_SIZE):
+            cut = chunk.rfind(b"\n")
+            if cut < 0:
+                partial += chunk
+                continue
+            partial += chunk[:cut]
+            for raw in partial.split(b"\n"):
+                handle_line(raw)
+            partial = bytearray(chunk[cut + 1:])
+        if partial:
+            handle_line(partial)
+        await proc.wait()
+
+    try:
+        for start in range(0, len(prompt), _PROMPT_CHUNK_CHARS):
+            proc.stdin.write(prompt[start:start + _PROMPT_CHUNK_CHARS].encode())
+            await proc.stdin.drain()
+        proc.stdin.close()
+
+        try:
+            await asyncio.wait_for(consume(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+
+        error_output = (await stderr_task).decode(errors="replace")
+    finally:
+        # On timeout, error or cancellation (e.g. a failed sibling in a
+        # parallel group), don't leave the agent editing the working tree
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+        stderr_task.cancel()
+    full_output = buf.getvalue()
+
+    return proc.returncode, full_output, error_output
+
 
 class AgentRunner(ABC):
     """Base class for agent execution backends."""
 
+    # Runners carry no instance state; slots drop the per-instance __dict__
+    __slots__ = ()
+
     name: str
 
     @abstractmethod
     def check_available(self) -> bool:
         """Return True if this agent's CLI binary is on PATH."""
 
-    @abstractmethod
     def run_iteration(
         self,
         prompt: str,
         timeout: int | None = None,
         stats: BuildStats | None = None,
         denied_tools: list[str] | None = None,
+    ) -> tuple[int, str, str]:
+        """Execute one build iteration, blocking until the agent exits.
+
+        Synchronous entry point for the loop and pipeline; drives
+        ``run_iteration_async`` on a private event loop. Callers already
+        inside an event loop should await ``run_iteration_async`` instead.
+        """
+        return asyncio.run(
+            self.run_iteration_async(
+                prompt, timeout=timeout, stats=stats, denied_tools=denied_tools
+            )
+        )
+
+    @abstractmethod
+    async def run_iteration_async(
+        self,
+        prompt: str,
+        timeout: int | None = None,
+        stats: BuildStats | None = None,
+        denied_tools: list[str] | None = None,
     ) -> tuple[int, str, str]:
         """Execute one build iteration.
 
@@ -83,65 +240,113 @@ CLAUDE_DENIED_TOOLS = [
     "NotebookEdit",
 ]
 
+# Joined once at import; only per-stage denylists need a join per iteration
+_CLAUDE_ALLOWED_ARG = ",".join(CLAUDE_ALLOWED_TOOLS)
+_CLAUDE_DENIED_ARG = ",".join(CLAUDE_DENIED_TOOLS)
+_CLAUDE_OUTPUT_ARGS = ("--output-format", "stream-json", "--verbose")
+
+# Events that only feed BuildStats (and its debug logging); when neither is
+# in use they can be dropped before JSON parsing. Claude's result event
+# also repeats the full final response, so it is one of the largest lines.
+_CLAUDE_STATS_ONLY = (b'{"type":"result"',)
+_CODEX_STATS_ONLY = (b'{"type":"turn.completed"',)
+
+
+def _stats_only_prefixes(
+    stats: BuildStats | None, prefixes: tuple[bytes, ...]
+) -> tuple[bytes, ...]:
+    """Return prefixes safe to skip: none if stats or INFO logging want them."""
+    if stats is not None or logger.isEnabledFor(logging.INFO):
+        return ()
+    return prefixes
+
 
 class ClaudeRunner(AgentRunner):
     """Claude Code backend using `claude -p` with stream-json output."""
 
+    __slots__ = ()
+
     name = "claude"
 
     def check_available(self) -> bool:
-        return shutil.which("claude") is not None
+        return _resolve_binary("claude") is not None
 
-    def run_iteration(self, prompt, timeout=None, stats=None, denied_tools=None):
-        effective_denied = denied_tools if denied_tools is not None else CLAUDE_DENIED_TOOLS
+    async def run_iteration_async(self, prompt, timeout=None, stats=None, denied_tools=None):
+        denied_arg = _CLAUDE_DENIED_ARG if denied_tools is None else ",".join(denied_tools)
         cmd = [
-            "claude", "-p",
-            "--allowedTools", ",".join(CLAUDE_ALLOWED_TOOLS),
-            "--disallowedTools", ",".join(effective_denied),
-            "--output-format", "stream-json",
-            "--verbose",
+            _resolve_binary("claude") or "claude", "-p",
+            "--allowedTools", _CLAUDE_ALLOWED_ARG,
+            "--disallowedTools", denied_arg,
+            *_CLAUDE_OUTPUT_ARGS,
         ]
 
-        process = subprocess.Popen(
+        return await _stream_subprocess(
             cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            prompt,
+            lambda event, emit: process_stream_event(event, emit, stats),
+            timeout=timeout,
+            skip_prefixes=_stats_only_prefixes(stats, _CLAUDE_STATS_ONLY),
         )
 
-        process.stdin.write(prompt)
-        process.stdin.close()
 
-        text_buffer: list[str] = []
+# ---------------------------------------------------------------------------
+# Codex CLI
+# ---------------------------------------------------------------------------
 
-        for line in process.stdout:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                event = json.loads(line)
-                process_stream_event(event, text_buffer, stats)
-            except json.JSONDecodeError:
-                print(line)
-                text_buffer.append(line)
+_CODEX_ARGS = ("exec", "--sandbox", "workspace-write", "--json")
 
-        try:
-            process.wait(timeout=timeout)
-        except subprocess.TimeoutExpired:
-            process.kill()
-            process.wait()
-            raise
+# Synced CODEX_HOME per workspace directory. Credentials are copied on the
+# first iteration only; set SPECTRE_FORCE_CODEX_RESYNC=1 to copy every time
+# (e.g. when credentials are rotated mid-build).
+_CODEX_HOMES: dict[str, Path] = {}
 
-        error_output = process.stderr.read()
-        full_output = "\n".join(text_buffer)
 
-        return process.returncode, full_output, error_output
+def _get_codex_home() -> Path:
+    """Return the workspace CODEX_HOME, syncing credentials on first use."""
+    cwd = os.getcwd()
+    codex_home = _CODEX_HOMES.get(cwd)
+    if codex_home is None or os.environ.get("SPECTRE_FORCE_CODEX_RESYNC") == "1":
+        codex_home = _CODEX_HOMES[cwd] = setup_codex_home(Path(cwd))
+    return codex_home
 
 
-# ---------------------------------------------------------------------------
-# Codex CLI
-# ---------------------------------------------------------------------------
+def _codex_env(codex_home: str) -> dict[str, str]:
+    """Child environment for Codex: the current env plus CODEX_HOME.
+
+    Built fresh on each call, so changes to os.environ in a long-running
+    server (e.g. a rotated API key) reach the next Codex run.
+    """
+    return {**os.environ, "CODEX_HOME": codex_home}
+
+
+def _is_word(text: str) -> bool:
+    """Return True if text is non-empty and made only of word characters."""
+    return text.replace("_", "a").isalnum()
+
+
+def _strip_shell_wrapper(command: str) -> str:
+    """Unwrap `/bin/<shell> -<flags> '<cmd>'` (or "<cmd>") to just <cmd>.
+
+    Plain string ops rather than a regex; commands that don't match the
+    wrapper shape are returned unchanged.
+    """
+    if not command.startswith("/bin/"):
+        return command
+    parts = command.split(None, 2)
+    if len(parts) != 3:
+        return command
+    shell, flags, quoted = parts
+    if (
+        _is_word(shell[5:])
+        and flags.startswith("-")
+        and _is_word(flags[1:])
+        and len(quoted) > 2
+        and quoted[0] in "\"'"
+        and quoted[-1] in "\"'"
+    ):
+        return quoted[1:-1]
+    return command
+
 
 def _format_codex_command(command: str) -> str:
     """Format a Codex command_execution for display.
@@ -149,11 +354,7 @@ def _format_codex_command(command: str) -> str:
     Strips the shell wrapper (e.g. '/bin/zsh -lc "..."') to show just
     the inner command, truncated for readability.
     """
-    # Strip shell wrapper: /bin/zsh -lc '...' or /bin/zsh -lc "..."
-    import re
-    match = re.match(r'^/bin/\w+\s+-\w+\s+["\'](.+)["\']$', command, re.DOTALL)
-    if match:
-        command = match.group(1)
+    command = _strip_shell_wrapper(command)
 
     if len(command) > 80:
         command = command[:77] + "..."
@@ -163,64 +364,34 @@ def _format_codex_command(command: str) -> str:
 class CodexRunner(AgentRunner):
     """Codex CLI backend using `codex exec` with JSONL output."""
 
+    __slots__ = ()
+
     name = "codex"
 
     def check_available(self) -> bool:
-        return shutil.which("codex") is not None
-
-    def run_iteration(self, prompt, timeout=None, stats=None, denied_tools=None):
-        from .codex_env import setup_codex_home
+        return _resolve_binary("codex") is not None
 
+    async def run_iteration_async(self, prompt, timeout=None, stats=None, denied_tools=None):
         # Sync credentials for sandboxed execution
-        codex_home = setup_codex_home()
+        codex_home = _get_codex_home()
         logger.info("Codex iteration starting, CODEX_HOME=%s", codex_home)
 
-        env = os.environ.copy()
-        env["CODEX_HOME"] = str(codex_home)
+        cmd = [_resolve_binary("codex") or "codex", *_CODEX_ARGS]
 
-        cmd = ["codex", "exec", "--sandbox", "workspace-write", "--json"]
-
-        process = subprocess.Popen(
+        process = self._process_event
+        return await _stream_subprocess(
             cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            env=env,
+            prompt,
+            lambda event, emit: process(event, emit, stats),
+            timeout=timeout,
+            env=_codex_env(str(codex_home)),
+            skip_prefixes=_stats_only_prefixes(stats, _CODEX_STATS_ONLY),
         )
 
-        process.stdin.write(prompt)
-        process.stdin.close()
-
-        text_buffer: list[str] = []
-
-        for line in process.stdout:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                event = json.loads(line)
-                self._process_event(event, text_buffer, stats)
-            except json.JSONDecodeError:
-                print(line)
-                text_buffer.append(line)
-
-        try:
-            process.wait(timeout=timeout)
-        except subprocess.TimeoutExpired:
-            process.kill()
-            process.wait()
-            raise
-
-        error_output = process.stderr.read()
-        full_output = "\n".join(text_buffer)
-
-        return process.returncode, full_output, error_output
-
     def _process_event(
         self,
         event: dict,
-        text_buffer: list[str],
+        emit: Callable[[str], None],
         stats: BuildStats | None,
     ) -> None:
         """Process a single Codex JSONL event.
@@ -232,74 +403,161 @@ class CodexRunner(AgentRunner):
             - agent_message: response text
         - turn.completed: contains usage (input_tokens, cached_input_tokens, output_tokens)
         """
-        event_type = event.get("type")
-
-        if event_type == "item.started":
-            item = event.get("item", {})
-            if item.get("type") == "command_execution":
-                command = item.get("command", "")
-                if command:
-                    print(_format_codex_command(command))
-
-        elif event_type == "item.completed":
-            item = event.get("item", {})
-            item_type = item.get("type")
-
-            if item_type == "agent_message":
-                text = item.get("text", "")
-                if text.strip():
-                    print(f"💬 {text}")
-                    text_buffer.append(text)
-
-            elif item_type == "reasoning":
-                text = item.get("text", "")
-                if text.strip():
-                    print(f"🧠 {text}")
-
-            elif item_type == "command_execution":
-                # Track as tool call in stats
-                if stats:
-                    stats.add_tool_call("Bash")
-                exit_code = item.get("exit_code")
-                if exit_code is not None and exit_code != 0:
-                    print(f"   ⚠ exit code: {exit_code}")
-
-        elif event_type == "turn.completed":
-            # Extract token usage
-            usage = event.get("usage", {})
-            if stats and usage:
-                stats.add_usage({
-                    "input_tokens": usage.get("input_tokens", 0),
-                    "output_tokens": usage.get("output_tokens", 0),
-                    "cache_read_input_tokens": usage.get("cached_input_tokens", 0),
-                })
+        handler = _CODEX_EVENT_HANDLERS.get(event.get("type"))
+        if handler:
+            handler(event, emit, stats)
+
+
+# Codex event handlers, dispatched by event type and then by item.type.
+# Each takes (payload, emit, stats) where payload is the event or its item.
+
+def _on_codex_command_started(item: dict, emit, stats) -> None:
+    command = item.get("command", "")
+    if command:
+        print(_format_codex_command(command))
+
+
+def _on_codex_agent_message(item: dict, emit, stats) -> None:
+    text = item.get("text", "")
+    if text.strip():
+        print(f"💬 {text}")
+        emit(text)
+
+
+def _on_codex_reasoning(item: dict, emit, stats) -> None:
+    text = item.get("text", "")
+    if text.strip():
+        print(f"🧠 {text}")
+
+
+def _on_codex_command_completed(item: dict, emit, stats) -> None:
+    # Track as tool call in stats
+    if stats:
+        stats.add_tool_call("Bash")
+    exit_code = item.get("exit_code")
+    if exit_code is not None and exit_code != 0:
+        print(f"   ⚠ exit code: {exit_code}")
+
+
+_CODEX_ITEM_STARTED = {
+    "command_execution": _on_codex_command_started,
+}
+
+_CODEX_ITEM_COMPLETED = {
+    "agent_message": _on_codex_agent_message,
+    "reasoning": _on_codex_reasoning,
+    "command_execution": _on_codex_command_completed,
+}
+
+
+def _dispatch_codex_item(table: dict[str, Callable]) -> Callable:
+    """Build an event handler that routes on the event's item.type."""
+    def handle(event: dict, emit, stats) -> None:
+        item = event.get("item", {})
+        handler = table.get(item.get("type"))
+        if handler:
+            handler(item, emit, stats)
+    return handle
+
+
+def _on_codex_turn_completed(event: dict, emit, stats) -> None:
+    # Extract token usage
+    usage = event.get("usage", {})
+    if stats and usage:
+        stats.add_usage({
+            "input_tokens": usage.get("input_tokens", 0),
+            "output_tokens": usage.get("output_tokens", 0),
+            "cache_read_input_tokens": usage.get("cached_input_tokens", 0),
+        })
+
+
+_CODEX_EVENT_HANDLERS = {
+    "item.started": _dispatch_codex_item(_CODEX_ITEM_STARTED),
+    "item.completed": _dispatch_codex_item(_CODEX_ITEM_COMPLETED),
+    "turn.completed": _on_codex_turn_completed,
+}
 
 
 # ---------------------------------------------------------------------------
 # Factory
 # ---------------------------------------------------------------------------
 
-_AGENTS: dict[str, type[AgentRunner]] = {
-    "claude": ClaudeRunner,
-    "codex": CodexRunner,
+# Runners hold no per-call state, so one shared instance per backend
+_AGENTS: dict[str, AgentRunner] = {
+    "claude": ClaudeRunner(),
+    "codex": CodexRunner(),
 }
 
 
 def get_agent(name: str) -> AgentRunner:
-    """Create an agent runner by name.
+    """Get the agent runner for a backend name.
 
     Args:
         name: Agent identifier ("claude" or "codex")
 
     Returns:
-        Configured AgentRunner instance
+        Shared AgentRunner instance for that backend
 
     Raises:
         ValueError: If agent name is unknown
     """
-    cls = _AGENTS.get(name)
-    if cls is None:
+    try:
+        return _AGENTS[name]
+    except KeyError:
         raise ValueError(
             f"Unknown agent '{name}'. Available: {', '.join(_AGENTS)}"
-        )
-    return cls()
+        ) from None
+
+
+# ---------------------------------------------------------------------------
+# Concurrent iterations
+# ---------------------------------------------------------------------------
+
+async def gather_or_cancel(*aws: Awaitable[T]) -> list[T]:
+    """Like asyncio.gather, but cancel the rest as soon as one raises.
+
+    Plain gather leaves the others running after the first error, which
+    for agent invocations means processes still editing the working tree.
+    The others are awaited after cancelling, so their processes are gone
+    by the time the error propagates.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def run_iterations_parallel(
+    runner: AgentRunner,
+    prompts: list[str],
+    stats: BuildStats | None = None,
+    concurrency: int = 4,
+    timeout: int | None = None,
+    denied_tools: list[str] | None = None,
+) -> list[tuple[int, str, str]]:
+    """Run independent iterations concurrently, at most `concurrency` at once.
+
+    Only for prompts with no causal dependency on each other (e.g. parallel
+    research or review passes); the build loop itself stays sequential.
+    Sharing `stats` is safe because event handlers run synchronously on
+    the single event loop thread.
+    If one iteration raises, the rest are cancelled and their processes
+    killed before the error propagates.
+
+    Returns:
+        One (exit_code, full_text_output, error_output) tuple per prompt,
+        in the same order as `prompts`.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(prompt: str) -> tuple[int, str, str]:
+        async with semaphore:
+            return await runner.run_iteration_async(
+                prompt, timeout=timeout, stats=stats, denied_tools=denied_tools
+            )
+
+    return await gather_or_cancel(*(run_one(p) for p in prompts))
@@ -0,0 +1,16 @@
+"""
+Console banners shared by the CLI, build loop and pipeline executor.
+
+A banner is a few lines framed by horizontal rules, printed with a single
+write so output from concurrent stages can't interleave inside it.
+"""
+
+# Horizontal rule framing the cycle and status banners. Named for reuse,
+# not speed: the compiler already folds "=" * 60 and the literal parts of
+# f-strings into constants, so banner text stays inline at call sites.
+HR = "=" * 60
+
+
+def print_banner(*lines: str, file=None) -> None:
+    """Print lines framed by horizontal rules with a single write."""
+    print(f"\n{HR}\n" + "\n".join(lines) + f"\n{HR}\n", file=file)
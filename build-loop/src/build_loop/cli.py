@@ -6,16 +6,17 @@ the core build loop logic.
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import stat
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
-from .loop import run_build_loop
+from .banner import print_banner
 from .notify import notify_build_complete, notify_plan_complete, notify_ship_complete
-from .prompt import reset_progress_file
 
 # Session file location
 SESSION_FILE = ".spectre/build-session.json"
@@ -24,10 +25,19 @@ STATS_FILE = ".spectre/build-stats.json"
 # Maximum validation cycles before forcing exit (prevent infinite loops)
 MAX_VALIDATION_CYCLES = 5
 
+# Accepted answers for the interactive prompts
+_AGENT_CHOICES = frozenset({"claude", "codex"})
+_MODE_CHOICES = frozenset({"build", "plan", "ship"})
 
-def get_session_path() -> Path:
-    """Get absolute path to session file in current working directory."""
-    return Path.cwd() / SESSION_FILE
+
+def _is_yes(response: str) -> bool:
+    """Whether a y/n answer is affirmative (starts with y or Y)."""
+    return response.lstrip()[:1] in ("y", "Y")
+
+
+def get_session_path(cwd: Path | None = None) -> Path:
+    """Get absolute path to session file in cwd (default: current directory)."""
+    return (cwd or Path.cwd()) / SESSION_FILE
 
 
 def derive_scope_slug(context_files: list[str]) -> str:
@@ -73,7 +83,10 @@ def save_session(
 
     Creates .spectre directory if it doesn't exist.
     """
-    session_path = get_session_path()
+    from datetime import datetime, timezone
+
+    cwd = Path.cwd()
+    session_path = get_session_path(cwd)
     session_path.parent.mkdir(parents=True, exist_ok=True)
 
     session = {
@@ -93,25 +106,38 @@ def save_session(
         "ship": ship,
         "ship_context": ship_context,
         "started_at": datetime.now(timezone.utc).isoformat(),
-        "cwd": str(Path.cwd()),
+        "cwd": str(cwd),
     }
 
-    session_path.write_text(json.dumps(session, indent=2))
+    try:
+        # Optional C encoder ("fast" extra); imported here, not at module
+        # top, so it stays off the CLI startup path.
+        import orjson
+    except ImportError:
+        session_path.write_bytes(json.dumps(session, indent=2).encode())
+    else:
+        session_path.write_bytes(orjson.dumps(session, option=orjson.OPT_INDENT_2))
 
 
-def load_session() -> dict | None:
+def load_session(cwd: Path | None = None) -> dict | None:
     """
     Load saved session from disk.
 
     Returns None if no session file exists or if it's invalid.
     """
-    session_path = get_session_path()
+    session_path = get_session_path(cwd)
 
     if not session_path.exists():
         return None
 
     try:
-        return json.loads(session_path.read_text())
+        from orjson import loads
+    except ImportError:
+        loads = json.loads
+
+    try:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return loads(session_path.read_bytes())
     except (json.JSONDecodeError, OSError):
         return None
 
@@ -131,7 +157,7 @@ def save_stats(stats) -> None:
     stats_path = get_stats_path()
     stats_path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        stats_path.write_text(json.dumps(stats.to_dict(), indent=2))
+        stats_path.write_bytes(json.dumps(stats.to_dict(), indent=2).encode())
     except OSError:
         pass  # Non-fatal — stats are best-effort
 
@@ -147,7 +173,7 @@ def load_stats():
     if not stats_path.exists():
         return None
     try:
-        data = json.loads(stats_path.read_text())
+        data = json.loads(stats_path.read_bytes())
         return BuildStats.from_dict(data)
     except (json.JSONDecodeError, OSError, TypeError):
         return None
@@ -163,61 +189,61 @@ def clear_stats() -> None:
             pass
 
 
+# Optional trailing summary rows: (session key, label), shown when set
+_SUMMARY_OPTIONAL_FIELDS = (
+    ("manifest_path", "Manifest:"),
+    ("pipeline_path", "Pipeline:"),
+    ("plan_output_dir", "Output:"),
+    ("plan_clarifications_path", "Clarif:"),
+    ("started_at", "Last run:"),
+)
+
+
 def format_session_summary(session: dict) -> str:
     """Format session details for confirmation prompt."""
+    get = session.get
     lines = [
-        f"  Agent:      {session.get('agent', 'claude')}",
+        f"  Agent:      {get('agent', 'claude')}",
     ]
 
-    if session.get("ship"):
+    if get("ship"):
         lines.append("  Mode:       Ship")
-        ship_ctx = session.get("ship_context") or {}
-        if ship_ctx.get("parent_branch"):
-            lines.append(f"  Parent:     {ship_ctx['parent_branch']}")
-    elif session.get("plan"):
+        parent_branch = (get("ship_context") or {}).get("parent_branch")
+        if parent_branch:
+            lines.append(f"  Parent:     {parent_branch}")
+    elif get("plan"):
         lines.append("  Mode:       Planning")
-        if session.get("plan_scope_name"):
-            lines.append(f"  Scope:      {session['plan_scope_name']}")
+        scope_name = get("plan_scope_name")
+        if scope_name:
+            lines.append(f"  Scope:      {scope_name}")
     else:
         lines.append(f"  Tasks:      {session['tasks_file']}")
 
-    if session.get("context_files"):
-        for i, ctx in enumerate(session["context_files"]):
-            prefix = "  Context:   " if i == 0 else "             "
-            lines.append(f"{prefix} {ctx}")
+    context_files = get("context_files")
+    if context_files:
+        lines.append(f"  Context:    {context_files[0]}")
+        lines.extend(f"              {ctx}" for ctx in context_files[1:])
     else:
         lines.append("  Context:    (none)")
 
     lines.append(f"  Max iter:   {session['max_iterations']}")
 
-    if session.get("validate"):
+    if get("validate"):
         lines.append("  Validate:   yes")
 
-    if session.get("manifest_path"):
-        lines.append(f"  Manifest:   {session['manifest_path']}")
-
-    if session.get("pipeline_path"):
-        lines.append(f"  Pipeline:   {session['pipeline_path']}")
-
-    if session.get("plan_output_dir"):
-        lines.append(f"  Output:     {session['plan_output_dir']}")
-
-    if session.get("plan_clarifications_path"):
-        lines.append(f"  Clarif:     {session['plan_clarifications_path']}")
-
-    if session.get("started_at"):
-        lines.append(f"  Last run:   {session['started_at']}")
+    for key, label in _SUMMARY_OPTIONAL_FIELDS:
+        value = get(key)
+        if value:
+            lines.append(f"  {label:<11} {value}")
 
     return "\n".join(lines)
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
-    parser = argparse.ArgumentParser(
-        prog="spectre-build",
-        description="Execute an agent in a loop, completing one parent task per iteration.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Help epilog. argparse only stores this reference at construction and
+# formats it in format_help(), so non-help runs pay nothing for it.
+# Passing it unconditionally also keeps abbreviated or combined help
+# flags ("--he", "-yh") showing the examples.
+_EPILOG = """
 Examples:
   # Interactive mode (prompts for inputs)
   spectre-build
@@ -242,116 +268,186 @@ Examples:
 
   # Start the web GUI
   spectre-build serve
-""",
-    )
+"""
+
+# Subcommands that get a trimmed parser (see _sniff_subcommand)
+SUBCOMMANDS = ("resume", "serve")
 
-    # Positional argument for manifest file or command
-    parser.add_argument(
-        "manifest_or_command",
+# Sniffed modes for a leading .md manifest path or pipeline YAML path,
+# which get the same treatment as the subcommands above
+_MANIFEST_MODE = "manifest"
+_PIPELINE_MODE = "pipeline"
+_PIPELINE_SUFFIXES = (".yaml", ".yml")
+
+# Flags run_manifest reads; resume needs them too when a resumed plan
+# chains into a build
+_MANIFEST_FLAGS = frozenset({"resume", _MANIFEST_MODE})
+
+# Flags a build from a pipeline YAML reads
+_PIPELINE_FLAGS = _MANIFEST_FLAGS | {_PIPELINE_MODE}
+
+# CLI arguments in help order: (flags, add_argument kwargs, modes that
+# also need them). The full parser adds every entry; a sniffed mode
+# only adds the entries tagged with it.
+_ARGUMENTS: list[tuple[tuple[str, ...], dict, frozenset[str]]] = [
+    (("manifest_or_command",), dict(
         nargs="?",
         help="Build manifest (.md file), 'resume', or 'serve' command",
-    )
-
-    parser.add_argument(
-        "--tasks",
+    ), frozenset({*SUBCOMMANDS, _MANIFEST_MODE, _PIPELINE_MODE})),
+    (("--tasks",), dict(
         type=str,
         help="Path to tasks.md file",
-    )
-
-    parser.add_argument(
-        "--context",
+    ), frozenset({_PIPELINE_MODE})),
+    (("--context",), dict(
         type=str,
         nargs="*",
         default=[],
         help="Additional context file paths (optional, can specify multiple)",
-    )
-
-    parser.add_argument(
-        "--max-iterations",
+    ), frozenset({_PIPELINE_MODE})),
+    (("--max-iterations",), dict(
         type=int,
         default=10,
         help="Maximum number of iterations (default: 10)",
-    )
-
-    parser.add_argument(
-        "--notify",
+    ), _PIPELINE_FLAGS),
+    (("--notify",), dict(
         action="store_true",
         default=True,
         help="Send macOS notification on completion (default: enabled)",
-    )
-
-    parser.add_argument(
-        "--no-notify",
+    ), _PIPELINE_FLAGS),
+    (("--no-notify",), dict(
         action="store_true",
         help="Disable completion notifications",
-    )
-
-    parser.add_argument(
-        "--agent",
+    ), _PIPELINE_FLAGS),
+    (("--agent",), dict(
         type=str,
         choices=["claude", "codex"],
         default="claude",
         help="Coding agent to run (default: claude)",
-    )
-
-    parser.add_argument(
-        "--validate",
+    ), _PIPELINE_FLAGS),
+    (("--validate",), dict(
         action="store_true",
         help="Run post-build validation after successful build",
-    )
-
-    parser.add_argument(
-        "--plan",
+    ), _PIPELINE_FLAGS),
+    (("--plan",), dict(
         action="store_true",
         help="Run planning pipeline: scope docs → build-ready manifest",
-    )
-
-    parser.add_argument(
-        "--scope-name",
+    ), frozenset()),
+    (("--scope-name",), dict(
         dest="scope_name",
         help="Name for this planning scope (default: derived from context file). "
              "Creates isolated output directory: docs/tasks/{branch}/{scope_name}/",
-    )
-
-    parser.add_argument(
-        "--build",
+    ), frozenset()),
+    (("--build",), dict(
         action="store_true",
         help="Auto-start build after planning completes (use with --plan)",
-    )
-
-    parser.add_argument(
-        "--ship",
+    ), frozenset()),
+    (("--ship",), dict(
         action="store_true",
         help="Run ship pipeline: clean → test → rebase to land feature branch",
-    )
-
-    parser.add_argument(
-        "--pipeline",
+    ), frozenset()),
+    (("--pipeline",), dict(
         type=str,
         help="Path to pipeline YAML definition file",
-    )
-
-    parser.add_argument(
-        "--port",
+    ), frozenset()),
+    (("--port",), dict(
         type=int,
         default=8000,
         help="Port for web server (serve mode only, default: 8000)",
-    )
-
-    parser.add_argument(
-        "--host",
+    ), frozenset({"serve"})),
+    (("--host",), dict(
         type=str,
         default="127.0.0.1",
         help="Host for web server (serve mode only, default: 127.0.0.1)",
-    )
-
-    parser.add_argument(
-        "-y", "--yes",
+    ), frozenset({"serve"})),
+    (("-y", "--yes"), dict(
         action="store_true",
         help="Skip confirmation prompt (for resume)",
+    ), frozenset({"resume"})),
+]
+
+
+def _build_parser(subcommand: str | None = None) -> argparse.ArgumentParser:
+    """Build the argument parser, trimmed to one subcommand if given.
+
+    A trimmed parser has no help flag, doesn't match abbreviated flags
+    and raises ArgumentError instead of exiting, so parse_args can hand
+    anything it doesn't handle (including help in any spelling) to the
+    full parser. Abbreviations are only resolved against the full flag
+    set, so one that is ambiguous there is never accepted because a
+    trimmed parser happens to hold fewer flags.
+    """
+    trimmed = subcommand is not None
+    parser = argparse.ArgumentParser(
+        prog="spectre-build",
+        description="Execute an agent in a loop, completing one parent task per iteration.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
+        add_help=not trimmed,
+        allow_abbrev=not trimmed,
+        exit_on_error=not trimmed,
     )
+    for flags, kwargs, subcommands in _ARGUMENTS:
+        if subcommand is None or subcommand in subcommands:
+            parser.add_argument(*flags, **kwargs)
+    if subcommand == _PIPELINE_MODE:
+        # main() checks these before reaching the pipeline branch
+        parser.set_defaults(plan=False, ship=False)
+    return parser
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the mode to parse argv with, or None for the full parser.
+
+    A leading 'resume' or 'serve' selects that subcommand, a leading
+    .md path selects manifest mode and a leading .yaml/.yml path selects
+    pipeline mode. Only the first token counts, so a flag value that
+    happens to match is never mistaken for the mode. Help requests
+    always get the full parser.
+    """
+    if not argv or "-h" in argv or "--help" in argv:
+        return None
+    first = argv[0]
+    if first in SUBCOMMANDS:
+        return first
+    if first.startswith("-"):
+        return None
+    if first.endswith(".md"):
+        return _MANIFEST_MODE
+    if first.endswith(_PIPELINE_SUFFIXES):
+        return _PIPELINE_MODE
+    return None
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    `resume`, `serve`, manifest and pipeline YAML runs are parsed with a
+    parser holding only their own flags. If that parser sees anything it
+    doesn't know or can't parse, including a help flag, the full parser
+    takes over so behaviour (and error messages) match the general case.
+    A positional pipeline YAML is moved to `args.pipeline`, as if given
+    with --pipeline.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
 
-    return parser.parse_args()
+    args = None
+    subcommand = _sniff_subcommand(argv)
+    if subcommand is not None:
+        try:
+            args, extras = _build_parser(subcommand).parse_known_args(argv)
+        except argparse.ArgumentError:
+            args = None
+        else:
+            if extras:
+                args = None
+    if args is None:
+        args = _build_parser().parse_args(argv)
+
+    positional = args.manifest_or_command
+    if positional and positional.endswith(_PIPELINE_SUFFIXES):
+        args.pipeline, args.manifest_or_command = positional, None
+    return args
 
 
 def normalize_path(path: str) -> str:
@@ -367,15 +463,50 @@ def normalize_path(path: str) -> str:
     Returns:
         Path with @ prefix removed (if present)
     """
-    if path.startswith("@"):
-        return path[1:]
-    return path
+    return path.removeprefix("@")
+
+
+@functools.lru_cache(maxsize=64)
+def _real_dir(directory: str) -> str:
+    """Resolve symlinks in an absolute directory path (cached)."""
+    return os.path.realpath(directory)
+
+
+def _resolve_paths(paths: list[str]) -> list[str]:
+    """
+    Resolve paths to absolute, symlink-free strings, dropping duplicates.
+
+    Equivalent to ``str(Path(p).resolve())`` for each path, but files
+    sharing a directory share one cached directory lookup, so each file
+    costs a single lstat. Paths containing ``..`` fall back to a full
+    resolve, since ``..`` after a symlink cannot be collapsed lexically.
+    Duplicates are dropped by resolved path for the same reason.
+
+    Args:
+        paths: File paths, relative or absolute
+
+    Returns:
+        Resolved paths in input order, first occurrence kept
+    """
+    resolved = []
+    seen = set()
+    for path in paths:
+        absolute = os.path.abspath(path)
+        if ".." in path.split(os.sep) or os.path.islink(absolute):
+            real = str(Path(path).resolve())
+        else:
+            directory, name = os.path.split(absolute)
+            real = os.path.join(_real_dir(directory), name)
+        if real not in seen:
+            seen.add(real)
+            resolved.append(real)
+    return resolved
 
 
 def prompt_for_tasks_file() -> str:
     """Interactively prompt for tasks file path."""
     while True:
-        tasks_path = input("Tasks file path: ").strip()
+        tasks_path = normalize_path(input("Tasks file path: ").strip())
         if tasks_path:
             return tasks_path
         print("Tasks file path is required.")
@@ -390,51 +521,48 @@ def prompt_for_context_files() -> list[str]:
         return []
 
     # Split by comma and clean up each path
-    paths = [p.strip() for p in response.split(",")]
+    paths = [normalize_path(p.strip()) for p in response.split(",")]
     return [p for p in paths if p]  # Filter empty strings
 
 
 def prompt_for_agent() -> str:
     """Interactively prompt for agent selection with default."""
-    default = "claude"
-    print(f"Agent [claude/codex] ({default}): ", end="")
+    print("Agent [claude/codex] (claude): ", end="")
     response = input().strip().lower()
 
     if not response:
-        return default
+        return "claude"
 
-    if response in ("claude", "codex"):
+    if response in _AGENT_CHOICES:
         return response
 
-    print(f"Invalid choice. Using default: {default}")
-    return default
+    print("Invalid choice. Using default: claude")
+    return "claude"
 
 
 def prompt_for_max_iterations() -> int:
     """Interactively prompt for max iterations with default."""
-    default = 10
-    print(f"Max iterations [{default}]: ", end="")
+    print("Max iterations [10]: ", end="")
     response = input().strip()
 
     if not response:
-        return default
+        return 10
 
     try:
         value = int(response)
         if value > 0:
             return value
-        print(f"Must be positive. Using default: {default}")
-        return default
+        print("Must be positive. Using default: 10")
+        return 10
     except ValueError:
-        print(f"Invalid number. Using default: {default}")
-        return default
+        print("Invalid number. Using default: 10")
+        return 10
 
 
 def prompt_for_validate() -> bool:
     """Interactively prompt for validation after build."""
     print("Run validation after build? [y/N]: ", end="")
-    response = input().strip().lower()
-    return response in ("y", "yes")
+    return _is_yes(input())
 
 
 def prompt_for_mode() -> str:
@@ -445,7 +573,7 @@ def prompt_for_mode() -> str:
     if not response:
         return "build"
 
-    if response in ("build", "plan", "ship"):
+    if response in _MODE_CHOICES:
         return response
 
     print("Invalid choice. Using default: build")
@@ -460,7 +588,7 @@ def prompt_for_plan_context() -> list[str]:
     if not response:
         return []
 
-    paths = [p.strip() for p in response.split(",")]
+    paths = [normalize_path(p.strip()) for p in response.split(",")]
     return [p for p in paths if p]
 
 
@@ -484,6 +612,25 @@ def prompt_for_scope_name(context_files: list[str]) -> str:
     return slug or default
 
 
+def _check_input_file(path: str, label: str) -> str | None:
+    """Return an error message if path isn't a readable regular file.
+
+    One stat() answers both "exists" and "is a file"; access() is only
+    reached for regular files.
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return f"{label} file not found: {path}"
+    except OSError as e:
+        return f"Cannot stat {label.lower()} file: {path} ({e.strerror})"
+    if not stat.S_ISREG(st.st_mode):
+        return f"{label} path is not a file: {path}"
+    if not os.access(path, os.R_OK):
+        return f"{label} file is not readable: {path}"
+    return None
+
+
 def validate_inputs(
     tasks_file: str, context_files: list[str], max_iterations: int
 ) -> bool:
@@ -494,24 +641,11 @@ def validate_inputs(
     """
     errors = []
 
-    # Check tasks file exists and is readable
-    tasks_path = Path(tasks_file)
-    if not tasks_path.exists():
-        errors.append(f"Tasks file not found: {tasks_file}")
-    elif not tasks_path.is_file():
-        errors.append(f"Tasks path is not a file: {tasks_file}")
-    elif not os.access(tasks_path, os.R_OK):
-        errors.append(f"Tasks file is not readable: {tasks_file}")
-
-    # Check context files exist if provided
-    for ctx_file in context_files:
-        ctx_path = Path(ctx_file)
-        if not ctx_path.exists():
-            errors.append(f"Context file not found: {ctx_file}")
-        elif not ctx_path.is_file():
-            errors.append(f"Context path is not a file: {ctx_file}")
-        elif not os.access(ctx_path, os.R_OK):
-            errors.append(f"Context file is not readable: {ctx_file}")
+    # Check tasks file and any context files exist and are readable
+    for path, label in [(tasks_file, "Tasks"), *((f, "Context") for f in context_files)]:
+        error = _check_input_file(path, label)
+        if error:
+            errors.append(error)
 
     # Check max-iterations is positive
     if max_iterations <= 0:
@@ -527,6 +661,14 @@ def validate_inputs(
     return True
 
 
+def _format_context_list(context_files: list[str]) -> str:
+    """Format context paths as a markdown bullet list, or "None" if empty."""
+    if not context_files:
+        return "None"
+    # join() turns a generator into a list before sizing the result anyway
+    return "\n".join([f"- `{f}`" for f in context_files])
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable form."""
     if seconds < 60:
@@ -569,6 +711,7 @@ def run_build_validate_cycle(
     Returns:
         Tuple of (exit_code, total_iterations_completed)
     """
+    from .loop import run_build_loop
     from .stats import BuildStats
     from .validate import run_validation
 
@@ -589,10 +732,10 @@ def run_build_validate_cycle(
 
         # Print cycle header if validating
         if validate and cycle > 1:
-            print(f"\n{'='*60}")
-            print(f"🔄 BUILD CYCLE {cycle} (Gap Remediation)")
-            print(f"   Tasks: {current_tasks_file}")
-            print(f"{'='*60}\n")
+            print_banner(
+                f"🔄 BUILD CYCLE {cycle} (Gap Remediation)",
+                f"   Tasks: {current_tasks_file}",
+            )
 
         # Run build loop — pass shared stats so tokens/tools accumulate
         exit_code, iterations = run_build_loop(
@@ -627,30 +770,30 @@ def run_build_validate_cycle(
 
         # If no gaps found, validation complete
         if gaps_file is None:
-            print(f"\n{'='*60}")
-            print(f"✅ FEATURE COMPLETE after {cycle} build cycle(s)")
-            print(f"   Total iterations: {total_iterations}")
-            print(f"{'='*60}\n")
+            print_banner(
+                f"✅ FEATURE COMPLETE after {cycle} build cycle(s)",
+                f"   Total iterations: {total_iterations}",
+            )
             clear_stats()
             stats.print_summary()
             return 0, total_iterations
 
         # Gaps found - check cycle limit
         if cycle >= MAX_VALIDATION_CYCLES:
-            print(f"\n{'='*60}")
-            print(f"⚠️ MAX VALIDATION CYCLES ({MAX_VALIDATION_CYCLES}) REACHED")
-            print(f"   Remaining gaps: {gaps_file}")
-            print("   Review and run manually if needed")
-            print(f"{'='*60}\n")
+            print_banner(
+                f"⚠️ MAX VALIDATION CYCLES ({MAX_VALIDATION_CYCLES}) REACHED",
+                f"   Remaining gaps: {gaps_file}",
+                "   Review and run manually if needed",
+            )
             stats.print_summary()
             return 0, total_iterations  # Exit gracefully, not an error
 
         # Set up next cycle with gaps file as tasks
         current_tasks_file = gaps_file
-        print(f"\n{'='*60}")
-        print(f"📋 STARTING REMEDIATION CYCLE {cycle + 1}")
-        print(f"   Gaps to address: {gaps_file}")
-        print(f"{'='*60}\n")
+        print_banner(
+            f"📋 STARTING REMEDIATION CYCLE {cycle + 1}",
+            f"   Gaps to address: {gaps_file}",
+        )
 
 
 def run_pipeline(
@@ -673,6 +816,7 @@ def run_pipeline(
     from .agent import get_agent
     from .pipeline import load_pipeline
     from .pipeline.executor import PipelineExecutor, PipelineStatus
+    from .prompt import reset_progress_file
     from .stats import BuildStats
 
     # Load pipeline config
@@ -683,10 +827,7 @@ def run_pipeline(
         return 1, 0
 
     # Build context for prompt substitution
-    if context_files:
-        context_str = "\n".join(f"- `{f}`" for f in context_files)
-    else:
-        context_str = "None"
+    context_str = _format_context_list(context_files)
 
     progress_file = str(Path(tasks_file).parent / "build_progress.md")
     reset_progress_file(progress_file)
@@ -758,6 +899,7 @@ def run_default_pipeline(
     from .hooks import after_stage_hook, before_stage_hook
     from .pipeline.executor import PipelineExecutor, PipelineStatus, StageCompletedEvent
     from .pipeline.loader import create_default_pipeline
+    from .prompt import reset_progress_file
     from .stats import BuildStats
 
     # Create pipeline config
@@ -768,19 +910,17 @@ def run_default_pipeline(
     )
 
     # Build context for prompt substitution
-    if context_files:
-        context_str = "\n".join(f"- `{f}`" for f in context_files)
-    else:
-        context_str = "None"
+    context_str = _format_context_list(context_files)
 
-    progress_file = str(Path(tasks_file).parent / "build_progress.md")
+    tasks_dir = Path(tasks_file).parent
+    progress_file = str(tasks_dir / "build_progress.md")
     reset_progress_file(progress_file)
 
     context = {
         "tasks_file_path": tasks_file,
         "progress_file_path": progress_file,
         "additional_context_paths_or_none": context_str,
-        "review_fixes_path": str(Path(tasks_file).parent / "review_fixes.md"),
+        "review_fixes_path": str(tasks_dir / "review_fixes.md"),
         "changed_files": "No files changed (first run)",
         "commit_messages": "No commits (first run)",
         "phase_completed": "all",
@@ -873,8 +1013,6 @@ def run_plan_pipeline(
     Returns:
         Tuple of (exit_code, total_iterations_completed, manifest_path)
     """
-    import subprocess as _subprocess
-
     from .agent import get_agent
     from .hooks import plan_after_stage, plan_before_stage
     from .notify import notify
@@ -890,6 +1028,8 @@ def run_plan_pipeline(
 
     # Determine output directory: docs/tasks/{branch}/{scope_name}/
     if not output_dir:
+        import subprocess as _subprocess
+
         try:
             branch = _subprocess.check_output(
                 ["git", "rev-parse", "--abbrev-ref", "HEAD"],
@@ -920,10 +1060,7 @@ def run_plan_pipeline(
         config = create_plan_pipeline()
 
     # Build context for prompt substitution
-    if context_files:
-        context_str = "\n".join(f"- `{f}`" for f in context_files)
-    else:
-        context_str = "None"
+    context_str = _format_context_list(context_files)
 
     context = resume_context or {
         "context_files": context_str,
@@ -968,9 +1105,10 @@ def run_plan_pipeline(
     state = executor.run(stats)
 
     # Check if pipeline ended with CLARIFICATIONS_NEEDED
+    # (stage_history entries are (stage_name, signal) pairs)
     last_signal = None
     if state.stage_history:
-        last_signal = state.stage_history[-1][1]
+        _, last_signal = state.stage_history[-1]
 
     if last_signal == "CLARIFICATIONS_NEEDED":
         clarif_path = state.global_artifacts.get(
@@ -983,11 +1121,11 @@ def run_plan_pipeline(
         # don't propagate to the original context passed from this function.
         context["clarifications_path"] = clarif_path
 
-        print(f"\n{'='*60}")
-        print("📋 CLARIFICATIONS NEEDED")
-        print(f"   Edit: {clarif_path}")
-        print("   Then: spectre-build resume")
-        print(f"{'='*60}\n")
+        print_banner(
+            "📋 CLARIFICATIONS NEEDED",
+            f"   Edit: {clarif_path}",
+            "   Then: spectre-build resume",
+        )
 
         notify(
             message="Clarifications needed — edit the file and resume",
@@ -1021,11 +1159,11 @@ def run_plan_pipeline(
             manifest_path = candidate
 
     if manifest_path:
-        print(f"\n{'='*60}")
-        print("✅ PLANNING COMPLETE")
-        print(f"   Manifest: {manifest_path}")
-        print(f"   Run: spectre-build {manifest_path}")
-        print(f"{'='*60}\n")
+        print_banner(
+            "✅ PLANNING COMPLETE",
+            f"   Manifest: {manifest_path}",
+            f"   Run: spectre-build {manifest_path}",
+        )
 
     if state.status == PipelineStatus.COMPLETED:
         clear_stats()
@@ -1085,10 +1223,7 @@ def run_ship_pipeline(
         working_set_scope = f"{parent_branch}..HEAD"
 
         # Build context for prompt substitution
-        if context_files:
-            context_str = "\n".join(f"- `{f}`" for f in context_files)
-        else:
-            context_str = "None"
+        context_str = _format_context_list(context_files)
 
         context = {
             "parent_branch": parent_branch,
@@ -1178,13 +1313,12 @@ def _detect_parent_branch() -> str | None:
 
 def run_resume(args: argparse.Namespace) -> None:
     """Handle the 'resume' subcommand."""
-    import time
-
-    session = load_session()
+    cwd = Path.cwd()
+    session = load_session(cwd)
 
     if not session:
         print("No previous session found.", file=sys.stderr)
-        print(f"Session file: {get_session_path()}", file=sys.stderr)
+        print(f"Session file: {get_session_path(cwd)}", file=sys.stderr)
         print("\nStart a new build with:", file=sys.stderr)
         print("  spectre build --tasks docs/tasks.md --context docs/scope.md", file=sys.stderr)
         sys.exit(1)
@@ -1195,8 +1329,8 @@ def run_resume(args: argparse.Namespace) -> None:
     print("----------------------------\n")
 
     if not args.yes:
-        response = input("Resume this session? [Y/n] ").strip().lower()
-        if response and response not in ("y", "yes"):
+        response = input("Resume this session? [Y/n] ").lstrip()
+        if response and not _is_yes(response):
             print("Cancelled.")
             sys.exit(0)
 
@@ -1207,10 +1341,10 @@ def run_resume(args: argparse.Namespace) -> None:
 
     # Determine notification setting
     send_notification = args.notify and not args.no_notify
-    project_name = Path.cwd().name
+    project_name = cwd.name
 
     # Track build duration
-    start_time = time.time()
+    start_time = time.monotonic()
 
     # Handle planning session resume
     if session.get("plan"):
@@ -1220,7 +1354,10 @@ def run_resume(args: argparse.Namespace) -> None:
         if resume_ctx is not None and session.get("plan_clarifications_path"):
             resume_ctx["clarifications_path"] = session["plan_clarifications_path"]
 
-        # Update session timestamp for planning
+        # Update session timestamp for planning. This is the only write on
+        # success and it persists the clarifications_path fix above;
+        # run_plan_pipeline writes again only when it pauses for
+        # clarifications, with a context that has moved on.
         save_session(
             tasks_file="",
             context_files=context_files,
@@ -1295,7 +1432,7 @@ def run_resume(args: argparse.Namespace) -> None:
             )
 
     # Calculate duration
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     duration_str = format_duration(duration)
 
     # Send notification if enabled
@@ -1327,8 +1464,6 @@ def run_resume(args: argparse.Namespace) -> None:
 
 def run_manifest(manifest_path: str, args: argparse.Namespace) -> None:
     """Run build from a manifest file."""
-    import time
-
     from .manifest import load_manifest
 
     try:
@@ -1357,7 +1492,7 @@ def run_manifest(manifest_path: str, args: argparse.Namespace) -> None:
     project_name = Path.cwd().name
 
     # Track build duration
-    start_time = time.time()
+    start_time = time.monotonic()
 
     # Route based on manifest mode
     if manifest.ship:
@@ -1371,7 +1506,7 @@ def run_manifest(manifest_path: str, args: argparse.Namespace) -> None:
             agent=agent,
         )
 
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         duration_str = format_duration(duration)
 
         if send_notification:
@@ -1403,7 +1538,7 @@ def run_manifest(manifest_path: str, args: argparse.Namespace) -> None:
         )
 
     # Calculate duration
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     duration_str = format_duration(duration)
 
     # Send notification if enabled
@@ -1441,8 +1576,6 @@ def run_serve(args: argparse.Namespace) -> None:
 
 def main() -> None:
     """Main entry point for Spectre Build CLI."""
-    import time
-
     args = parse_args()
 
     # Determine mode based on positional argument
@@ -1463,13 +1596,15 @@ def main() -> None:
         run_manifest(positional, args)
         return
 
-    # Handle pipeline YAML file as positional argument
-    if positional and (positional.endswith(".yaml") or positional.endswith(".yml")):
-        args.pipeline = positional
-        positional = None
+    # Normalize CLI paths once (strip @ prefix); the prompts below
+    # normalize what they read the same way
+    args.context = [normalize_path(f) for f in args.context]
+    if args.tasks:
+        args.tasks = normalize_path(args.tasks)
 
     # Determine notification setting (--no-notify overrides --notify)
     send_notification = args.notify and not args.no_notify
+    project_name = Path.cwd().name  # for notifications, whichever mode runs
 
     # Handle --plan mode
     if args.plan:
@@ -1477,13 +1612,11 @@ def main() -> None:
             print("Error: --plan requires --context with scope documents", file=sys.stderr)
             sys.exit(1)
 
-        context_files = [normalize_path(f) for f in args.context]
-        context_files = [str(Path(f).resolve()) for f in context_files]
+        context_files = _resolve_paths(args.context)
         scope_name = args.scope_name or derive_scope_slug(context_files)
         max_iterations = args.max_iterations
         agent = args.agent
-        project_name = Path.cwd().name
-        start_time = time.time()
+        start_time = time.monotonic()
 
         save_session("", context_files, max_iterations, agent=agent,
                      plan=True, plan_scope_name=scope_name,
@@ -1497,7 +1630,7 @@ def main() -> None:
             auto_build=args.build,
         )
 
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         duration_str = format_duration(duration)
 
         if send_notification:
@@ -1517,12 +1650,10 @@ def main() -> None:
 
     # Handle --ship mode
     if args.ship:
-        context_files = [normalize_path(f) for f in args.context] if args.context else []
-        context_files = [str(Path(f).resolve()) for f in context_files]
+        context_files = _resolve_paths(args.context)
         max_iterations = args.max_iterations
         agent = args.agent
-        project_name = Path.cwd().name
-        start_time = time.time()
+        start_time = time.monotonic()
 
         save_session("", context_files, max_iterations, agent=agent, ship=True)
 
@@ -1532,7 +1663,7 @@ def main() -> None:
             agent=agent,
         )
 
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         duration_str = format_duration(duration)
 
         if send_notification:
@@ -1553,17 +1684,16 @@ def main() -> None:
             if not context_files:
                 print("Error: Plan mode requires at least one context/scope file.", file=sys.stderr)
                 sys.exit(1)
-            context_files = [str(Path(normalize_path(f)).resolve()) for f in context_files]
+            context_files = _resolve_paths(context_files)
             scope_name = prompt_for_scope_name(context_files)
             max_iterations = prompt_for_max_iterations()
             agent = prompt_for_agent()
 
             # Ask upfront whether to auto-chain to build
             print("Auto-start build after planning? [y/N]: ", end="")
-            auto_build = input().strip().lower() in ("y", "yes")
+            auto_build = _is_yes(input())
 
-            project_name = Path.cwd().name
-            start_time = time.time()
+            start_time = time.monotonic()
 
             save_session("", context_files, max_iterations, agent=agent,
                          plan=True, plan_scope_name=scope_name,
@@ -1577,7 +1707,7 @@ def main() -> None:
                 auto_build=auto_build,
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             duration_str = format_duration(duration)
 
             if send_notification:
@@ -1596,11 +1726,9 @@ def main() -> None:
             sys.exit(exit_code)
 
         elif mode == "ship":
-            context_files = prompt_for_context_files()
-            context_files = [str(Path(normalize_path(f)).resolve()) for f in context_files]
+            context_files = _resolve_paths(prompt_for_context_files())
             max_iterations = prompt_for_max_iterations()
             agent = prompt_for_agent()
-            project_name = Path.cwd().name
 
             # Detect parent branch — fail fast on failure
             parent_branch = _detect_parent_branch()
@@ -1612,12 +1740,12 @@ def main() -> None:
             # Confirm parent branch with user
             print(f"Parent branch: {parent_branch}")
             print("Proceed with ship? [Y/n]: ", end="")
-            response = input().strip().lower()
-            if response and response not in ("y", "yes"):
+            response = input().lstrip()
+            if response and not _is_yes(response):
                 print("Cancelled.")
                 sys.exit(0)
 
-            start_time = time.time()
+            start_time = time.monotonic()
 
             save_session("", context_files, max_iterations, agent=agent, ship=True)
 
@@ -1627,7 +1755,7 @@ def main() -> None:
                 agent=agent,
             )
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             duration_str = format_duration(duration)
 
             if send_notification:
@@ -1659,16 +1787,12 @@ def main() -> None:
         # Interactive mode - prompt for confirmation/override
         max_iterations = prompt_for_max_iterations()
 
-    # Normalize paths (strip @ prefix if present)
-    tasks_file = normalize_path(tasks_file)
-    context_files = [normalize_path(f) for f in context_files]
-
     # Validate all inputs before proceeding
     validate_inputs(tasks_file, context_files, max_iterations)
 
     # Convert to absolute paths for consistency
-    tasks_file = str(Path(tasks_file).resolve())
-    context_files = [str(Path(f).resolve()) for f in context_files]
+    tasks_file = _resolve_paths([tasks_file])[0]
+    context_files = _resolve_paths(context_files)
 
     # Get agent choice - from args in flag mode, prompt in interactive mode
     if flag_mode:
@@ -1682,11 +1806,8 @@ def main() -> None:
     else:
         validate = prompt_for_validate()
 
-    # Get project name for notification
-    project_name = Path.cwd().name
-
     # Track build duration
-    start_time = time.time()
+    start_time = time.monotonic()
 
     # Check for pipeline mode
     if args.pipeline:
@@ -1715,7 +1836,7 @@ def main() -> None:
         )
 
     # Calculate duration
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     duration_str = format_duration(duration)
 
     # Send notification if enabled
@@ -6,7 +6,9 @@ so subprocesses can authenticate when running in sandbox mode.
 """
 
 import logging
+import os
 import shutil
+import stat
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -14,34 +16,88 @@ logger = logging.getLogger(__name__)
 # Directory for Codex credential sync (relative to workspace root)
 CODEX_SUBAGENT_DIR = ".spectre/codex-subagent"
 
+# Files below this size are copied with one read and one write
+_SMALL_FILE_BYTES = 64 * 1024
+
+# Refuse to follow a symlink at open time (not available on Windows)
+_O_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+
+def _copy_small_file(src: Path, dst: Path, st: os.stat_result) -> None:
+    """Copy a small regular file in one read/write, keeping mode and times.
+
+    Both ends are opened with O_NOFOLLOW, so a symlink swapped in after
+    the caller's lstat() makes the copy fail instead of being followed.
+    """
+    with open(os.open(src, os.O_RDONLY | _O_NOFOLLOW), "rb") as f:
+        data = f.read()
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_NOFOLLOW
+    with open(os.open(dst, flags, 0o600), "wb") as f:
+        f.write(data)
+
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _is_current_copy(dst: Path, src_st: os.stat_result) -> bool:
+    """Check whether dst is an earlier copy of an unchanged source.
+
+    Copies keep the source mtime, so a regular dst with the same size and
+    mtime is that copy. Any edit to either side changes the mtime and
+    forces a fresh copy; a symlinked dst never counts as current.
+    """
+    try:
+        dst_st = os.lstat(dst)
+    except OSError:
+        return False
+    return (
+        stat.S_ISREG(dst_st.st_mode)
+        and dst_st.st_size == src_st.st_size
+        and dst_st.st_mtime_ns == src_st.st_mtime_ns
+    )
+
 
 def _safe_copy_file(src: Path, dst: Path) -> bool:
     """Safely copy a file, rejecting symlinks to prevent symlink attacks."""
-    if src.is_symlink():
+    try:
+        st = os.lstat(src)
+    except OSError:
+        return False
+    if stat.S_ISLNK(st.st_mode):
         logger.debug("Skipping symlink: %s", src)
         return False
-    if not src.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return False
+    if _is_current_copy(dst, st):
+        return True
     try:
-        shutil.copy2(src, dst)
+        if st.st_size < _SMALL_FILE_BYTES:
+            _copy_small_file(src, dst, st)
+        else:
+            shutil.copy2(src, dst)
         return True
     except (OSError, shutil.Error) as e:
         logger.debug("Failed to copy %s: %s", src, e)
         return False
 
 
-def setup_codex_home() -> Path:
+def setup_codex_home(cwd: Path | None = None, home: Path | None = None) -> Path:
     """Sync Codex credentials to workspace for sandboxed execution.
 
     Copies config.toml and auth.json from ~/.codex to .spectre/codex-subagent/
     so child processes can authenticate while running in sandbox mode.
 
+    Args:
+        cwd: Workspace root (default: current directory)
+        home: User home directory (default: Path.home())
+
     Returns the absolute path to the workspace CODEX_HOME directory.
     """
-    workspace_home = Path.cwd() / CODEX_SUBAGENT_DIR
+    workspace_home = (cwd or Path.cwd()) / CODEX_SUBAGENT_DIR
     workspace_home.mkdir(parents=True, exist_ok=True)
 
-    user_codex_home = Path.home() / ".codex"
+    user_codex_home = (home or Path.home()) / ".codex"
 
     config_src = user_codex_home / "config.toml"
     if _safe_copy_file(config_src, workspace_home / "config.toml"):
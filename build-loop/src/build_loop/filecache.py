@@ -0,0 +1,53 @@
+"""
+Values derived from files, reused until the file changes.
+
+Templates, manifests and pipeline definitions are read again on every
+iteration or run. Keying on (mtime_ns, size) from a stat lets repeat
+reads cost one stat while an edited file is still picked up.
+"""
+
+import os
+import stat
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def stat_file(path: str | os.PathLike) -> os.stat_result | None:
+    """Return the stat of a regular file, or None if path isn't one."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        # Missing, unreadable, or not a valid path (e.g. inline text)
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+class FileCache(Generic[T]):
+    """One value per file path, valid while the file's mtime and size match.
+
+    A changed file replaces its path's entry rather than adding one, and
+    at most max_entries paths are kept, dropping the oldest first.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[int, int, T]] = {}
+
+    def get(self, path: str, st: os.stat_result) -> T | None:
+        """Return the value stored for path if the file is unchanged."""
+        entry = self._entries.get(path)
+        if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+            return entry[2]
+        return None
+
+    def set(self, path: str, st: os.stat_result, value: T) -> None:
+        """Store the value derived from path as it was when st was taken."""
+        self._entries.pop(path, None)
+        self._entries[path] = (st.st_mtime_ns, st.st_size, value)
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
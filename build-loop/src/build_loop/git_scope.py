@@ -7,12 +7,26 @@ changed file lists and commit messages for prompt injection.
 
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# git --name-status letters shown in changed-file lists
+_STATUS_LABELS = {
+    b"A": "added",
+    b"M": "modified",
+    b"D": "deleted",
+    b"R": "renamed",
+    b"C": "copied",
+}
 
-@dataclass
+# Prefix for every git call. Output is parsed, so never page it and never
+# color it, whatever the user's git config says.
+_GIT_CMD_PREFIX = ["git", "--no-pager", "-c", "color.ui=false"]
+
+
+@dataclass(slots=True)
 class GitDiff:
     """Represents a git diff between two commits.
 
@@ -28,24 +42,57 @@ class GitDiff:
     commit_messages: list[str] = field(default_factory=list)
 
 
-def _run_git(args: list[str]) -> str | None:
-    """Run a git command and return stdout, or None on failure."""
+def _run_git_bytes(args: list[str]) -> bytes | None:
+    """Run a git command and return raw stdout, or None on failure.
+
+    Output is left undecoded so callers only decode the fields they keep.
+    """
     try:
         result = subprocess.run(
-            ["git"] + args,
+            _GIT_CMD_PREFIX + args,
             capture_output=True,
-            text=True,
             timeout=30,
         )
         if result.returncode == 0:
             return result.stdout.strip()
-        logger.debug("git %s failed (exit %d): %s", " ".join(args), result.returncode, result.stderr.strip())
+        # Expected failures (e.g. no HEAD yet) are routine, so skip the
+        # join and stderr decode unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "git %s failed (exit %d): %s",
+                " ".join(args),
+                result.returncode,
+                result.stderr.decode("utf-8", "replace").strip(),
+            )
         return None
     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
         logger.debug("git command failed: %s", e)
         return None
 
 
+def _run_git(args: list[str]) -> str | None:
+    """Run a git command and return stdout as text, or None on failure."""
+    output = _run_git_bytes(args)
+    if output is None:
+        return None
+    return output.decode("utf-8", "surrogateescape")
+
+
+def _run_git_parallel(commands: list[list[str]]) -> list[bytes | None]:
+    """Run independent git commands concurrently.
+
+    Each command is a separate process, so running them side by side
+    costs roughly the slowest one instead of the sum.
+
+    Returns:
+        One _run_git_bytes result per command, in the order given.
+    """
+    if len(commands) == 1:
+        return [_run_git_bytes(commands[0])]
+    with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+        return list(pool.map(_run_git_bytes, commands))
+
+
 def snapshot_head() -> str | None:
     """Capture current HEAD SHA.
 
@@ -72,35 +119,51 @@ def collect_diff(start_commit: str) -> GitDiff | None:
     if not end_commit:
         return None
 
-    changed_files = []
-    commit_messages = []
+    head_moved = start_commit != end_commit
 
-    # Collect committed changes if HEAD moved
-    if start_commit != end_commit:
-        diff_output = _run_git(["diff", "--name-status", f"{start_commit}..HEAD"])
-        if diff_output:
-            changed_files.extend(_parse_name_status(diff_output))
+    # Fast path: HEAD unchanged and no tracked file modified or staged means
+    # there is nothing to diff. One status call replaces both diffs below
+    # (untracked files are excluded there too).
+    if not head_moved:
+        status_output = _run_git(["status", "--porcelain", "-z", "--untracked-files=no"])
+        if status_output == "":
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("No committed or uncommitted changes since %s", start_commit)
+            return GitDiff(start_commit=start_commit, end_commit=end_commit)
 
-        log_output = _run_git(["log", "--oneline", f"{start_commit}..HEAD"])
-        if log_output:
-            commit_messages = log_output.splitlines()
+    commit_messages = []
 
-    # Collect uncommitted changes (staged + working tree)
-    # This catches agents that write files without committing (e.g., Codex)
-    uncommitted_output = _run_git(["diff", "--name-status", "HEAD"])
-    staged_output = _run_git(["diff", "--name-status", "--cached"])
+    # Uncommitted changes (staged + working tree) catch agents that write
+    # files without committing (e.g., Codex). If HEAD moved, the committed
+    # range is queried too; all of these are independent, so run together.
+    commands = [
+        ["diff", "--name-status", "HEAD"],
+        ["diff", "--name-status", "--cached"],
+    ]
+    if head_moved:
+        commands += [
+            ["diff", "--name-status", f"{start_commit}..HEAD"],
+            ["log", "--oneline", f"{start_commit}..HEAD"],
+        ]
+    uncommitted_output, staged_output, *committed = _run_git_parallel(commands)
+
+    # Committed changes first, then uncommitted ones. Keyed by path so the
+    # first status seen for a file wins and order is preserved.
+    outputs = [uncommitted_output, staged_output]
+    if head_moved:
+        diff_output, log_output = committed
+        outputs.insert(0, diff_output)
+        if log_output:
+            commit_messages = log_output.decode("utf-8", "surrogateescape").splitlines()
 
-    # Merge uncommitted files, dedup against committed set
-    seen = {f.rsplit(" (", 1)[0] for f in changed_files}
-    for output in (uncommitted_output, staged_output):
+    labels: dict[str, str] = {}
+    for output in outputs:
         if output:
-            for entry in _parse_name_status(output):
-                filepath = entry.rsplit(" (", 1)[0]
-                if filepath not in seen:
-                    changed_files.append(entry)
-                    seen.add(filepath)
+            for filepath, label in _parse_name_status(output):
+                labels.setdefault(filepath, label)
+    changed_files = [_format_entry(fp, label) for fp, label in labels.items()]
 
-    if not changed_files and start_commit == end_commit:
+    if not changed_files and not head_moved and logger.isEnabledFor(logging.INFO):
         logger.info("No committed or uncommitted changes since %s", start_commit)
 
     return GitDiff(
@@ -111,18 +174,30 @@ def collect_diff(start_commit: str) -> GitDiff | None:
     )
 
 
-def _parse_name_status(output: str) -> list[str]:
-    """Parse git diff --name-status output into formatted file entries."""
+def _parse_name_status(output: bytes) -> list[tuple[str, str]]:
+    """Parse raw git diff --name-status output into (filepath, label) pairs.
+
+    Only the path and unknown status letters are decoded.
+    """
     files = []
-    for line in output.splitlines():
-        parts = line.split("\t", 1)
-        if len(parts) == 2:
-            status, filepath = parts
-            status_label = {"A": "added", "M": "modified", "D": "deleted"}.get(status, status)
-            files.append(f"{filepath} ({status_label})")
+    for line in output.split(b"\n"):
+        status, sep, filepath = line.partition(b"\t")
+        if not sep:
+            continue
+        if status[:1] in (b"R", b"C"):
+            # "R100<TAB>old<TAB>new": drop the similarity score, keep the new path
+            status = status[:1]
+            filepath = filepath.rpartition(b"\t")[2]
+        label = _STATUS_LABELS.get(status) or status.decode("ascii", "replace")
+        files.append((filepath.decode("utf-8", "surrogateescape"), label))
     return files
 
 
+def _format_entry(filepath: str, label: str) -> str:
+    """Format one changed file as shown in GitDiff.changed_files."""
+    return f"{filepath} ({label})"
+
+
 def format_file_list(diff: GitDiff) -> str:
     """Format changed files as a markdown list for prompt injection.
 
@@ -134,7 +209,7 @@ def format_file_list(diff: GitDiff) -> str:
     """
     if not diff.changed_files:
         return "No files changed"
-    return "\n".join(f"- `{f}`" for f in diff.changed_files)
+    return "\n".join([f"- `{f}`" for f in diff.changed_files])
 
 
 def format_commits(diff: GitDiff) -> str:
@@ -148,4 +223,4 @@ def format_commits(diff: GitDiff) -> str:
     """
     if not diff.commit_messages:
         return "No commits"
-    return "\n".join(f"- {msg}" for msg in diff.commit_messages)
+    return "\n".join(["- " + msg for msg in diff.commit_messages])
@@ -8,6 +8,7 @@ ship pipeline (HEAD snapshots, clean/test summary capture).
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,12 @@ from .pipeline.completion import CompletionResult
 
 logger = logging.getLogger(__name__)
 
+# Context key for HEAD as read by an after-hook's diff. No agent runs
+# between one stage's after-hook and the next stage's before-hook, so the
+# value is still HEAD there. Before-hooks pop it for every stage, so it
+# never outlives that gap.
+_HEAD_AFTER_STAGE = "_head_after_stage"
+
 
 def before_stage_hook(stage_name: str, context: dict[str, Any]) -> None:
     """Hook called before each stage runs.
@@ -26,8 +33,9 @@ def before_stage_hook(stage_name: str, context: dict[str, Any]) -> None:
         stage_name: Name of the stage about to run
         context: Mutable pipeline context dictionary
     """
+    known_head = context.pop(_HEAD_AFTER_STAGE, None)
     if stage_name == "build":
-        head = snapshot_head()
+        head = known_head or snapshot_head()
         if head:
             context["_phase_start_commit"] = head
             logger.info("Snapshotted HEAD at %s for build stage", head)
@@ -55,25 +63,33 @@ def after_stage_hook(
         start_commit = context.get("_phase_start_commit")
         if not start_commit:
             logger.warning("No _phase_start_commit found, skipping diff collection")
-            context["changed_files"] = "No files changed (no start commit captured)"
-            context["commit_messages"] = "No commits (no start commit captured)"
+            context.update({
+                "changed_files": "No files changed (no start commit captured)",
+                "commit_messages": "No commits (no start commit captured)",
+            })
             _set_review_fixes_path(context)
             return
 
         diff = collect_diff(start_commit)
         if diff:
-            context["changed_files"] = format_file_list(diff)
-            context["commit_messages"] = format_commits(diff)
-            logger.info(
-                "Collected diff: %d files changed, %d commits (%s..%s)",
-                len(diff.changed_files),
-                len(diff.commit_messages),
-                diff.start_commit,
-                diff.end_commit,
-            )
+            context.update({
+                _HEAD_AFTER_STAGE: diff.end_commit,
+                "changed_files": format_file_list(diff),
+                "commit_messages": format_commits(diff),
+            })
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Collected diff: %d files changed, %d commits (%s..%s)",
+                    len(diff.changed_files),
+                    len(diff.commit_messages),
+                    diff.start_commit,
+                    diff.end_commit,
+                )
         else:
-            context["changed_files"] = "No files changed"
-            context["commit_messages"] = "No commits"
+            context.update({
+                "changed_files": "No files changed",
+                "commit_messages": "No commits",
+            })
             logger.warning("Failed to collect diff from %s", start_commit)
 
         _set_review_fixes_path(context)
@@ -94,18 +110,31 @@ def after_stage_hook(
 
             # Track which phases have been validated
             phase = context.get("phase_completed", "")
-            validated = context.setdefault("_validated_phases", [])
-            if phase and phase != "all" and phase not in validated:
+            validated = context.get("_validated_phases")
+            if validated is None:
+                validated = context["_validated_phases"] = []
+            changed = phase and phase != "all" and phase not in validated
+            if changed:
                 validated.append(phase)
                 logger.info("Phase validated: %s", phase)
-            context["validated_phases"] = ", ".join(validated) if validated else "None"
+            # Only rebuild the display string when the list actually changed
+            if changed or "validated_phases" not in context:
+                context["validated_phases"] = ", ".join(validated) if validated else "None"
 
 
 def _set_review_fixes_path(context: dict[str, Any]) -> None:
-    """Set the review_fixes_path in context based on tasks file location."""
+    """Set the review_fixes_path in context based on tasks file location.
+
+    Runs after every build iteration but the tasks file rarely changes,
+    so the path is only rebuilt when tasks_file_path differs from the
+    one it was last derived from.
+    """
     tasks_file = context.get("tasks_file_path", "")
+    if context.get("_review_fixes_for") == tasks_file and "review_fixes_path" in context:
+        return
+    context["_review_fixes_for"] = tasks_file
     if tasks_file:
-        review_fixes = str(Path(tasks_file).parent / "review_fixes.md")
+        review_fixes = os.path.join(os.path.dirname(tasks_file), "review_fixes.md")
     else:
         review_fixes = "review_fixes.md"
     context["review_fixes_path"] = review_fixes
@@ -193,8 +222,9 @@ def ship_before_stage(stage_name: str, context: dict[str, Any]) -> None:
         stage_name: Name of the stage about to run
         context: Mutable pipeline context dictionary
     """
+    known_head = context.pop(_HEAD_AFTER_STAGE, None)
     if stage_name in ("clean_discover", "test_plan"):
-        head = snapshot_head()
+        head = known_head or snapshot_head()
         if head:
             context["_phase_start_commit"] = head
             logger.info("Snapshotted HEAD at %s for ship %s stage", head, stage_name)
@@ -240,6 +270,7 @@ def _collect_stage_summary(context: dict[str, Any]) -> str:
     diff = collect_diff(start_commit)
     if not diff:
         return "No changes captured (diff collection failed)"
+    context[_HEAD_AFTER_STAGE] = diff.end_commit
 
     parts = []
     if diff.changed_files:
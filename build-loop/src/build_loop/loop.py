@@ -10,16 +10,26 @@ import subprocess
 import sys
 
 from .agent import get_agent
+from .banner import print_banner
 from .prompt import build_prompt
 from .stats import BuildStats
 
+# Same pattern as PromiseCompletion.PROMISE_PATTERN. Not imported from there,
+# since that would load the whole pipeline package for the plain loop.
+_PROMISE_RE = re.compile(r"\[\[PROMISE:(.*?)\]\]", re.DOTALL)
+
+# Promise tags come at the end of the output; scan this much of it first
+_PROMISE_TAIL_CHARS = 8192
+
 
 def detect_promise(output: str) -> str | None:
     """
     Extract promise tag from Claude's output.
 
     Searches for [[PROMISE:...]] pattern and returns the promise text
-    if found. Promise text is stripped of whitespace.
+    if found. Promise text is stripped of whitespace. The tail of the
+    output is searched first, so only outputs without a promise near
+    the end are scanned in full.
 
     Args:
         output: Full output from Claude subprocess
@@ -27,7 +37,9 @@ def detect_promise(output: str) -> str | None:
     Returns:
         Promise text ("TASK_COMPLETE" or "BUILD_COMPLETE") if found, None otherwise
     """
-    match = re.search(r"\[\[PROMISE:(.*?)\]\]", output, re.DOTALL)
+    match = _PROMISE_RE.search(output[-_PROMISE_TAIL_CHARS:])
+    if not match and len(output) > _PROMISE_TAIL_CHARS:
+        match = _PROMISE_RE.search(output)
     if match:
         return match.group(1).strip()
     return None
@@ -65,19 +77,22 @@ def run_build_loop(
 
     # Check agent availability
     if not runner.check_available():
-        print(f"\n{'='*60}", file=sys.stderr)
-        print(f"❌ ERROR: {runner.name} CLI not found", file=sys.stderr)
-        print(f"   The '{runner.name}' command is not installed or not in PATH.", file=sys.stderr)
-        print(f"{'='*60}", file=sys.stderr)
+        print_banner(
+            f"❌ ERROR: {runner.name} CLI not found",
+            f"   The '{runner.name}' command is not installed or not in PATH.",
+            file=sys.stderr,
+        )
         return 127, 0
 
     # Display configuration
-    print("\n--- Spectre Build Configuration ---")
-    print(f"Agent: {agent}")
-    print(f"Tasks file: {tasks_file}")
-    print(f"Context files: {context_files if context_files else 'None'}")
-    print(f"Max iterations: {max_iterations}")
-    print("-----------------------------------\n")
+    print("\n".join((
+        "\n--- Spectre Build Configuration ---",
+        f"Agent: {agent}",
+        f"Tasks file: {tasks_file}",
+        f"Context files: {context_files if context_files else 'None'}",
+        f"Max iterations: {max_iterations}",
+        "-----------------------------------\n",
+    )))
 
     # Use provided stats or create local instance
     # When stats is provided externally, caller owns the summary print
@@ -91,11 +106,11 @@ def run_build_loop(
         iteration += 1
 
         # Print iteration header with promise reference
-        print(f"\n{'='*60}")
-        print(f"🔄 Iteration {iteration}/{max_iterations} [{agent}]")
-        print(f"   Complete task: [[PROMISE:TASK_COMPLETE]]")
-        print(f"   All done: [[PROMISE:BUILD_COMPLETE]]")
-        print(f"{'='*60}\n")
+        print_banner(
+            f"🔄 Iteration {iteration}/{max_iterations} [{agent}]",
+            "   Complete task: [[PROMISE:TASK_COMPLETE]]",
+            "   All done: [[PROMISE:BUILD_COMPLETE]]",
+        )
 
         # Build fresh prompt each iteration
         prompt = build_prompt(tasks_file, context_files)
@@ -104,27 +119,32 @@ def run_build_loop(
         try:
             exit_code, output, stderr = runner.run_iteration(prompt, stats=stats)
         except FileNotFoundError:
-            print(f"\n{'='*60}", file=sys.stderr)
-            print(f"❌ ERROR: {runner.name} CLI not found", file=sys.stderr)
-            print(f"   Iteration: {iteration}/{max_iterations}", file=sys.stderr)
-            print(f"{'='*60}", file=sys.stderr)
+            print_banner(
+                f"❌ ERROR: {runner.name} CLI not found",
+                f"   Iteration: {iteration}/{max_iterations}",
+                file=sys.stderr,
+            )
             if owns_stats:
                 stats.print_summary()
             return 127, stats.iterations_completed  # Command not found
         except subprocess.TimeoutExpired:
-            print(f"\n{'='*60}", file=sys.stderr)
-            print(f"❌ ERROR: {runner.name} execution timed out", file=sys.stderr)
-            print(f"   Iteration: {iteration}/{max_iterations}", file=sys.stderr)
-            print("", file=sys.stderr)
-            print("The agent subprocess exceeded the allowed time.", file=sys.stderr)
-            print("Consider increasing timeout or breaking down tasks.", file=sys.stderr)
-            print(f"{'='*60}", file=sys.stderr)
+            print_banner(
+                f"❌ ERROR: {runner.name} execution timed out",
+                f"   Iteration: {iteration}/{max_iterations}",
+                "",
+                "The agent subprocess exceeded the allowed time.",
+                "Consider increasing timeout or breaking down tasks.",
+                file=sys.stderr,
+            )
             stats.iterations_failed += 1
             if owns_stats:
                 stats.print_summary()
             return 124, stats.iterations_completed  # Timeout
 
-        # Check for promise FIRST - if agent completed its task, trust that
+        # Check for promise FIRST - if agent completed its task, trust that.
+        # Only checked once the agent has exited: it may still commit or
+        # update progress after printing the tag, so stopping it early on
+        # the tag would lose work.
         promise = detect_promise(output)
 
         # Handle non-zero exit code, but only fail if there's no valid promise
@@ -134,14 +154,13 @@ def run_build_loop(
                 print(f"\n⚠ {runner.name} exited with code {exit_code}, but task completed.")
             else:
                 # No promise and non-zero exit - this is a real failure
-                print(f"\n{'='*60}", file=sys.stderr)
-                print(f"❌ ERROR: {runner.name} exited with code {exit_code}", file=sys.stderr)
-                print(f"   Iteration: {iteration}/{max_iterations}", file=sys.stderr)
+                lines = [
+                    f"❌ ERROR: {runner.name} exited with code {exit_code}",
+                    f"   Iteration: {iteration}/{max_iterations}",
+                ]
                 if stderr:
-                    print("", file=sys.stderr)
-                    print("stderr output:", file=sys.stderr)
-                    print(stderr, file=sys.stderr)
-                print(f"{'='*60}", file=sys.stderr)
+                    lines += ["", "stderr output:", stderr]
+                print_banner(*lines, file=sys.stderr)
                 stats.iterations_failed += 1
                 if owns_stats:
                     stats.print_summary()
@@ -150,9 +169,9 @@ def run_build_loop(
         # Handle promise-based flow control
         if promise == "BUILD_COMPLETE":
             stats.iterations_completed += 1
-            print(f"\n{'='*60}")
-            print("✅ BUILD COMPLETE - All tasks finished!")
-            print(f"{'='*60}")
+            print_banner(
+                "✅ BUILD COMPLETE - All tasks finished!",
+            )
             if owns_stats:
                 stats.print_summary()
             return 0, stats.iterations_completed
@@ -166,10 +185,10 @@ def run_build_loop(
             # Loop continues to next iteration
 
     # Max iterations reached
-    print(f"\n{'='*60}")
-    print(f"⚠ Max iterations ({max_iterations}) reached. Build incomplete.")
-    print("   Review build_progress.md and tasks file to assess state.")
-    print(f"{'='*60}")
+    print_banner(
+        f"⚠ Max iterations ({max_iterations}) reached. Build incomplete.",
+        "   Review build_progress.md and tasks file to assess state.",
+    )
     if owns_stats:
         stats.print_summary()
     return 1, stats.iterations_completed
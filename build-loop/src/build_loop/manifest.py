@@ -4,14 +4,31 @@ Build manifest parsing for spectre-build.
 Parses markdown files with YAML frontmatter to configure build loop runs.
 """
 
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import yaml
 
-@dataclass
+from .filecache import FileCache, stat_file
+
+try:
+    # libyaml-backed loader; PyYAML can be built without it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - exercised when libyaml is absent
+    from yaml import SafeLoader as _YamlLoader
+
+# Leading ---/--- block holding the manifest's YAML frontmatter
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+
+@dataclass(frozen=True, slots=True)
 class BuildManifest:
-    """Configuration for a build loop run, loaded from a manifest file."""
+    """Configuration for a build loop run, loaded from a manifest file.
+
+    Frozen because load_manifest hands out cached instances.
+    """
 
     tasks: str
     context: list[str] = field(default_factory=list)
@@ -24,101 +41,36 @@ class BuildManifest:
     manifest_path: str | None = None
 
 
+# Loaded manifests by resolved path; an edited file is parsed again
+_MANIFEST_CACHE: FileCache[BuildManifest] = FileCache()
+
+
 def _parse_yaml_frontmatter(content: str) -> dict:
     """Parse YAML frontmatter from markdown content.
 
-    Simple parser that handles the subset of YAML we need:
-    - key: value (strings, numbers, booleans)
-    - key: [list, items] or key:\\n  - item1\\n  - item2
-
     Args:
         content: Full markdown file content
 
     Returns:
-        Dict of frontmatter key-value pairs, empty if no frontmatter
+        Dict of frontmatter key-value pairs, empty if there is no
+        frontmatter or it isn't a mapping
+
+    Raises:
+        yaml.YAMLError: If the frontmatter is not valid YAML
     """
-    # Match YAML frontmatter block
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}
 
-    yaml_block = match.group(1)
-    result: dict = {}
-    current_key: str | None = None
-    current_list: list[str] | None = None
-
-    for line in yaml_block.split("\n"):
-        # Skip empty lines and comments
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        # Check for list item (indented with -)
-        if line.startswith("  - ") or line.startswith("\t- "):
-            if current_key and current_list is not None:
-                value = line.lstrip().lstrip("-").strip()
-                current_list.append(value)
-            continue
-
-        # Check for key: value
-        if ":" in stripped:
-            # Save previous list if any
-            if current_key and current_list is not None:
-                result[current_key] = current_list
-
-            key, _, value = stripped.partition(":")
-            key = key.strip()
-            value = value.strip()
-
-            if not value:
-                # Start of a list
-                current_key = key
-                current_list = []
-            elif value.startswith("[") and value.endswith("]"):
-                # Inline list: key: [a, b, c]
-                items = value[1:-1].split(",")
-                result[key] = [item.strip().strip("'\"") for item in items if item.strip()]
-                current_key = None
-                current_list = None
-            else:
-                # Simple value
-                result[key] = _parse_yaml_value(value)
-                current_key = None
-                current_list = None
-
-    # Save final list if any
-    if current_key and current_list is not None:
-        result[current_key] = current_list
-
-    return result
-
-
-def _parse_yaml_value(value: str) -> str | int | bool:
-    """Parse a YAML scalar value."""
-    # Strip quotes
-    if (value.startswith('"') and value.endswith('"')) or \
-       (value.startswith("'") and value.endswith("'")):
-        return value[1:-1]
-
-    # Boolean
-    if value.lower() in ("true", "yes", "on"):
-        return True
-    if value.lower() in ("false", "no", "off"):
-        return False
-
-    # Integer
-    try:
-        return int(value)
-    except ValueError:
-        pass
-
-    return value
+    data = yaml.load(match.group(1), Loader=_YamlLoader)
+    return data if isinstance(data, dict) else {}
 
 
 def load_manifest(path: str) -> BuildManifest:
     """Load and parse a build manifest file.
 
     Paths in the manifest are resolved relative to the manifest file's directory.
+    Results are cached until the file's mtime or size changes.
 
     Args:
         path: Path to the manifest markdown file
@@ -128,15 +80,23 @@ def load_manifest(path: str) -> BuildManifest:
 
     Raises:
         FileNotFoundError: If manifest file doesn't exist
-        ValueError: If manifest is missing required fields
+        ValueError: If the frontmatter is invalid or missing required fields
     """
     manifest_path = Path(path).resolve()
 
-    if not manifest_path.is_file():
+    st = stat_file(manifest_path)
+    if st is None:
         raise FileNotFoundError(f"Manifest file not found: {path}")
 
+    cached = _MANIFEST_CACHE.get(str(manifest_path), st)
+    if cached is not None:
+        return cached
+
     content = manifest_path.read_text(encoding="utf-8")
-    frontmatter = _parse_yaml_frontmatter(content)
+    try:
+        frontmatter = _parse_yaml_frontmatter(content)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML frontmatter in manifest {path}: {e}") from e
 
     if not frontmatter:
         raise ValueError(f"No YAML frontmatter found in manifest: {path}")
@@ -145,24 +105,33 @@ def load_manifest(path: str) -> BuildManifest:
         raise ValueError(f"Manifest missing required 'tasks' field: {path}")
 
     # Resolve paths relative to manifest directory
-    manifest_dir = manifest_path.parent
+    # Already symlink-free (manifest_path is resolved), so relative entries
+    # can be joined onto it as strings
+    manifest_dir = str(manifest_path.parent)
 
     def resolve_path(p: str) -> str:
-        """Resolve a path relative to manifest directory."""
+        """Resolve a path relative to manifest directory.
+
+        Joined lexically, without touching the filesystem, unless the path
+        has a ".." component: that may follow a symlink, so it is resolved.
+        """
         path_obj = Path(p)
         if path_obj.is_absolute():
             return str(path_obj)
-        return str((manifest_dir / path_obj).resolve())
+        joined = os.path.join(manifest_dir, p)
+        if ".." in path_obj.parts:
+            return os.path.realpath(joined)
+        return os.path.normpath(joined)
 
     # Build manifest object
     tasks = resolve_path(str(frontmatter["tasks"]))
 
-    context_raw = frontmatter.get("context", [])
+    context_raw = frontmatter.get("context") or []
     if isinstance(context_raw, str):
         context_raw = [context_raw]
     context = [resolve_path(str(c)) for c in context_raw]
 
-    return BuildManifest(
+    manifest = BuildManifest(
         tasks=tasks,
         context=context,
         max_iterations=int(frontmatter.get("max_iterations", 10)),
@@ -171,3 +140,5 @@ def load_manifest(path: str) -> BuildManifest:
         ship=bool(frontmatter.get("ship", False)),
         manifest_path=str(manifest_path),
     )
+    _MANIFEST_CACHE.set(str(manifest_path), st, manifest)
+    return manifest
@@ -5,7 +5,6 @@ Sends notifications via osascript (AppleScript) - no dependencies required.
 Supports custom sounds placed in ~/Library/Sounds/.
 """
 
-import subprocess
 import sys
 from pathlib import Path
 
@@ -80,14 +79,17 @@ def notify(
 
     script += f' sound name "{sound_name}"'
 
+    # Imported here so the CLI doesn't load subprocess just to import us
+    import subprocess as _subprocess
+
     try:
-        subprocess.run(
+        _subprocess.run(
             ["osascript", "-e", script],
             check=True,
             capture_output=True,
         )
         return True
-    except subprocess.CalledProcessError:
+    except _subprocess.CalledProcessError:
         return False
     except FileNotFoundError:
         # osascript not available
@@ -96,8 +98,10 @@ def notify(
 
 def get_git_branch() -> str | None:
     """Get the current git branch name."""
+    import subprocess as _subprocess
+
     try:
-        result = subprocess.run(
+        result = _subprocess.run(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
             capture_output=True,
             text=True,
@@ -105,7 +109,7 @@ def get_git_branch() -> str | None:
         )
         if result.returncode == 0:
             return result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except (_subprocess.TimeoutExpired, FileNotFoundError):
         pass
     return None
 
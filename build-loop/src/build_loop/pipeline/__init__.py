@@ -19,13 +19,14 @@ from .loader import (
     create_ship_pipeline,
     load_pipeline,
 )
-from .stage import Stage, StageConfig
+from .stage import ParallelStageConfig, Stage, StageConfig
 
 __all__ = [
     "CompletionResult",
     "CompletionStrategy",
     "JsonCompletion",
     "PromiseCompletion",
+    "ParallelStageConfig",
     "Stage",
     "StageConfig",
     "PipelineExecutor",
@@ -11,8 +11,14 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+try:
+    # Optional C parser; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _json_loads = json.loads
 
-@dataclass
+
+@dataclass(slots=True)
 class CompletionResult:
     """Result from evaluating stage completion.
 
@@ -29,6 +35,8 @@ class CompletionResult:
 class CompletionStrategy(ABC):
     """Base class for completion detection strategies."""
 
+    __slots__ = ()
+
     @abstractmethod
     def evaluate(self, output: str, exit_code: int) -> CompletionResult:
         """Evaluate whether output indicates stage completion.
@@ -41,6 +49,22 @@ class CompletionStrategy(ABC):
             CompletionResult with completion status, signal, and artifacts
         """
 
+    def fingerprint(self) -> str:
+        """Describe this strategy's configuration, for stage cache keys.
+
+        Built from slot values (and the instance dict, if any); sets are
+        sorted so the text doesn't depend on hash order.
+        """
+        values = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                values[name] = getattr(self, name)
+        fields = ", ".join(
+            f"{name}={sorted(value) if isinstance(value, frozenset) else value!r}"
+            for name, value in sorted(values.items())
+        )
+        return f"{type(self).__name__}({fields})"
+
 
 class PromiseCompletion(CompletionStrategy):
     """Detects completion via [[PROMISE:SIGNAL]] tags in output.
@@ -49,22 +73,29 @@ class PromiseCompletion(CompletionStrategy):
     specific signals as completion indicators.
 
     Args:
-        complete_signals: List of signals that indicate completion
+        complete_signals: Signals that indicate completion
                          (e.g., ["TASK_COMPLETE", "BUILD_COMPLETE"])
         require_success: If True, requires exit_code == 0 for completion
         extract_artifacts: If True, also extract JSON blocks as artifacts
     """
 
+    __slots__ = ("complete_signals", "require_success", "extract_artifacts")
+
     # Regex pattern for promise tags
     PROMISE_PATTERN = re.compile(r"\[\[PROMISE:(.*?)\]\]", re.DOTALL)
 
+    # Promise tags come at the end of a run, so only this many trailing
+    # characters are scanned unless they hold no completion signal
+    TAIL_CHARS = 8192
+
     def __init__(
         self,
         complete_signals: list[str] | None = None,
         require_success: bool = False,
         extract_artifacts: bool = False,
     ):
-        self.complete_signals = complete_signals or ["TASK_COMPLETE", "BUILD_COMPLETE"]
+        # Sets, since every extracted tag is checked for membership
+        self.complete_signals = frozenset(complete_signals or ("TASK_COMPLETE", "BUILD_COMPLETE"))
         self.require_success = require_success
         self.extract_artifacts = extract_artifacts
 
@@ -74,43 +105,55 @@ class PromiseCompletion(CompletionStrategy):
         Scans output for [[PROMISE:...]] patterns. If a matching signal
         is found, returns completion with that signal. When extract_artifacts
         is enabled, also extracts the last JSON code block as artifacts.
+
+        The tail of the output is scanned first; the whole output is only
+        scanned when the tail holds no completion signal.
         """
-        # Extract all promise tags
-        matches = self.PROMISE_PATTERN.findall(output)
-        signals = [m.strip() for m in matches]
-
-        # Check for completion signals
-        for signal in signals:
-            if signal in self.complete_signals:
-                # Check exit code requirement
-                if self.require_success and exit_code != 0:
-                    return CompletionResult(
-                        is_complete=False,
-                        signal=signal,
-                        artifacts={"exit_code": exit_code}
-                    )
-                artifacts = {}
-                if self.extract_artifacts:
-                    artifacts = self._extract_json_artifacts(output)
-                return CompletionResult(
-                    is_complete=True,
-                    signal=signal,
-                    artifacts=artifacts,
-                )
-
-        # No completion signal found
+        # Scan promise tags, tail first
+        signal, last_signal = self._scan_signals(output[-self.TAIL_CHARS:])
+        if signal is None and len(output) > self.TAIL_CHARS:
+            signal, last_signal = self._scan_signals(output)
+
+        if signal is None:
+            # No completion signal found
+            return CompletionResult(is_complete=False, signal=last_signal)
+
+        # Check exit code requirement
+        if self.require_success and exit_code != 0:
+            return CompletionResult(
+                is_complete=False,
+                signal=signal,
+                artifacts={"exit_code": exit_code}
+            )
+        artifacts = {}
+        if self.extract_artifacts:
+            artifacts = self._extract_json_artifacts(output)
         return CompletionResult(
-            is_complete=False,
-            signal=signals[-1] if signals else None,
+            is_complete=True,
+            signal=signal,
+            artifacts=artifacts,
         )
 
+    def _scan_signals(self, text: str) -> tuple[str | None, str | None]:
+        """Return (first completion signal, last tag seen) for promise tags in text.
+
+        Stops at the first completion signal without collecting the tags
+        into a list; the second value is then that signal.
+        """
+        last = None
+        for match in self.PROMISE_PATTERN.finditer(text):
+            last = match.group(1).strip()
+            if last in self.complete_signals:
+                return last, last
+        return None, last
+
     def _extract_json_artifacts(self, output: str) -> dict[str, Any]:
         """Extract artifacts from the last JSON code block in output."""
-        matches = list(JsonCompletion.JSON_BLOCK_PATTERN.finditer(output))
-        if not matches:
+        json_str = JsonCompletion.last_json_block(output)
+        if json_str is None:
             return {}
         try:
-            data = json.loads(matches[-1].group(1).strip())
+            data = _json_loads(json_str)
             return data if isinstance(data, dict) else {}
         except json.JSONDecodeError:
             return {}
@@ -124,13 +167,15 @@ class JsonCompletion(CompletionStrategy):
     complete_statuses to be considered complete.
 
     Args:
-        complete_statuses: List of status values indicating completion
+        complete_statuses: Status values indicating completion
                           (e.g., ["COMPLETE", "APPROVED"])
         signal_field: Field name containing the signal (default: "status")
         artifact_fields: Fields to extract as artifacts (default: all fields)
         require_success: If True, requires exit_code == 0 for completion
     """
 
+    __slots__ = ("complete_statuses", "signal_field", "artifact_fields", "require_success")
+
     # Regex pattern for JSON code blocks
     JSON_BLOCK_PATTERN = re.compile(r"```json\s*\n(.*?)\n```", re.DOTALL)
 
@@ -141,28 +186,40 @@ class JsonCompletion(CompletionStrategy):
         artifact_fields: list[str] | None = None,
         require_success: bool = False,
     ):
-        self.complete_statuses = complete_statuses or ["COMPLETE", "APPROVED"]
+        self.complete_statuses = frozenset(complete_statuses or ("COMPLETE", "APPROVED"))
         self.signal_field = signal_field
         self.artifact_fields = artifact_fields  # None means extract all
         self.require_success = require_success
 
+    @classmethod
+    def last_json_block(cls, output: str, containing: str | None = None) -> str | None:
+        """Return the stripped body of the last ```json block, or None.
+
+        Walks the matches keeping only the latest, rather than building
+        a list of every block in the output. With ``containing``, the last
+        block whose text includes it is preferred, so later JSON that
+        can't hold the wanted field is skipped without being parsed.
+        """
+        last = preferred = None
+        for last in cls.JSON_BLOCK_PATTERN.finditer(output):
+            if containing is not None and containing in last.group(1):
+                preferred = last
+        match = preferred or last
+        return match.group(1).strip() if match else None
+
     def evaluate(self, output: str, exit_code: int) -> CompletionResult:
         """Parse JSON blocks from output.
 
-        Searches for the last ```json ... ``` block and extracts
-        the status signal and artifacts.
+        Searches for the last ```json ... ``` block mentioning the signal
+        field (or the last block, if none does) and extracts the status
+        signal and artifacts.
         """
-        # Find all JSON blocks
-        matches = list(self.JSON_BLOCK_PATTERN.finditer(output))
-
-        if not matches:
+        json_str = self.last_json_block(output, containing=f'"{self.signal_field}"')
+        if json_str is None:
             return CompletionResult(is_complete=False)
 
-        # Use the last JSON block
-        json_str = matches[-1].group(1).strip()
-
         try:
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
         except json.JSONDecodeError:
             return CompletionResult(is_complete=False)
 
@@ -178,11 +235,15 @@ class JsonCompletion(CompletionStrategy):
         if self.artifact_fields:
             artifacts = {k: data[k] for k in self.artifact_fields if k in data}
         else:
-            # Extract all fields as artifacts
-            artifacts = dict(data)
+            # Extract all fields as artifacts; data was freshly parsed and
+            # isn't used again, so it is handed out without a copy
+            artifacts = data
 
-        # Check for completion
-        is_complete = signal in self.complete_statuses
+        # Check for completion; a list or object value can never match
+        try:
+            is_complete = signal in self.complete_statuses
+        except TypeError:
+            is_complete = False
 
         # Check exit code requirement
         if is_complete and self.require_success and exit_code != 0:
@@ -206,17 +267,23 @@ class CompositeCompletion(CompletionStrategy):
         strategies: List of CompletionStrategy instances to try
     """
 
+    __slots__ = ("strategies",)
+
     def __init__(self, strategies: list[CompletionStrategy]):
         self.strategies = strategies
 
     def evaluate(self, output: str, exit_code: int) -> CompletionResult:
         """Try each strategy until one reports completion."""
+        result = CompletionResult(is_complete=False)
         for strategy in self.strategies:
             result = strategy.evaluate(output, exit_code)
             if result.is_complete:
                 return result
 
-        # Return last non-complete result, or default
-        if self.strategies:
-            return self.strategies[-1].evaluate(output, exit_code)
-        return CompletionResult(is_complete=False)
+        # Last non-complete result, or the default if there are no strategies
+        return result
+
+    def fingerprint(self) -> str:
+        """Combine the fingerprints of the wrapped strategies."""
+        inner = ", ".join(strategy.fingerprint() for strategy in self.strategies)
+        return f"CompositeCompletion([{inner}])"
@@ -5,16 +5,19 @@ Orchestrates the execution of a multi-stage pipeline, managing transitions
 between stages based on completion signals and maintaining global state.
 """
 
+import asyncio
+import hashlib
 import logging
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable
 
-from ..agent import AgentRunner
+from ..agent import AgentRunner, gather_or_cancel
+from ..banner import print_banner
 from ..stats import BuildStats
 from .completion import CompletionResult
-from .stage import Stage, StageConfig
+from .stage import ParallelStageConfig, Stage, StageConfig, merge_results
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +31,7 @@ class PipelineStatus(str, Enum):
     STOPPED = "stopped"
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineState:
     """Current state of pipeline execution.
 
@@ -46,7 +49,7 @@ class PipelineState:
     total_iterations: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Configuration for a complete pipeline.
 
@@ -56,29 +59,92 @@ class PipelineConfig:
         stages: Dictionary of stage name -> StageConfig
         start_stage: Name of the initial stage
         end_signals: Signals that indicate pipeline completion
+        parallel_groups: Dictionary of group name -> ParallelStageConfig;
+            a group name can be the start stage or a transition target
+        enable_memoization: Reuse a stage's completed result when it is run
+            again with the same prompt and completion strategy, instead of
+            invoking the agent. Only safe for stages whose agent work does
+            not depend on anything outside the prompt (e.g. research or
+            review passes), so it is off by default.
     """
     name: str
     stages: dict[str, StageConfig]
     start_stage: str
     description: str = ""
     end_signals: list[str] = field(default_factory=lambda: ["BUILD_COMPLETE", "COMPLETE"])
+    parallel_groups: dict[str, ParallelStageConfig] = field(default_factory=dict)
+    enable_memoization: bool = False
+
+
+class StageCache:
+    """In-memory store for memoized stage results.
+
+    Keys are digests from ``stage_cache_key``; values are the completed
+    (CompletionResult, iterations) pairs. Holds at most max_entries,
+    dropping the oldest first. Subclass and override get/set to keep
+    results somewhere else.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[CompletionResult, int]] = {}
+
+    def get(self, key: str) -> tuple[CompletionResult, int] | None:
+        """Return the cached (result, iterations) for key, or None on a miss."""
+        return self._entries.get(key)
+
+    def set(self, key: str, value: tuple[CompletionResult, int]) -> None:
+        """Store a completed (result, iterations) pair under key."""
+        self._entries.pop(key, None)
+        self._entries[key] = value
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+
+# Shared by every executor that isn't given a cache, so a pipeline run
+# again in the same process (e.g. by the server) can reuse results
+_SHARED_CACHE = StageCache()
+
+
+def stage_cache_key(stage: Stage, prompt: str) -> str:
+    """Digest of everything that decides a stage's outcome from its inputs.
+
+    Uses the built prompt rather than the raw context, so context keys
+    the template doesn't reference don't change the key. The agent and
+    the stage's tool denylist are included, since the shared cache sees
+    runs from every executor in the process.
+    """
+    denied = stage.config.denied_tools
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        stage.name,
+        stage.runner.name,
+        # None (the runner's defaults) differs from an empty denylist
+        "default" if denied is None else repr(sorted(denied)),
+        str(stage.config.max_iterations),
+        stage.config.completion.fingerprint(),
+        prompt,
+    ):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 # Event types for callbacks
-@dataclass
+@dataclass(slots=True)
 class PipelineEvent:
     """Base class for pipeline events."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StageStartedEvent(PipelineEvent):
     """Emitted when a stage begins execution."""
     stage: str
     iteration: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class StageCompletedEvent(PipelineEvent):
     """Emitted when a stage completes."""
     stage: str
@@ -87,7 +153,7 @@ class StageCompletedEvent(PipelineEvent):
     artifacts: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class StageIterationEvent(PipelineEvent):
     """Emitted for each iteration within a stage."""
     stage: str
@@ -95,14 +161,14 @@ class StageIterationEvent(PipelineEvent):
     max_iterations: int
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputEvent(PipelineEvent):
     """Emitted for streaming output text."""
     stage: str
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineCompletedEvent(PipelineEvent):
     """Emitted when pipeline finishes."""
     status: PipelineStatus
@@ -121,6 +187,8 @@ class PipelineExecutor:
         runner: AgentRunner for executing prompts
         on_event: Optional callback for pipeline events
         context: Initial context variables for prompt substitution
+        cache: Store for memoized stage results when the config enables
+            memoization (defaults to a StageCache shared across executors)
     """
 
     def __init__(
@@ -131,6 +199,7 @@ class PipelineExecutor:
         context: dict[str, Any] | None = None,
         before_stage: Callable[[str, dict[str, Any]], None] | None = None,
         after_stage: Callable[[str, dict[str, Any], CompletionResult], None] | None = None,
+        cache: StageCache | None = None,
     ):
         self.config = config
         self.runner = runner
@@ -138,9 +207,12 @@ class PipelineExecutor:
         self.initial_context = context or {}
         self.before_stage = before_stage
         self.after_stage = after_stage
+        self.cache = (cache or _SHARED_CACHE) if config.enable_memoization else None
         self._state = PipelineState()
         self._stages: dict[str, Stage] = {}
         self._should_stop = False
+        self._run_keys: set[str] = set()
+        self._end_signals = frozenset(config.end_signals)
 
         # Build stage instances
         for name, stage_config in config.stages.items():
@@ -174,7 +246,8 @@ class PipelineExecutor:
 
         Runs stages in sequence, following transitions based on
         completion signals until an end signal is reached or
-        no valid transition exists.
+        no valid transition exists. A transition to a parallel group
+        runs the group's member stages concurrently.
 
         Args:
             stats: Optional BuildStats for tracking usage
@@ -185,6 +258,7 @@ class PipelineExecutor:
         stats = stats or BuildStats()
         self._state.status = PipelineStatus.RUNNING
         self._should_stop = False
+        self._run_keys.clear()
 
         # Build execution context
         context = dict(self.initial_context)
@@ -192,69 +266,34 @@ class PipelineExecutor:
         # Start with initial stage
         current_stage_name = self.config.start_stage
 
-        print(f"\n{'='*60}")
-        print(f"🚀 PIPELINE: {self.config.name}")
-        print(f"   Starting stage: {current_stage_name}")
-        print(f"{'='*60}\n")
+        print_banner(
+            f"🚀 PIPELINE: {self.config.name}",
+            f"   Starting stage: {current_stage_name}",
+        )
 
         while current_stage_name and not self._should_stop:
-            # Get stage instance
-            stage = self._stages.get(current_stage_name)
-            if not stage:
-                print(f"❌ Unknown stage: {current_stage_name}", file=sys.stderr)
-                self._state.status = PipelineStatus.FAILED
-                break
-
-            self._state.current_stage = current_stage_name
-            self._emit(StageStartedEvent(stage=current_stage_name))
-
-            # Call before_stage hook
-            if self.before_stage:
-                try:
-                    self.before_stage(current_stage_name, context)
-                except Exception as e:
-                    logger.warning("before_stage hook error for '%s': %s", current_stage_name, e)
+            group = self.config.parallel_groups.get(current_stage_name)
+            if group is not None:
+                result = self._run_group(group, context, stats)
+            else:
+                # Get stage instance
+                stage = self._stages.get(current_stage_name)
+                if not stage:
+                    print(f"❌ Unknown stage: {current_stage_name}", file=sys.stderr)
+                    self._state.status = PipelineStatus.FAILED
+                    break
+                result = self._run_stage(stage, context, stats)
 
-            # Run the stage
-            try:
-                result, iterations = stage.run(context, stats)
-            except Exception as e:
-                logger.error("Stage '%s' execution failed: %s", current_stage_name, e)
-                self._state.status = PipelineStatus.FAILED
-                self._emit(PipelineCompletedEvent(
-                    status=PipelineStatus.FAILED,
-                    total_iterations=self._state.total_iterations,
-                ))
+            if result is None:
+                # Failure already recorded in state
                 break
 
-            self._state.total_iterations += iterations
-
-            # Call after_stage hook
-            if self.after_stage:
-                try:
-                    self.after_stage(current_stage_name, context, result)
-                except Exception as e:
-                    logger.warning("after_stage hook error for '%s': %s", current_stage_name, e)
-
-            # Merge artifacts into global state
-            self._state.global_artifacts.update(result.artifacts)
-
-            # Record in history
-            self._state.stage_history.append((current_stage_name, result.signal))
-
-            self._emit(StageCompletedEvent(
-                stage=current_stage_name,
-                signal=result.signal,
-                iterations=iterations,
-                artifacts=result.artifacts,
-            ))
-
             # Check for pipeline end signals
-            if result.signal and result.signal in self.config.end_signals:
-                print(f"\n{'='*60}")
-                print(f"✅ PIPELINE COMPLETE: {result.signal}")
-                print(f"   Total iterations: {self._state.total_iterations}")
-                print(f"{'='*60}\n")
+            if result.signal and result.signal in self._end_signals:
+                print_banner(
+                    f"✅ PIPELINE COMPLETE: {result.signal}",
+                    f"   Total iterations: {self._state.total_iterations}",
+                )
                 self._state.status = PipelineStatus.COMPLETED
                 self._emit(PipelineCompletedEvent(
                     status=PipelineStatus.COMPLETED,
@@ -264,11 +303,16 @@ class PipelineExecutor:
                 break
 
             # Get next stage from transition
-            next_stage_name = stage.get_next_stage(result)
+            if group is not None:
+                next_stage_name = group.transitions.get(result.signal) if result.signal else None
+            else:
+                next_stage_name = stage.get_next_stage(result)
 
             if next_stage_name:
-                print(f"\n➡️ Transitioning: {current_stage_name} → {next_stage_name}")
-                print(f"   Signal: {result.signal}")
+                print(
+                    f"\n➡️ Transitioning: {current_stage_name} → {next_stage_name}\n"
+                    f"   Signal: {result.signal}"
+                )
                 current_stage_name = next_stage_name
 
                 # Update context with artifacts for next stage
@@ -294,6 +338,192 @@ class PipelineExecutor:
         stats.print_summary()
         return self._state
 
+    async def run_async(self, stats: BuildStats | None = None) -> PipelineState:
+        """Execute the pipeline from inside a running event loop.
+
+        Runs ``run`` on a worker thread, so agents and parallel groups
+        get an event loop of their own there and the caller's loop stays
+        free while the pipeline waits on them.
+        """
+        return await asyncio.to_thread(self.run, stats)
+
+    def _run_stage(
+        self,
+        stage: Stage,
+        context: dict[str, Any],
+        stats: BuildStats,
+    ) -> CompletionResult | None:
+        """Run one stage with its hooks; return None if it raised."""
+        self._state.current_stage = stage.name
+        self._emit(StageStartedEvent(stage=stage.name))
+        self._call_before_stage(stage.name, context)
+
+        key = cached = prompt = failed = None
+        if self.cache is not None:
+            try:
+                prompt = stage.build_prompt(context)
+            except Exception as e:
+                failed = stage.fail(e)
+        if prompt is not None:
+            try:
+                key = stage_cache_key(stage, prompt)
+            except Exception as e:
+                logger.warning("Stage '%s' cache key failed: %s", stage.name, e)
+            else:
+                # A key seen earlier in this run means a loop-back; replaying
+                # the cached signal would take the same transition forever
+                if key not in self._run_keys:
+                    cached = self.cache.get(key)
+                self._run_keys.add(key)
+
+        if failed is not None:
+            # The prompt couldn't be built; the stage already reported it
+            result, iterations = failed
+        elif cached is not None:
+            # Reuse the earlier run
+            result, iterations = _copy_result(cached[0]), 0
+            print(f"\n♻️ [{stage.name}] Reusing cached result: {result.signal}")
+        else:
+            # Run the stage
+            try:
+                result, iterations = stage.run(context, stats, prompt=prompt)
+            except Exception as e:
+                logger.error("Stage '%s' execution failed: %s", stage.name, e)
+                self._fail()
+                return None
+
+            # Only completed runs are kept, so failures are always retried
+            if key is not None and result.is_complete:
+                self.cache.set(key, (_copy_result(result), iterations))
+
+        self._state.total_iterations += iterations
+        self._call_after_stage(stage.name, context, result)
+        self._record(stage.name, result, iterations)
+        return result
+
+    def _run_group(
+        self,
+        group: ParallelStageConfig,
+        context: dict[str, Any],
+        stats: BuildStats,
+    ) -> CompletionResult | None:
+        """Run a parallel group's stages concurrently; return None on failure.
+
+        Each member gets a shallow copy of the context for its hooks and
+        prompt. Hooks run in member order on this thread, around a single
+        event loop that awaits all members, so stats and artifacts are
+        only ever touched from one thread and need no lock. Context
+        changes made by the hooks are merged back in member order.
+        """
+        stages = [self._stages.get(name) for name in group.stages]
+        if not stages or None in stages:
+            print(f"❌ Invalid parallel group: {group.name}", file=sys.stderr)
+            self._state.status = PipelineStatus.FAILED
+            return None
+
+        self._state.current_stage = group.name
+        print(f"\n⏩ Running in parallel: {', '.join(group.stages)}")
+
+        base = dict(context)
+        contexts = []
+        for stage in stages:
+            self._emit(StageStartedEvent(stage=stage.name))
+            member_context = dict(base)
+            self._call_before_stage(stage.name, member_context)
+            contexts.append(member_context)
+
+        try:
+            outcomes = asyncio.run(_gather_stages(stages, contexts, stats))
+        except Exception as e:
+            logger.error("Parallel group '%s' execution failed: %s", group.name, e)
+            self._fail()
+            return None
+
+        for stage, member_context, (result, iterations) in zip(stages, contexts, outcomes):
+            self._state.total_iterations += iterations
+            self._call_after_stage(stage.name, member_context, result)
+            _merge_context(context, base, member_context)
+            self._record(stage.name, result, iterations)
+
+        return merge_results([result for result, _ in outcomes])
+
+    def _call_before_stage(self, stage_name: str, context: dict[str, Any]) -> None:
+        """Call the before_stage hook, logging rather than raising its errors."""
+        if self.before_stage:
+            try:
+                self.before_stage(stage_name, context)
+            except Exception as e:
+                logger.warning("before_stage hook error for '%s': %s", stage_name, e)
+
+    def _call_after_stage(
+        self, stage_name: str, context: dict[str, Any], result: CompletionResult
+    ) -> None:
+        """Call the after_stage hook, logging rather than raising its errors."""
+        if self.after_stage:
+            try:
+                self.after_stage(stage_name, context, result)
+            except Exception as e:
+                logger.warning("after_stage hook error for '%s': %s", stage_name, e)
+
+    def _record(self, stage_name: str, result: CompletionResult, iterations: int) -> None:
+        """Merge a finished stage's artifacts and history into state."""
+        # Merge artifacts into global state
+        self._state.global_artifacts.update(result.artifacts)
+
+        # Record in history
+        self._state.stage_history.append((stage_name, result.signal))
+
+        self._emit(StageCompletedEvent(
+            stage=stage_name,
+            signal=result.signal,
+            iterations=iterations,
+            artifacts=result.artifacts,
+        ))
+
+    def _fail(self) -> None:
+        """Mark the pipeline failed after a stage raised."""
+        self._state.status = PipelineStatus.FAILED
+        self._emit(PipelineCompletedEvent(
+            status=PipelineStatus.FAILED,
+            total_iterations=self._state.total_iterations,
+        ))
+
+
+def _copy_result(result: CompletionResult) -> CompletionResult:
+    """Copy a result so hooks mutating its artifacts can't alter the cache."""
+    return CompletionResult(
+        is_complete=result.is_complete,
+        signal=result.signal,
+        artifacts=dict(result.artifacts),
+    )
+
+
+async def _gather_stages(
+    stages: list[Stage],
+    contexts: list[dict[str, Any]],
+    stats: BuildStats,
+) -> list[tuple[CompletionResult, int]]:
+    """Run stages concurrently on the current event loop, in input order.
+
+    If one stage raises, the others are cancelled and their agents killed.
+    """
+    return await gather_or_cancel(
+        *(stage.run_async(ctx, stats) for stage, ctx in zip(stages, contexts))
+    )
+
+
+def _merge_context(
+    context: dict[str, Any],
+    base: dict[str, Any],
+    member_context: dict[str, Any],
+) -> None:
+    """Apply the keys a member's hooks added, replaced or removed to context."""
+    for key, value in member_context.items():
+        if key not in base or base[key] is not value:
+            context[key] = value
+    for key in base.keys() - member_context.keys():
+        context.pop(key, None)
+
 
 def create_pipeline_executor(
     config: PipelineConfig,
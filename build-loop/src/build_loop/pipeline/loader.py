@@ -2,18 +2,17 @@
 YAML pipeline configuration loader.
 
 Parses pipeline definitions from YAML files and validates them using Pydantic.
+yaml and the Pydantic schema models (schema.py) are imported on first use,
+so code that only needs the built-in pipeline factories doesn't load them.
 """
 
 import logging
 from pathlib import Path
-from typing import Any, Literal
-
-import yaml
-from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Any
 
+from ..filecache import FileCache, stat_file
 from .completion import (
     CompositeCompletion,
-    CompletionStrategy,
     JsonCompletion,
     PromiseCompletion,
 )
@@ -22,144 +21,21 @@ from .stage import StageConfig
 
 logger = logging.getLogger(__name__)
 
+# Loaded pipelines by resolved path; an edited file is parsed and
+# validated again
+_PIPELINE_CACHE: FileCache[PipelineConfig] = FileCache()
 
-# ---------------------------------------------------------------------------
-# Pydantic Schema Models
-# ---------------------------------------------------------------------------
+# Schema models still reachable as loader attributes, imported on access
+_SCHEMA_NAMES = frozenset({"CompletionSchema", "StageSchema", "ParallelSchema", "PipelineSchema"})
 
 
-class CompletionSchema(BaseModel):
-    """Schema for completion strategy configuration."""
-
-    type: Literal["promise", "json", "composite"]
-    signals: list[str] | None = None  # For promise: completion signals
-    statuses: list[str] | None = None  # For json: completion statuses
-    signal_field: str = "status"  # For json: field containing signal
-    artifact_fields: list[str] | None = None  # For json: fields to extract
-    require_success: bool = False
-    strategies: list["CompletionSchema"] | None = None  # For composite
-
-    def to_strategy(self) -> CompletionStrategy:
-        """Convert schema to CompletionStrategy instance."""
-        if self.type == "promise":
-            return PromiseCompletion(
-                complete_signals=self.signals or ["TASK_COMPLETE", "BUILD_COMPLETE"],
-                require_success=self.require_success,
-            )
-        elif self.type == "json":
-            return JsonCompletion(
-                complete_statuses=self.statuses or ["COMPLETE", "APPROVED"],
-                signal_field=self.signal_field,
-                artifact_fields=self.artifact_fields,
-                require_success=self.require_success,
-            )
-        elif self.type == "composite":
-            if not self.strategies:
-                raise ValueError("Composite completion requires 'strategies' list")
-            return CompositeCompletion(
-                strategies=[s.to_strategy() for s in self.strategies]
-            )
-        else:
-            raise ValueError(f"Unknown completion type: {self.type}")
-
-
-class StageSchema(BaseModel):
-    """Schema for a single pipeline stage."""
-
-    name: str
-    prompt: str = Field(..., description="Path to prompt template or inline template")
-    completion: CompletionSchema
-    max_iterations: int = Field(default=10, ge=1, le=100)
-    transitions: dict[str, str] = Field(default_factory=dict)
-    allowed_tools: list[str] | None = None
-    denied_tools: list[str] | None = None
-
-    @field_validator("prompt")
-    @classmethod
-    def validate_prompt(cls, v: str) -> str:
-        """Validate prompt is non-empty."""
-        if not v.strip():
-            raise ValueError("Prompt cannot be empty")
-        return v
-
-    def to_config(self, base_path: Path | None = None) -> StageConfig:
-        """Convert schema to StageConfig instance.
-
-        Args:
-            base_path: Base path for resolving relative prompt paths
-
-        Returns:
-            StageConfig instance
-        """
-        prompt_template = self.prompt
-
-        # Resolve relative paths
-        if base_path and not Path(prompt_template).is_absolute():
-            candidate = base_path / prompt_template
-            if candidate.is_file():
-                prompt_template = str(candidate)
-
-        return StageConfig(
-            name=self.name,
-            prompt_template=prompt_template,
-            completion=self.completion.to_strategy(),
-            max_iterations=self.max_iterations,
-            transitions=self.transitions,
-            allowed_tools=self.allowed_tools,
-            denied_tools=self.denied_tools,
-        )
-
-
-class PipelineSchema(BaseModel):
-    """Schema for a complete pipeline definition."""
-
-    name: str
-    description: str = ""
-    start_stage: str
-    end_signals: list[str] = Field(default_factory=lambda: ["BUILD_COMPLETE", "COMPLETE"])
-    stages: list[StageSchema]
-
-    @model_validator(mode="after")
-    def validate_stages(self) -> "PipelineSchema":
-        """Validate stage references are valid."""
-        stage_names = {s.name for s in self.stages}
-
-        # Check start_stage exists
-        if self.start_stage not in stage_names:
-            raise ValueError(f"start_stage '{self.start_stage}' not found in stages")
-
-        # Check all transition targets exist
-        for stage in self.stages:
-            for signal, target in stage.transitions.items():
-                if target not in stage_names:
-                    raise ValueError(
-                        f"Stage '{stage.name}' transition '{signal}' -> '{target}': "
-                        f"target stage not found"
-                    )
-
-        return self
-
-    def to_config(self, base_path: Path | None = None) -> PipelineConfig:
-        """Convert schema to PipelineConfig instance.
-
-        Args:
-            base_path: Base path for resolving relative prompt paths
-
-        Returns:
-            PipelineConfig instance
-        """
-        stages = {
-            stage.name: stage.to_config(base_path)
-            for stage in self.stages
-        }
-
-        return PipelineConfig(
-            name=self.name,
-            description=self.description,
-            stages=stages,
-            start_stage=self.start_stage,
-            end_signals=self.end_signals,
-        )
+def __getattr__(name: str) -> Any:
+    """Resolve schema model names from schema.py on first access."""
+    if name in _SCHEMA_NAMES:
+        from . import schema
+
+        return getattr(schema, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------------------------------------------------------------------------
@@ -170,6 +46,9 @@ class PipelineSchema(BaseModel):
 def load_pipeline(path: str | Path) -> PipelineConfig:
     """Load a pipeline configuration from a YAML file.
 
+    Results are cached until the file's mtime or size changes, so the
+    returned config is shared and must not be mutated.
+
     Args:
         path: Path to the YAML pipeline definition file
 
@@ -182,12 +61,25 @@ def load_pipeline(path: str | Path) -> PipelineConfig:
     """
     path = Path(path)
 
-    if not path.is_file():
+    st = stat_file(path)
+    if st is None:
         raise FileNotFoundError(f"Pipeline file not found: {path}")
 
+    cache_key = str(path.resolve())
+    cached = _PIPELINE_CACHE.get(cache_key, st)
+    if cached is not None:
+        return cached
+
+    import yaml
+
+    from .schema import PipelineSchema
+
+    # libyaml-backed loader when PyYAML was built with it
+    yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     try:
-        content = path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
+        # Bytes go straight to the loader, which decodes them itself
+        data = yaml.load(path.read_bytes(), Loader=yaml_loader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in {path}: {e}") from e
 
@@ -202,7 +94,9 @@ def load_pipeline(path: str | Path) -> PipelineConfig:
     # Use file's directory as base for resolving relative paths
     base_path = path.parent
 
-    return schema.to_config(base_path)
+    config = schema.to_config(base_path)
+    _PIPELINE_CACHE.set(cache_key, st, config)
+    return config
 
 
 def load_pipeline_from_dict(data: dict[str, Any], base_path: Path | None = None) -> PipelineConfig:
@@ -220,6 +114,8 @@ def load_pipeline_from_dict(data: dict[str, Any], base_path: Path | None = None)
     Raises:
         ValueError: If validation fails
     """
+    from .schema import PipelineSchema
+
     try:
         schema = PipelineSchema(**data)
     except Exception as e:
@@ -0,0 +1,205 @@
+"""
+Pydantic schema models for YAML pipeline definitions.
+
+Kept apart from loader.py so the built-in pipeline factories can be
+imported without paying for pydantic; the loader imports this module
+the first time a YAML or dict pipeline is validated.
+"""
+
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from .completion import (
+    CompositeCompletion,
+    CompletionStrategy,
+    JsonCompletion,
+    PromiseCompletion,
+)
+from .executor import PipelineConfig
+from .stage import ParallelStageConfig, StageConfig
+
+
+class CompletionSchema(BaseModel):
+    """Schema for completion strategy configuration."""
+
+    type: Literal["promise", "json", "composite"]
+    signals: list[str] | None = None  # For promise: completion signals
+    statuses: list[str] | None = None  # For json: completion statuses
+    signal_field: str = "status"  # For json: field containing signal
+    artifact_fields: list[str] | None = None  # For json: fields to extract
+    require_success: bool = False
+    strategies: list["CompletionSchema"] | None = None  # For composite
+
+    def to_strategy(self) -> CompletionStrategy:
+        """Convert schema to CompletionStrategy instance."""
+        if self.type == "promise":
+            return PromiseCompletion(
+                complete_signals=self.signals or ["TASK_COMPLETE", "BUILD_COMPLETE"],
+                require_success=self.require_success,
+            )
+        elif self.type == "json":
+            return JsonCompletion(
+                complete_statuses=self.statuses or ["COMPLETE", "APPROVED"],
+                signal_field=self.signal_field,
+                artifact_fields=self.artifact_fields,
+                require_success=self.require_success,
+            )
+        elif self.type == "composite":
+            if not self.strategies:
+                raise ValueError("Composite completion requires 'strategies' list")
+            # Nested composites are spliced into this one and a single
+            # strategy is returned as is; "first complete result, else the
+            # last result" gives the same answer either way
+            strategies: list[CompletionStrategy] = []
+            for schema in self.strategies:
+                strategy = schema.to_strategy()
+                if isinstance(strategy, CompositeCompletion):
+                    strategies.extend(strategy.strategies)
+                else:
+                    strategies.append(strategy)
+            if len(strategies) == 1:
+                return strategies[0]
+            return CompositeCompletion(strategies=strategies)
+        else:
+            raise ValueError(f"Unknown completion type: {self.type}")
+
+
+class StageSchema(BaseModel):
+    """Schema for a single pipeline stage."""
+
+    name: str
+    prompt: str = Field(..., description="Path to prompt template or inline template")
+    completion: CompletionSchema
+    max_iterations: int = Field(default=10, ge=1, le=100)
+    transitions: dict[str, str] = Field(default_factory=dict)
+    allowed_tools: list[str] | None = None
+    denied_tools: list[str] | None = None
+    batch_key: str | None = None
+    batch_size: int = Field(default=1, ge=1)
+
+    @field_validator("prompt")
+    @classmethod
+    def validate_prompt(cls, v: str) -> str:
+        """Validate prompt is non-empty."""
+        if not v.strip():
+            raise ValueError("Prompt cannot be empty")
+        return v
+
+    def to_config(self, base_path: Path | None = None) -> StageConfig:
+        """Convert schema to StageConfig instance.
+
+        Args:
+            base_path: Base path for resolving relative prompt paths
+
+        Returns:
+            StageConfig instance
+        """
+        prompt_template = self.prompt
+
+        # Resolve relative paths
+        if base_path and not Path(prompt_template).is_absolute():
+            candidate = base_path / prompt_template
+            if candidate.is_file():
+                prompt_template = str(candidate)
+
+        return StageConfig(
+            name=self.name,
+            prompt_template=prompt_template,
+            completion=self.completion.to_strategy(),
+            max_iterations=self.max_iterations,
+            transitions=self.transitions,
+            allowed_tools=self.allowed_tools,
+            denied_tools=self.denied_tools,
+            batch_key=self.batch_key,
+            batch_size=self.batch_size,
+        )
+
+
+class ParallelSchema(BaseModel):
+    """Schema for a group of stages run concurrently."""
+
+    name: str
+    stages: list[str] = Field(..., min_length=1)
+    transitions: dict[str, str] = Field(default_factory=dict)
+
+    def to_config(self) -> ParallelStageConfig:
+        """Convert schema to ParallelStageConfig instance."""
+        return ParallelStageConfig(
+            name=self.name,
+            stages=self.stages,
+            transitions=self.transitions,
+        )
+
+
+class PipelineSchema(BaseModel):
+    """Schema for a complete pipeline definition."""
+
+    name: str
+    description: str = ""
+    start_stage: str
+    end_signals: list[str] = Field(default_factory=lambda: ["BUILD_COMPLETE", "COMPLETE"])
+    stages: list[StageSchema]
+    parallel: list[ParallelSchema] = Field(default_factory=list)
+    enable_memoization: bool = False
+
+    @model_validator(mode="after")
+    def validate_stages(self) -> "PipelineSchema":
+        """Validate stage references are valid."""
+        stage_names = {s.name for s in self.stages}
+        group_names = {g.name for g in self.parallel}
+
+        # Group names share the stage namespace
+        clashes = stage_names & group_names
+        if clashes:
+            raise ValueError(f"Parallel group names clash with stages: {sorted(clashes)}")
+
+        # Check group members are stages
+        for group in self.parallel:
+            for member in group.stages:
+                if member not in stage_names:
+                    raise ValueError(
+                        f"Parallel group '{group.name}' member '{member}': stage not found"
+                    )
+
+        targets = stage_names | group_names
+
+        # Check start_stage exists
+        if self.start_stage not in targets:
+            raise ValueError(f"start_stage '{self.start_stage}' not found in stages")
+
+        # Check all transition targets exist
+        for stage in [*self.stages, *self.parallel]:
+            for signal, target in stage.transitions.items():
+                if target not in targets:
+                    raise ValueError(
+                        f"Stage '{stage.name}' transition '{signal}' -> '{target}': "
+                        f"target stage not found"
+                    )
+
+        return self
+
+    def to_config(self, base_path: Path | None = None) -> PipelineConfig:
+        """Convert schema to PipelineConfig instance.
+
+        Args:
+            base_path: Base path for resolving relative prompt paths
+
+        Returns:
+            PipelineConfig instance
+        """
+        stages = {
+            stage.name: stage.to_config(base_path)
+            for stage in self.stages
+        }
+
+        return PipelineConfig(
+            name=self.name,
+            description=self.description,
+            stages=stages,
+            start_stage=self.start_stage,
+            end_signals=self.end_signals,
+            parallel_groups={group.name: group.to_config() for group in self.parallel},
+            enable_memoization=self.enable_memoization,
+        )
@@ -5,18 +5,25 @@ A stage represents a single phase in a pipeline with its own prompt template,
 completion strategy, and transition rules.
 """
 
+import asyncio
 import logging
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
-from ..agent import AgentRunner
+from ..agent import AgentRunner, run_iterations_parallel
+from ..banner import print_banner
+from ..filecache import FileCache, stat_file
 from ..stats import BuildStats
 from .completion import CompletionResult, CompletionStrategy
 
 logger = logging.getLogger(__name__)
 
+# Template files read by any Stage, so a new executor's stages reuse the
+# text until the file changes
+_TEMPLATE_FILES: FileCache[str] = FileCache()
+
 
 @dataclass
 class StageConfig:
@@ -30,6 +37,13 @@ class StageConfig:
         transitions: Signal-to-stage mapping (e.g., {"BUILD_COMPLETE": "code_review"})
         allowed_tools: Tool allowlist for this stage (None = use defaults)
         denied_tools: Tool denylist for this stage (None = use defaults)
+        batch_key: Context key holding a list of independent items. When
+            set and the value is a list, the items are split into chunks of
+            batch_size and each chunk is run as its own agent invocation
+            (up to four at once), with {batch_key} rendered as that chunk's
+            items, one per line. Only for items that don't depend on each
+            other's results
+        batch_size: Items per chunk when batch_key is set
     """
     name: str
     prompt_template: str
@@ -38,6 +52,45 @@ class StageConfig:
     transitions: dict[str, str] = field(default_factory=dict)
     allowed_tools: list[str] | None = None
     denied_tools: list[str] | None = None
+    batch_key: str | None = None
+    batch_size: int = 1
+
+
+@dataclass
+class ParallelStageConfig:
+    """Configuration for a group of stages that run concurrently.
+
+    Members run side by side, each on its own copy of the context. The
+    group is complete when every member is; its signal is the first
+    incomplete member's signal, or the last member's when all complete,
+    and is looked up in the group's own transitions.
+
+    Attributes:
+        name: Unique identifier for the group, usable as a transition target
+        stages: Names of the member stages, in artifact merge order
+        transitions: Signal-to-stage mapping applied to the group's signal
+    """
+    name: str
+    stages: list[str]
+    transitions: dict[str, str] = field(default_factory=dict)
+
+
+def merge_results(results: list[CompletionResult]) -> CompletionResult:
+    """Combine results of work that ran side by side into one result.
+
+    Complete only when every result is; the signal is the first
+    incomplete result's, or the last result's when all complete.
+    Artifacts are merged in order, later results winning.
+    """
+    artifacts: dict[str, Any] = {}
+    for result in results:
+        artifacts.update(result.artifacts)
+    incomplete = next((r for r in results if not r.is_complete), None)
+    return CompletionResult(
+        is_complete=incomplete is None,
+        signal=(incomplete or results[-1]).signal,
+        artifacts=artifacts,
+    )
 
 
 class Stage:
@@ -88,10 +141,17 @@ class Stage:
             return self._template_cache
 
         template_path = Path(self.config.prompt_template)
+        st = stat_file(template_path)
 
         # Check if it's a file path
-        if template_path.is_file():
-            self._template_cache = template_path.read_text(encoding="utf-8")
+        if st is not None:
+            path = str(template_path)
+            text = _TEMPLATE_FILES.get(path, st)
+            if text is None:
+                with open(path, encoding="utf-8") as f:
+                    text = f.read()
+                _TEMPLATE_FILES.set(path, st, text)
+            self._template_cache = text
         elif template_path.suffix == ".md" and not template_path.exists():
             # Looks like a path but doesn't exist
             raise FileNotFoundError(
@@ -130,6 +190,7 @@ class Stage:
         self,
         context: dict[str, Any],
         stats: BuildStats | None = None,
+        prompt: str | None = None,
     ) -> tuple[CompletionResult, str]:
         """Run a single iteration of this stage.
 
@@ -138,11 +199,13 @@ class Stage:
         Args:
             context: Variables for prompt template substitution
             stats: Optional BuildStats for tracking usage
+            prompt: Prompt already built from context (built here if None)
 
         Returns:
             Tuple of (CompletionResult, full_output_text)
         """
-        prompt = self.build_prompt(context)
+        if prompt is None:
+            prompt = self.build_prompt(context)
 
         try:
             exit_code, output, stderr = self.runner.run_iteration(
@@ -157,10 +220,33 @@ class Stage:
 
         return result, output
 
+    async def run_iteration_async(
+        self,
+        context: dict[str, Any],
+        stats: BuildStats | None = None,
+        prompt: str | None = None,
+    ) -> tuple[CompletionResult, str]:
+        """Async variant of run_iteration, awaiting the runner directly."""
+        if prompt is None:
+            prompt = self.build_prompt(context)
+
+        try:
+            exit_code, output, stderr = await self.runner.run_iteration_async(
+                prompt, stats=stats, denied_tools=self.config.denied_tools
+            )
+        except Exception as e:
+            logger.error("Stage '%s' iteration failed: %s", self.name, e)
+            raise
+
+        result = self.config.completion.evaluate(output, exit_code)
+
+        return result, output
+
     def run(
         self,
         context: dict[str, Any],
         stats: BuildStats | None = None,
+        prompt: str | None = None,
     ) -> tuple[CompletionResult, int]:
         """Run this stage until completion or max iterations.
 
@@ -170,55 +256,183 @@ class Stage:
         Args:
             context: Variables for prompt template substitution
             stats: Optional BuildStats for tracking usage
+            prompt: Prompt already built from context (built here if None);
+                ignored for batched stages, which build one per chunk
 
         Returns:
             Tuple of (final_CompletionResult, iterations_completed)
         """
         stats = stats or BuildStats()
+        batch = self._batch_items(context)
+        if batch is not None:
+            return asyncio.run(self._run_batched(batch, context, stats))
+
         iterations = 0
         last_result = CompletionResult(is_complete=False)
 
         while iterations < self.config.max_iterations:
             iterations += 1
-            self._cumulative_iterations += 1
+            self._start_iteration()
 
-            # Notify iteration start
-            if self.on_iteration:
-                self.on_iteration(self._cumulative_iterations, self.config.max_iterations)
+            try:
+                # Built once: the context doesn't change between iterations
+                if prompt is None:
+                    prompt = self.build_prompt(context)
+                result, output = self.run_iteration(context, stats, prompt=prompt)
+            except Exception as e:
+                last_result = self._failed_result(e)
+                break
+
+            last_result = result
+            if self._check_result(result, stats):
+                break
 
-            # Print iteration header
-            print(f"\n{'='*60}")
-            print(f"🔄 [{self.name}] Iteration {self._cumulative_iterations}/{self.config.max_iterations}")
-            print(f"{'='*60}\n")
+        self._finish(iterations, last_result)
+        return last_result, iterations
+
+    async def run_async(
+        self,
+        context: dict[str, Any],
+        stats: BuildStats | None = None,
+    ) -> tuple[CompletionResult, int]:
+        """Async variant of run, so several stages can share one event loop.
+
+        Same iteration loop as run, but awaits the runner instead of
+        blocking on it. Used for parallel stage groups.
+        """
+        stats = stats or BuildStats()
+        batch = self._batch_items(context)
+        if batch is not None:
+            return await self._run_batched(batch, context, stats)
+
+        prompt = None
+        iterations = 0
+        last_result = CompletionResult(is_complete=False)
+
+        while iterations < self.config.max_iterations:
+            iterations += 1
+            self._start_iteration()
 
             try:
-                result, output = self.run_iteration(context, stats)
+                if prompt is None:
+                    prompt = self.build_prompt(context)
+                result, output = await self.run_iteration_async(context, stats, prompt=prompt)
             except Exception as e:
-                print(f"❌ Stage '{self.name}' failed: {e}", file=sys.stderr)
-                last_result = CompletionResult(
-                    is_complete=False,
-                    artifacts={"error": str(e)}
-                )
+                last_result = self._failed_result(e)
                 break
 
             last_result = result
+            if self._check_result(result, stats):
+                break
+
+        self._finish(iterations, last_result)
+        return last_result, iterations
+
+    def fail(self, error: Exception) -> tuple[CompletionResult, int]:
+        """End the stage as failed after one iteration, without the agent.
+
+        For errors found before the stage runs, such as a prompt that
+        can't be built, so they end the stage the same way as an error
+        raised inside run.
+        """
+        self._start_iteration()
+        last_result = self._failed_result(error)
+        self._finish(1, last_result)
+        return last_result, 1
+
+    def _batch_items(self, context: dict[str, Any]) -> list[Any] | None:
+        """Return the list to batch over, or None to run unbatched."""
+        if not self.config.batch_key:
+            return None
+        items = context.get(self.config.batch_key)
+        return items if isinstance(items, list) and items else None
 
-            # Check completion
-            if result.is_complete:
-                stats.iterations_completed += 1
-                print(f"\n✅ [{self.name}] Complete: {result.signal}")
+    async def _run_batched(
+        self,
+        items: list[Any],
+        context: dict[str, Any],
+        stats: BuildStats,
+    ) -> tuple[CompletionResult, int]:
+        """Run chunks of items as concurrent agent invocations.
+
+        Each iteration re-runs only the chunks that haven't completed yet;
+        the stage completes once every chunk has. Results are combined
+        with merge_results.
+        """
+        size = max(1, self.config.batch_size)
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        results: list[CompletionResult] = [CompletionResult(is_complete=False)] * len(chunks)
+        iterations = 0
+        last_result = CompletionResult(is_complete=False)
+
+        while iterations < self.config.max_iterations:
+            iterations += 1
+            self._start_iteration()
+
+            pending = [i for i, result in enumerate(results) if not result.is_complete]
+            try:
+                prompts = [
+                    self.build_prompt({
+                        **context,
+                        self.config.batch_key: "\n".join(str(item) for item in chunks[i]),
+                    })
+                    for i in pending
+                ]
+                outputs = await run_iterations_parallel(
+                    self.runner, prompts, stats=stats, denied_tools=self.config.denied_tools
+                )
+            except Exception as e:
+                logger.error("Stage '%s' iteration failed: %s", self.name, e)
+                last_result = self._failed_result(e)
                 break
-            else:
-                if result.signal:
-                    print(f"\n⏳ [{self.name}] Signal: {result.signal}, continuing...")
-                else:
-                    print(f"\n⏳ [{self.name}] No completion signal, continuing...")
 
-        if iterations >= self.config.max_iterations and not last_result.is_complete:
-            print(f"\n⚠️ [{self.name}] Max iterations ({self.config.max_iterations}) reached")
+            for i, (exit_code, output, _stderr) in zip(pending, outputs):
+                results[i] = self.config.completion.evaluate(output, exit_code)
+
+            last_result = merge_results(results)
+            if self._check_result(last_result, stats):
+                break
 
+        self._finish(iterations, last_result)
         return last_result, iterations
 
+    def _start_iteration(self) -> None:
+        """Count a new iteration, notify listeners and print its header."""
+        self._cumulative_iterations += 1
+
+        # Notify iteration start
+        if self.on_iteration:
+            self.on_iteration(self._cumulative_iterations, self.config.max_iterations)
+
+        print_banner(
+            f"🔄 [{self.name}] Iteration {self._cumulative_iterations}/{self.config.max_iterations}"
+        )
+
+    def _failed_result(self, error: Exception) -> CompletionResult:
+        """Report a failed iteration and build its result."""
+        print(f"❌ Stage '{self.name}' failed: {error}", file=sys.stderr)
+        return CompletionResult(
+            is_complete=False,
+            artifacts={"error": str(error)}
+        )
+
+    def _check_result(self, result: CompletionResult, stats: BuildStats) -> bool:
+        """Report an iteration's result; return True if the stage is complete."""
+        if result.is_complete:
+            stats.iterations_completed += 1
+            print(f"\n✅ [{self.name}] Complete: {result.signal}")
+            return True
+        if result.signal:
+            print(f"\n⏳ [{self.name}] Signal: {result.signal}, continuing...")
+        else:
+            print(f"\n⏳ [{self.name}] No completion signal, continuing...")
+        return False
+
+    def _finish(self, iterations: int, last_result: CompletionResult) -> None:
+        """Warn when the stage ran out of iterations without completing."""
+        if iterations >= self.config.max_iterations and not last_result.is_complete:
+            print(f"\n⚠️ [{self.name}] Max iterations ({self.config.max_iterations}) reached")
+
     def get_next_stage(self, result: CompletionResult) -> str | None:
         """Determine the next stage based on completion signal.
 
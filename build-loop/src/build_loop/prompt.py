@@ -8,8 +8,12 @@ Only file paths are substituted at runtime.
 import logging
 from pathlib import Path
 
+from .filecache import FileCache, stat_file
+
 logger = logging.getLogger(__name__)
 
+_TEMPLATE_CACHE: FileCache[str] = FileCache()
+
 
 def _get_prompt_path() -> Path:
     """Get the path to the build prompt template file."""
@@ -19,6 +23,9 @@ def _get_prompt_path() -> Path:
 def _load_prompt_template() -> str:
     """Load the prompt template from the markdown file.
 
+    The file is only re-read when its mtime or size changes, so each
+    iteration costs one stat instead of a full read.
+
     Returns:
         The raw prompt template with {variable} placeholders.
 
@@ -26,12 +33,18 @@ def _load_prompt_template() -> str:
         FileNotFoundError: If the prompt file is missing.
     """
     prompt_path = _get_prompt_path()
-    if not prompt_path.is_file():
+    st = stat_file(prompt_path)
+    if st is None:
         raise FileNotFoundError(
             f"Build prompt template not found at: {prompt_path}\n"
             "Expected file: cli/build/prompts/build.md"
         )
-    return prompt_path.read_text(encoding="utf-8")
+
+    template = _TEMPLATE_CACHE.get(str(prompt_path), st)
+    if template is None:
+        template = prompt_path.read_text(encoding="utf-8")
+        _TEMPLATE_CACHE.set(str(prompt_path), st, template)
+    return template
 
 
 def reset_progress_file(progress_path: str) -> None:
@@ -12,6 +12,12 @@ import yaml
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+try:
+    # libyaml-backed loader; PyYAML can be built without it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - exercised when libyaml is absent
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/pipelines", tags=["pipelines"])
@@ -160,7 +166,7 @@ def load_pipeline_file(path: Path) -> dict[str, Any]:
         raise FileNotFoundError(f"Pipeline not found: {path}")
 
     content = path.read_text(encoding="utf-8")
-    return yaml.safe_load(content) or {}
+    return yaml.load(content, Loader=_YamlLoader) or {}
 
 
 def save_pipeline_file(path: Path, config: dict[str, Any]) -> None:
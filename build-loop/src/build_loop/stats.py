@@ -52,6 +52,8 @@ def _resolve_model_family(model_id: str) -> str:
 @dataclass
 class BuildStats:
     """Track statistics across the build."""
+    # Wall-clock on purpose: saved to disk and compared after a resume in a
+    # new process, where monotonic clocks don't share an epoch
     start_time: float = field(default_factory=time.time)
     iterations_completed: int = 0
     iterations_failed: int = 0
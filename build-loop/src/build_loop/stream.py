@@ -5,6 +5,7 @@ Handles real-time parsing and display of stream-json events from Claude CLI.
 """
 
 import logging
+from collections.abc import Callable
 
 from .stats import BuildStats
 
@@ -78,14 +79,14 @@ def _extract_tool_result_text(content) -> str:
 
 
 def process_stream_event(
-    event: dict, text_buffer: list[str], stats: BuildStats | None = None
+    event: dict, emit: Callable[[str], None], stats: BuildStats | None = None
 ) -> None:
     """
     Process a single stream-json event and display formatted output.
 
     Args:
         event: Parsed JSON event from Claude stream
-        text_buffer: List to accumulate assistant text for promise detection
+        emit: Callback receiving assistant text for promise detection
         stats: Optional BuildStats to track token usage and tool calls
     """
     event_type = event.get("type")
@@ -106,7 +107,7 @@ def process_stream_event(
                 text = item.get("text", "")
                 if text.strip():
                     print(f"💬 {text}")
-                    text_buffer.append(text)
+                    emit(text)
 
             elif item_type == "tool_use":
                 tool_name = item.get("name", "?")
@@ -178,17 +179,21 @@ def process_stream_event(
         # Result event fires once at end of session with authoritative
         # totals for all API turns in this iteration
 
-        # [🪳 TEMP STATS] Log full result event to diagnose token counting
+        # [🪳 TEMP STATS] Diagnostics below build their arguments eagerly
+        # (key lists, dict filters, calculate_cost), so only do that work
+        # when INFO is actually enabled.
         usage = event.get("usage", {})
-        logger.info(
-            "[🪳 TEMP STATS] result event: usage_keys=%s usage=%s "
-            "total_cost_usd=%s num_turns=%s",
-            list(usage.keys()),
-            {k: v for k, v in usage.items() if isinstance(v, (int, float))},
-            event.get("total_cost_usd"),
-            event.get("num_turns"),
-        )
-        if stats:
+        trace = logger.isEnabledFor(logging.INFO)
+        if trace:
+            logger.info(
+                "[🪳 TEMP STATS] result event: usage_keys=%s usage=%s "
+                "total_cost_usd=%s num_turns=%s",
+                list(usage.keys()),
+                {k: v for k, v in usage.items() if isinstance(v, (int, float))},
+                event.get("total_cost_usd"),
+                event.get("num_turns"),
+            )
+        if stats and trace:
             # [🪳 TEMP STATS] Log pre-update state
             logger.info(
                 "[🪳 TEMP STATS] pre-update: input=%d output=%d "
@@ -209,7 +214,7 @@ def process_stream_event(
         if stats and "num_turns" in event:
             stats.total_api_turns += event["num_turns"]
 
-        if stats:
+        if stats and trace:
             # [🪳 TEMP STATS] Log post-update state
             logger.info(
                 "[🪳 TEMP STATS] post-update: input=%d output=%d "
@@ -0,0 +1,263 @@
+"""Tests for agent subprocess stream handling in agent.py."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from build_loop import agent
+from build_loop.agent import ClaudeRunner, CodexRunner
+
+
+def _fake_process(chunks: list[bytes], returncode: int = 0, stderr: bytes = b""):
+    """Create a mock asyncio subprocess whose stdout yields the given chunks."""
+    proc = MagicMock()
+    proc.stdin = MagicMock(drain=AsyncMock())
+    proc.stdout = MagicMock(read=AsyncMock(side_effect=[*chunks, b""]))
+    proc.stderr = MagicMock(read=AsyncMock(return_value=stderr))
+    proc.returncode = returncode
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
+def _run(chunks: list[bytes], **kwargs):
+    with patch("asyncio.create_subprocess_exec") as mock_exec:
+        mock_exec.return_value = _fake_process(chunks, **kwargs)
+        return ClaudeRunner().run_iteration("prompt")
+
+
+def _text_event(text: str) -> bytes:
+    return (
+        b'{"type":"assistant","message":{"content":[{"type":"text","text":"'
+        + text.encode()
+        + b'"}]}}\n'
+    )
+
+
+class TestStreamChunking:
+    """Lines are reassembled correctly regardless of read boundaries."""
+
+    def test_multiple_events_in_one_chunk(self, capsys):
+        """Happy: several events in one read are all processed in order."""
+        exit_code, output, _ = _run([_text_event("one") + _text_event("two")])
+        assert exit_code == 0
+        assert output == "one\ntwo"
+
+    def test_event_split_across_chunks(self, capsys):
+        """Happy: an event split over several reads is parsed once complete."""
+        data = _text_event("split [[PROMISE:TASK_COMPLETE]]")
+        chunks = [data[:10], data[10:30], data[30:]]
+        _, output, _ = _run(chunks)
+        assert output == "split [[PROMISE:TASK_COMPLETE]]"
+
+    def test_trailing_line_without_newline(self, capsys):
+        """Edge: a final line with no newline is still handled."""
+        _, output, _ = _run([_text_event("first"), b"tail text"])
+        assert output == "first\ntail text"
+
+    def test_non_json_lines_fall_back_to_text(self, capsys):
+        """Failure: non-JSON lines are echoed and kept; blank lines dropped."""
+        exit_code, output, stderr = _run(
+            [b"\n  plain output  \n\n"], returncode=1, stderr=b"boom"
+        )
+        assert exit_code == 1
+        assert output == "plain output"
+        assert stderr == "boom"
+        assert "plain output" in capsys.readouterr().out
+
+
+class TestPromptWrite:
+    """The prompt is written to stdin in bounded chunks."""
+
+    def test_large_prompt_written_in_chunks(self):
+        """Happy: a multi-chunk prompt arrives intact, encoded as UTF-8."""
+        from build_loop.agent import _PROMPT_CHUNK_CHARS
+
+        prompt = "é" * (_PROMPT_CHUNK_CHARS * 2 + 5)
+        proc = _fake_process([])
+        with patch("asyncio.create_subprocess_exec", return_value=proc):
+            ClaudeRunner().run_iteration(prompt)
+
+        writes = [c.args[0] for c in proc.stdin.write.call_args_list]
+        assert len(writes) == 3
+        assert b"".join(writes).decode() == prompt
+        proc.stdin.close.assert_called_once()
+
+
+class TestResolveBinary:
+    """Agent binary lookups are cached once found."""
+
+    def test_hit_is_cached(self):
+        """Happy: a found binary is looked up on PATH only once."""
+        with patch.dict(agent._BINARY_PATHS, clear=True), \
+             patch("shutil.which", return_value="/usr/bin/claude") as mock_which:
+            assert agent._resolve_binary("claude") == "/usr/bin/claude"
+            assert agent._resolve_binary("claude") == "/usr/bin/claude"
+            assert mock_which.call_count == 1
+
+    def test_miss_is_not_cached(self):
+        """Failure: a missing binary is re-checked so later installs are seen."""
+        with patch.dict(agent._BINARY_PATHS, clear=True), \
+             patch("shutil.which", side_effect=[None, "/opt/bin/codex"]):
+            assert CodexRunner().check_available() is False
+            assert CodexRunner().check_available() is True
+
+
+class TestBytesMode:
+    """Agent output is consumed as bytes, never through a text wrapper."""
+
+    def test_subprocess_spawned_without_text_mode(self):
+        """Happy: no text/encoding options are passed to the spawn call."""
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_exec.return_value = _fake_process([])
+            ClaudeRunner().run_iteration("prompt")
+
+        kwargs = mock_exec.call_args.kwargs
+        assert not {"text", "encoding", "errors", "universal_newlines"} & kwargs.keys()
+
+    def test_parser_receives_bytes(self):
+        """Happy: JSON lines reach the parser as raw bytes."""
+        seen = []
+
+        def fake_loads(raw):
+            seen.append(type(raw))
+            return {"type": "system"}
+
+        with patch.object(agent, "_json_loads", fake_loads):
+            _run([b'{"type":"system"}\n'])
+
+        assert seen and all(t in (bytes, bytearray) for t in seen)
+
+
+class TestStatsOnlySkip:
+    """Stats-only events are skipped before parsing when nobody needs them."""
+
+    _RESULT = b'{"type":"result","usage":{"input_tokens":5},"total_cost_usd":0.5}\n'
+
+    def test_result_parsed_when_stats_given(self):
+        """Happy: with stats, the result event updates usage."""
+        from build_loop.stats import BuildStats
+
+        stats = BuildStats()
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_exec.return_value = _fake_process([self._RESULT])
+            ClaudeRunner().run_iteration("prompt", stats=stats)
+        assert stats.total_input_tokens == 5
+        assert stats.total_cost_usd == 0.5
+
+    def test_result_skipped_without_stats(self):
+        """Happy: without stats, the result line never reaches the parser."""
+        with patch.object(agent, "_json_loads", side_effect=AssertionError):
+            _, output, _ = _run([self._RESULT])
+        assert output == ""
+
+
+class TestRunIterationsParallel:
+    """run_iterations_parallel bounds concurrency and preserves order."""
+
+    def test_results_in_prompt_order_with_bounded_concurrency(self):
+        """Happy: results line up with prompts; in-flight count never exceeds the limit."""
+        from build_loop.agent import AgentRunner, run_iterations_parallel
+
+        in_flight = 0
+        peak = 0
+
+        class _SlowRunner(AgentRunner):
+            name = "slow"
+
+            def check_available(self):
+                return True
+
+            async def run_iteration_async(self, prompt, timeout=None, stats=None, denied_tools=None):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01 if prompt == "p0" else 0)
+                in_flight -= 1
+                return 0, f"out-{prompt}", ""
+
+        prompts = [f"p{i}" for i in range(6)]
+        results = asyncio.run(run_iterations_parallel(_SlowRunner(), prompts, concurrency=2))
+
+        assert [r[1] for r in results] == [f"out-{p}" for p in prompts]
+        assert peak == 2
+
+
+def _hanging_process():
+    """Create a mock subprocess whose stdout never ends until it is killed."""
+    proc = _fake_process([])
+    proc.returncode = None
+
+    async def never(*_args):
+        await asyncio.Event().wait()
+
+    def kill():
+        proc.returncode = -9
+
+    proc.stdout.read = never
+    proc.kill = MagicMock(side_effect=kill)
+    return proc
+
+
+class TestSubprocessCleanup:
+    """The agent process is killed whenever the iteration doesn't finish."""
+
+    def test_cancelled_iteration_kills_process(self):
+        """Failure: cancelling a running iteration kills and reaps its process."""
+        proc = _hanging_process()
+
+        async def main():
+            task = asyncio.create_task(ClaudeRunner().run_iteration_async("prompt"))
+            await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        with patch("asyncio.create_subprocess_exec", return_value=proc):
+            asyncio.run(main())
+
+        proc.kill.assert_called_once()
+        proc.wait.assert_awaited()
+
+    def test_finished_process_not_killed(self):
+        """Happy: a process that exited on its own is left alone."""
+        proc = _fake_process([])
+        with patch("asyncio.create_subprocess_exec", return_value=proc):
+            ClaudeRunner().run_iteration("prompt")
+        proc.kill.assert_not_called()
+
+
+class TestGatherOrCancel:
+    """gather_or_cancel stops the other awaitables after a failure."""
+
+    def test_failure_cancels_siblings(self):
+        """Failure: the first error cancels the rest before propagating."""
+        from build_loop.agent import gather_or_cancel
+
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def boom():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        async def main():
+            with pytest.raises(RuntimeError):
+                await gather_or_cancel(slow(), boom())
+            assert cancelled == [True]
+
+        asyncio.run(main())
+
+    def test_results_in_order(self):
+        """Happy: without errors it returns results like gather."""
+        from build_loop.agent import gather_or_cancel
+
+        async def value(v):
+            return v
+
+        assert asyncio.run(gather_or_cancel(value(1), value(2))) == [1, 2]
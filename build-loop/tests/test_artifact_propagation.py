@@ -270,6 +270,29 @@ class TestAfterStageHookCapturesSubagentCommits:
 
         assert context["review_fixes_path"] == "/project/docs/review_fixes.md"
 
+    def test_review_fixes_path_recomputed_only_when_tasks_file_changes(self):
+        """Happy: the path is derived once per tasks file, then reused."""
+        from build_loop.hooks import _set_review_fixes_path
+
+        context = {"tasks_file_path": "/project/docs/tasks.md"}
+        _set_review_fixes_path(context)
+        with patch("build_loop.hooks.os.path.join") as mock_join:
+            _set_review_fixes_path(context)
+        mock_join.assert_not_called()
+        assert context["review_fixes_path"] == "/project/docs/review_fixes.md"
+
+        context["tasks_file_path"] = "/other/tasks.md"
+        _set_review_fixes_path(context)
+        assert context["review_fixes_path"] == "/other/review_fixes.md"
+
+    def test_review_fixes_path_for_bare_tasks_filename(self):
+        """Happy: a tasks file with no directory puts review fixes beside it."""
+        from build_loop.hooks import _set_review_fixes_path
+
+        context = {"tasks_file_path": "tasks.md"}
+        _set_review_fixes_path(context)
+        assert context["review_fixes_path"] == "review_fixes.md"
+
     def test_handles_missing_start_commit(self):
         """Failure: gracefully handles missing _phase_start_commit."""
         context = {"tasks_file_path": "/tmp/tasks.md"}
@@ -400,3 +423,29 @@ class TestEndToEndArtifactPropagation:
             "2.1: Implement final feature"
         )
         assert "src/main.py" in context["changed_files"]
+
+
+class TestAfterStageHookValidatedPhases:
+    """validate stage tracks validated phases without redundant rebuilds."""
+
+    def _validate(self, context, phase):
+        context["phase_completed"] = phase
+        after_stage_hook(
+            "validate", context, CompletionResult(is_complete=True, signal="VALIDATED")
+        )
+
+    def test_phases_accumulate_once(self):
+        """Happy: each new phase is appended once and the display string follows."""
+        context = {}
+        self._validate(context, "Phase 1")
+        self._validate(context, "Phase 2")
+        self._validate(context, "Phase 1")
+        assert context["_validated_phases"] == ["Phase 1", "Phase 2"]
+        assert context["validated_phases"] == "Phase 1, Phase 2"
+
+    def test_all_phase_sets_default_display(self):
+        """Failure: phase 'all' is not tracked but the display still defaults to None."""
+        context = {}
+        self._validate(context, "all")
+        assert context["_validated_phases"] == []
+        assert context["validated_phases"] == "None"
@@ -0,0 +1,27 @@
+"""Tests for the shared console banner helper."""
+
+import sys
+from unittest.mock import patch
+
+from build_loop.banner import HR, print_banner
+
+
+class TestPrintBanner:
+    """Tests for print_banner."""
+
+    def test_single_write_with_rules(self, capsys):
+        """Happy: lines are framed by rules with blank lines around the banner."""
+        with patch("builtins.print", wraps=print) as mock_print:
+            print_banner("✅ DONE", "   Detail: x")
+
+        assert mock_print.call_count == 1
+        assert HR == "=" * 60
+        assert capsys.readouterr().out == f"\n{HR}\n✅ DONE\n   Detail: x\n{HR}\n\n"
+
+    def test_writes_to_given_stream(self, capsys):
+        """Happy: file= sends the banner to stderr instead of stdout."""
+        print_banner("❌ ERROR", file=sys.stderr)
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == f"\n{HR}\n❌ ERROR\n{HR}\n\n"
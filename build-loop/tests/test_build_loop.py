@@ -0,0 +1,44 @@
+"""Tests for run_build_loop console output in loop.py."""
+
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+from build_loop import loop
+
+
+def _runner(**kwargs):
+    runner = MagicMock(check_available=MagicMock(return_value=True), **kwargs)
+    runner.name = "claude"
+    return runner
+
+
+class TestStatusBlocks:
+    """Multi-line status and error blocks are written in one call."""
+
+    def test_timeout_error_is_one_stderr_write(self, capsys):
+        """Failure: the timeout block reaches stderr through a single print."""
+        runner = _runner(run_iteration=MagicMock(side_effect=subprocess.TimeoutExpired("claude", 1)))
+        with patch.object(loop, "get_agent", return_value=runner), \
+             patch.object(loop, "build_prompt", return_value="prompt"), \
+             patch("builtins.print", wraps=print) as mock_print:
+            exit_code, _ = loop.run_build_loop("tasks.md", [], 1)
+
+        assert exit_code == 124
+        stderr_calls = [c for c in mock_print.call_args_list if c.kwargs.get("file") is sys.stderr]
+        assert len(stderr_calls) == 1
+        err = capsys.readouterr().err
+        assert "execution timed out" in err
+        assert "Iteration: 1/1\n\nThe agent subprocess" in err
+
+    def test_build_complete_output_unchanged(self, capsys):
+        """Happy: header and completion banner keep their line layout."""
+        runner = _runner(run_iteration=MagicMock(return_value=(0, "[[PROMISE:BUILD_COMPLETE]]", "")))
+        with patch.object(loop, "get_agent", return_value=runner), \
+             patch.object(loop, "build_prompt", return_value="prompt"):
+            exit_code, completed = loop.run_build_loop("tasks.md", [], 3)
+
+        assert (exit_code, completed) == (0, 1)
+        out = capsys.readouterr().out
+        assert "🔄 Iteration 1/3 [claude]\n   Complete task: [[PROMISE:TASK_COMPLETE]]\n" in out
+        assert "✅ BUILD COMPLETE - All tasks finished!\n" + "=" * 60 in out
@@ -0,0 +1,52 @@
+"""Tests that importing cli.py stays light (startup path)."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import build_loop
+
+# Modules cli.py imports inside the functions that need them. Pulling any
+# of these in at module top would put it back on every CLI invocation.
+_DEFERRED = (
+    "asyncio",
+    "datetime",
+    "logging",
+    "subprocess",
+    "build_loop.agent",
+    "build_loop.hooks",
+    "build_loop.loop",
+    "build_loop.manifest",
+    "build_loop.pipeline",
+    "build_loop.prompt",
+    "build_loop.stats",
+    "build_loop.validate",
+)
+
+
+def _modules_after_import(module: str) -> set[str]:
+    """Import module in a fresh interpreter and return sys.modules keys."""
+    src = str(Path(build_loop.__file__).resolve().parent.parent)
+    pythonpath = os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": pythonpath}
+    out = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print('\\n'.join(sys.modules))"],
+        capture_output=True, text=True, check=True, env=env,
+    ).stdout
+    return set(out.split())
+
+
+class TestCliImportsDeferred:
+    """Importing build_loop.cli leaves heavy modules unloaded."""
+
+    def test_cli_import_defers_heavy_modules(self):
+        """Happy: none of the function-local imports load at import time."""
+        loaded = _modules_after_import("build_loop.cli")
+        assert "build_loop.cli" in loaded
+        assert not loaded & set(_DEFERRED)
+
+    def test_package_import_is_lazy(self):
+        """Happy: importing the package itself loads no submodules."""
+        loaded = _modules_after_import("build_loop")
+        assert not {m for m in loaded if m.startswith("build_loop.")}
@@ -0,0 +1,236 @@
+"""Tests for argument parsing and small output helpers in cli.py."""
+
+import pytest
+
+from build_loop.cli import _sniff_subcommand, parse_args
+
+
+class TestSniffSubcommand:
+    """Tests for _sniff_subcommand."""
+
+    def test_detects_leading_subcommand(self):
+        """Happy: resume/serve as the first token are recognized."""
+        assert _sniff_subcommand(["resume", "-y"]) == "resume"
+        assert _sniff_subcommand(["serve"]) == "serve"
+
+    def test_detects_leading_manifest(self):
+        """Happy: a leading .md path selects manifest mode."""
+        assert _sniff_subcommand(["docs/build.md", "--agent", "codex"]) == "manifest"
+
+    def test_detects_leading_pipeline_yaml(self):
+        """Happy: a leading .yaml/.yml path selects pipeline mode."""
+        assert _sniff_subcommand(["pipeline.yaml"]) == "pipeline"
+        assert _sniff_subcommand(["p.yml", "--tasks", "t.md"]) == "pipeline"
+
+    def test_ignores_non_leading_tokens(self):
+        """Failure: flag values are not treated as subcommands or manifests."""
+        assert _sniff_subcommand([]) is None
+        assert _sniff_subcommand(["--tasks", "resume"]) is None
+        assert _sniff_subcommand(["--tasks", "docs/tasks.md"]) is None
+        assert _sniff_subcommand(["--pipeline", "pipeline.yaml"]) is None
+
+    def test_help_uses_full_parser(self):
+        """Failure: help requests always get the full parser."""
+        assert _sniff_subcommand(["serve", "--help"]) is None
+        assert _sniff_subcommand(["resume", "-h"]) is None
+
+
+class TestParseArgs:
+    """Tests for parse_args with trimmed subcommand parsers."""
+
+    def test_resume_parses_its_flags(self):
+        """Happy: resume gets the flags run_resume and run_manifest read."""
+        args = parse_args(["resume", "-y", "--agent", "codex", "--no-notify"])
+        assert args.manifest_or_command == "resume"
+        assert args.yes is True
+        assert args.agent == "codex"
+        assert args.no_notify is True
+        assert args.max_iterations == 10
+        assert not hasattr(args, "port")
+
+    def test_serve_parses_host_and_port(self):
+        """Happy: serve gets only host and port."""
+        args = parse_args(["serve", "--port", "9000"])
+        assert args.manifest_or_command == "serve"
+        assert args.port == 9000
+        assert args.host == "127.0.0.1"
+        assert not hasattr(args, "tasks")
+
+    def test_manifest_parses_build_overrides(self):
+        """Happy: a manifest run gets the flags run_manifest reads."""
+        args = parse_args(["docs/build.md", "--validate", "--max-iterations", "3"])
+        assert args.manifest_or_command == "docs/build.md"
+        assert args.validate is True
+        assert args.max_iterations == 3
+        assert args.agent == "claude"
+        assert not hasattr(args, "yes")
+
+    def test_pipeline_yaml_becomes_pipeline_arg(self):
+        """Happy: a positional YAML is parsed as --pipeline with build flags."""
+        args = parse_args(["p.yaml", "--tasks", "t.md", "--context", "a.md", "--validate"])
+        assert args.pipeline == "p.yaml"
+        assert args.manifest_or_command is None
+        assert args.tasks == "t.md"
+        assert args.context == ["a.md"]
+        assert args.validate is True
+        assert args.plan is False and args.ship is False
+        assert not hasattr(args, "port")
+
+    def test_pipeline_yaml_with_other_flags_uses_full_parser(self):
+        """Happy: flags outside pipeline mode still parse, YAML still moved."""
+        args = parse_args(["p.yml", "--plan"])
+        assert args.pipeline == "p.yml"
+        assert args.manifest_or_command is None
+        assert args.plan is True
+        assert args.scope_name is None
+
+        args = parse_args(["--agent", "codex", "p.yaml"])
+        assert args.pipeline == "p.yaml"
+        assert args.agent == "codex"
+
+    def test_unknown_flag_falls_back_to_full_parser(self):
+        """Happy: flags outside the subcommand's set still parse fully."""
+        args = parse_args(["resume", "--tasks", "t.md"])
+        assert args.manifest_or_command == "resume"
+        assert args.tasks == "t.md"
+        assert args.port == 8000
+
+    def test_invalid_flag_errors(self):
+        """Failure: a flag no parser knows still exits with an error."""
+        with pytest.raises(SystemExit):
+            parse_args(["serve", "--bogus"])
+
+    def test_ambiguous_abbreviation_rejected(self, capsys):
+        """Failure: a prefix ambiguous in the full flag set errors in a subcommand too."""
+        with pytest.raises(SystemExit):
+            parse_args(["serve", "--p", "9000"])
+        assert "ambiguous option" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("argv", [
+        ["serve", "--por", "9000"],
+        ["resume", "--max", "3", "--ag", "codex"],
+        ["docs/build.md", "--no-n", "--val"],
+    ])
+    def test_abbreviations_parse_like_full_parser(self, argv):
+        """Happy: unambiguous abbreviations give the same values as the full parser."""
+        from build_loop.cli import _build_parser
+
+        args = parse_args(argv)
+        full = _build_parser().parse_args(argv)
+        assert {k: getattr(full, k) for k in vars(args)} == vars(args)
+
+    def test_bad_value_errors_like_full_parser(self, capsys):
+        """Failure: a value the trimmed parser rejects gets the full parser's error."""
+        with pytest.raises(SystemExit):
+            parse_args(["serve", "--port", "abc"])
+        assert "invalid int value: 'abc'" in capsys.readouterr().err
+
+    def test_defaults_to_sys_argv(self, monkeypatch):
+        """Happy: with no argv, sys.argv[1:] is parsed."""
+        monkeypatch.setattr("sys.argv", ["spectre-build", "--plan"])
+        args = parse_args()
+        assert args.plan is True
+        assert args.manifest_or_command is None
+
+
+class TestHelpEpilog:
+    """Help output always carries the examples epilog."""
+
+    @pytest.mark.parametrize("argv", [
+        ["--help"], ["--he"], ["resume", "-h"],
+        ["resume", "-yh"], ["resume", "-hy"], ["serve", "--he"], ["notes.md", "--hel"],
+    ])
+    def test_help_includes_examples(self, argv, capsys):
+        """Happy: full, abbreviated, grouped and subcommand help all show the full help."""
+        with pytest.raises(SystemExit):
+            parse_args(argv)
+        out = capsys.readouterr().out
+        assert "Examples:" in out
+        assert "spectre-build serve" in out
+        assert "--plan" in out
+
+
+class TestNormalizePath:
+    """Tests for normalize_path."""
+
+    def test_strips_single_at_prefix(self):
+        """Happy: one leading @ is removed."""
+        from build_loop.cli import normalize_path
+
+        assert normalize_path("@docs/scope.md") == "docs/scope.md"
+        assert normalize_path("@@x.md") == "@x.md"
+
+    def test_other_paths_unchanged(self):
+        """Failure: paths without a leading @ are returned as-is."""
+        from build_loop.cli import normalize_path
+
+        assert normalize_path("docs/a@b.md") == "docs/a@b.md"
+        assert normalize_path("") == ""
+
+
+class TestResolvePaths:
+    """Tests for _resolve_paths."""
+
+    def test_matches_path_resolve_through_symlinks(self, tmp_path, monkeypatch):
+        """Happy: results equal Path.resolve(), including symlinked dirs and files."""
+        from pathlib import Path
+
+        from build_loop.cli import _resolve_paths
+
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "a.md").write_text("a")
+        (tmp_path / "linkdir").symlink_to(real)
+        (tmp_path / "link.md").symlink_to(real / "a.md")
+        monkeypatch.chdir(tmp_path)
+
+        paths = ["linkdir/a.md", "link.md", "linkdir/../real/a.md", "missing.md"]
+        expected = list(dict.fromkeys(str(Path(p).resolve()) for p in paths))
+        assert _resolve_paths(paths) == expected
+        assert len(expected) == 2
+
+    def test_duplicates_dropped_in_order(self, tmp_path, monkeypatch):
+        """Happy: the same file given twice is resolved and returned once."""
+        from build_loop.cli import _resolve_paths
+
+        monkeypatch.chdir(tmp_path)
+        result = _resolve_paths(["b.md", "a.md", "./b.md", str(tmp_path / "a.md")])
+        assert [p.rsplit("/", 1)[1] for p in result] == ["b.md", "a.md"]
+
+    def test_dotdot_through_symlink_not_taken_for_duplicate(self, tmp_path, monkeypatch):
+        """Failure: paths that only look alike before resolving are both kept."""
+        from build_loop.cli import _resolve_paths
+
+        (tmp_path / "other" / "deep").mkdir(parents=True)
+        (tmp_path / "other" / "x.md").write_text("other")
+        (tmp_path / "x.md").write_text("here")
+        (tmp_path / "sym").symlink_to(tmp_path / "other" / "deep")
+        monkeypatch.chdir(tmp_path)
+
+        # sym/../x.md is other/x.md, not ./x.md
+        assert _resolve_paths(["sym/../x.md", "x.md"]) == [
+            str((tmp_path / "other" / "x.md").resolve()),
+            str((tmp_path / "x.md").resolve()),
+        ]
+
+    def test_empty_list(self):
+        """Failure: no paths gives an empty result."""
+        from build_loop.cli import _resolve_paths
+
+        assert _resolve_paths([]) == []
+
+
+class TestFormatContextList:
+    """Tests for _format_context_list."""
+
+    def test_bullets_each_path(self):
+        """Happy: each path becomes a backticked bullet on its own line."""
+        from build_loop.cli import _format_context_list
+
+        assert _format_context_list(["a.md", "b.md"]) == "- `a.md`\n- `b.md`"
+
+    def test_empty_is_none(self):
+        """Failure: no context files formats as the literal None."""
+        from build_loop.cli import _format_context_list
+
+        assert _format_context_list([]) == "None"
@@ -0,0 +1,122 @@
+"""Tests for Codex credential sync in codex_env.py."""
+
+import os
+
+import pytest
+
+from build_loop.codex_env import CODEX_SUBAGENT_DIR, setup_codex_home
+
+
+class TestSetupCodexHome:
+    """Tests for setup_codex_home with injected directories."""
+
+    def test_copies_credentials_into_workspace(self, tmp_path):
+        """Happy: config.toml and auth.json are synced under the given cwd."""
+        home = tmp_path / "home"
+        (home / ".codex").mkdir(parents=True)
+        (home / ".codex" / "config.toml").write_text("model = 'x'")
+        (home / ".codex" / "auth.json").write_text("{}")
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+
+        result = setup_codex_home(cwd=workspace, home=home)
+
+        assert result == (workspace / CODEX_SUBAGENT_DIR).resolve()
+        assert (result / "config.toml").read_text() == "model = 'x'"
+        assert (result / "auth.json").read_text() == "{}"
+
+    def test_missing_or_symlinked_credentials_skipped(self, tmp_path):
+        """Failure: absent files and symlinks are not copied."""
+        home = tmp_path / "home"
+        (home / ".codex").mkdir(parents=True)
+        target = tmp_path / "secret"
+        target.write_text("x")
+        (home / ".codex" / "auth.json").symlink_to(target)
+
+        result = setup_codex_home(cwd=tmp_path, home=home)
+
+        assert result.is_dir()
+        assert not (result / "config.toml").exists()
+        assert not (result / "auth.json").exists()
+
+
+class TestSafeCopyFile:
+    """Tests for _safe_copy_file."""
+
+    def test_small_file_keeps_mode_and_mtime(self, tmp_path):
+        """Happy: small files are copied with permissions and mtime preserved."""
+        from build_loop.codex_env import _safe_copy_file
+
+        src = tmp_path / "auth.json"
+        src.write_text('{"token": "x"}')
+        src.chmod(0o640)
+        os.utime(src, ns=(1_000_000_000, 2_000_000_000))
+        dst = tmp_path / "copy.json"
+
+        assert _safe_copy_file(src, dst) is True
+        assert dst.read_text() == '{"token": "x"}'
+        assert dst.stat().st_mode & 0o777 == 0o640
+        assert dst.stat().st_mtime_ns == 2_000_000_000
+
+    def test_large_file_uses_copy2(self, tmp_path):
+        """Happy: files past the small-file limit fall back to shutil.copy2."""
+        from unittest.mock import patch
+
+        from build_loop.codex_env import _SMALL_FILE_BYTES, _safe_copy_file
+
+        src = tmp_path / "big.toml"
+        src.write_bytes(b"x" * _SMALL_FILE_BYTES)
+        with patch("build_loop.codex_env.shutil.copy2") as mock_copy:
+            assert _safe_copy_file(src, tmp_path / "out") is True
+        mock_copy.assert_called_once()
+
+    @pytest.mark.skipif(not hasattr(os, "O_NOFOLLOW"), reason="needs O_NOFOLLOW")
+    def test_symlinked_destination_refused(self, tmp_path):
+        """Failure: a symlink planted at the destination is not written through."""
+        from build_loop.codex_env import _safe_copy_file
+
+        src = tmp_path / "auth.json"
+        src.write_text("secret")
+        victim = tmp_path / "victim"
+        victim.write_text("original")
+        dst = tmp_path / "dst"
+        dst.symlink_to(victim)
+
+        assert _safe_copy_file(src, dst) is False
+        assert victim.read_text() == "original"
+
+    def test_directory_and_missing_source(self, tmp_path):
+        """Failure: non-regular and missing sources are skipped."""
+        from build_loop.codex_env import _safe_copy_file
+
+        assert _safe_copy_file(tmp_path, tmp_path / "a") is False
+        assert _safe_copy_file(tmp_path / "missing", tmp_path / "b") is False
+
+    def test_unchanged_source_not_recopied(self, tmp_path):
+        """Happy: a second sync of an unchanged file skips the copy."""
+        from unittest.mock import patch
+
+        from build_loop.codex_env import _safe_copy_file
+
+        src = tmp_path / "config.toml"
+        src.write_text("a = 1")
+        dst = tmp_path / "copy.toml"
+        assert _safe_copy_file(src, dst) is True
+
+        with patch("build_loop.codex_env._copy_small_file") as mock_copy:
+            assert _safe_copy_file(src, dst) is True
+        mock_copy.assert_not_called()
+
+    def test_changed_source_is_recopied(self, tmp_path):
+        """Failure: a source with a new mtime is copied again."""
+        from build_loop.codex_env import _safe_copy_file
+
+        src = tmp_path / "auth.json"
+        src.write_text("old")
+        dst = tmp_path / "copy.json"
+        _safe_copy_file(src, dst)
+
+        src.write_text("new")
+        os.utime(src, ns=(0, dst.stat().st_mtime_ns + 1_000_000))
+        assert _safe_copy_file(src, dst) is True
+        assert dst.read_text() == "new"
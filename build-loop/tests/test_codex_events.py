@@ -0,0 +1,112 @@
+"""Tests for CodexRunner JSONL event dispatch and command formatting."""
+
+from build_loop.agent import CodexRunner, _codex_env, _format_codex_command
+from build_loop.stats import BuildStats
+
+
+def _process(event, stats=None):
+    """Run one event through CodexRunner._process_event, return emitted text."""
+    emitted: list[str] = []
+    CodexRunner()._process_event(event, emitted.append, stats)
+    return emitted
+
+
+class TestCodexEventDispatch:
+    """Tests for CodexRunner._process_event routing."""
+
+    def test_agent_message_is_emitted(self, capsys):
+        """Happy: agent_message text is printed and emitted."""
+        emitted = _process({
+            "type": "item.completed",
+            "item": {"type": "agent_message", "text": "done [[PROMISE:TASK_COMPLETE]]"},
+        })
+        assert emitted == ["done [[PROMISE:TASK_COMPLETE]]"]
+        assert "💬 done" in capsys.readouterr().out
+
+    def test_reasoning_is_printed_not_emitted(self, capsys):
+        """Happy: reasoning is displayed but kept out of the output."""
+        emitted = _process({
+            "type": "item.completed",
+            "item": {"type": "reasoning", "text": "thinking"},
+        })
+        assert emitted == []
+        assert "🧠 thinking" in capsys.readouterr().out
+
+    def test_command_started_prints_inner_command(self, capsys):
+        """Happy: item.started for a command shows the unwrapped command."""
+        _process({
+            "type": "item.started",
+            "item": {"type": "command_execution", "command": "/bin/zsh -lc 'ls -la'"},
+        })
+        assert "💻 Bash: ls -la" in capsys.readouterr().out
+
+    def test_command_completed_tracks_tool_call(self, capsys):
+        """Happy: completed commands count as Bash calls; failures warn."""
+        stats = BuildStats()
+        _process({
+            "type": "item.completed",
+            "item": {"type": "command_execution", "exit_code": 2},
+        }, stats)
+        assert stats.tool_calls == {"Bash": 1}
+        assert "exit code: 2" in capsys.readouterr().out
+
+    def test_turn_completed_adds_usage(self):
+        """Happy: turn.completed usage maps cached tokens to cache reads."""
+        stats = BuildStats()
+        _process({
+            "type": "turn.completed",
+            "usage": {"input_tokens": 10, "cached_input_tokens": 4, "output_tokens": 3},
+        }, stats)
+        assert stats.total_input_tokens == 10
+        assert stats.total_output_tokens == 3
+        assert stats.total_cache_read_tokens == 4
+
+    def test_unknown_types_are_ignored(self, capsys):
+        """Failure: unknown event and item types are silently skipped."""
+        assert _process({"type": "thread.started"}) == []
+        assert _process({"type": "item.completed", "item": {"type": "file_change"}}) == []
+        assert _process({"type": "item.started"}) == []
+        assert capsys.readouterr().out == ""
+
+
+class TestFormatCodexCommand:
+    """Tests for _format_codex_command."""
+
+    def test_strips_shell_wrapper(self):
+        assert _format_codex_command('/bin/bash -lc "git status"') == "💻 Bash: git status"
+
+    def test_plain_command_unchanged(self):
+        assert _format_codex_command("pytest -q") == "💻 Bash: pytest -q"
+
+    def test_long_command_truncated(self):
+        result = _format_codex_command("/bin/zsh -lc '" + "x" * 200 + "'")
+        assert result == "💻 Bash: " + "x" * 77 + "..."
+
+    def test_wrapper_with_extra_whitespace(self):
+        assert _format_codex_command("/bin/zsh   -lc\t'echo hi'") == "💻 Bash: echo hi"
+
+    def test_non_wrapper_bin_command_unchanged(self):
+        """Failure: /bin commands without flag + quoted arg are left alone."""
+        assert _format_codex_command("/bin/ls -la src") == "💻 Bash: /bin/ls -la src"
+        assert _format_codex_command("/bin/zsh -lc ''") == "💻 Bash: /bin/zsh -lc ''"
+
+
+class TestCodexEnv:
+    """Tests for _codex_env."""
+
+    def test_sees_environment_changes(self, monkeypatch):
+        """Happy: a variable changed between runs reaches the next child env."""
+        monkeypatch.setenv("OPENAI_API_KEY", "old")
+        first = _codex_env("/w/.codex")
+        monkeypatch.setenv("OPENAI_API_KEY", "new")
+        second = _codex_env("/w/.codex")
+
+        assert first["OPENAI_API_KEY"] == "old"
+        assert second["OPENAI_API_KEY"] == "new"
+        assert second["CODEX_HOME"] == "/w/.codex"
+
+    def test_returns_separate_dicts(self):
+        """Failure: one caller mutating its env doesn't affect the next."""
+        first = _codex_env("/w/.codex")
+        first["CODEX_HOME"] = "changed"
+        assert _codex_env("/w/.codex")["CODEX_HOME"] == "/w/.codex"
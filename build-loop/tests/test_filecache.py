@@ -0,0 +1,54 @@
+"""Tests for the stat-keyed file cache in filecache.py."""
+
+from build_loop.filecache import FileCache, stat_file
+
+
+class TestStatFile:
+    """Tests for stat_file."""
+
+    def test_regular_file(self, tmp_path):
+        """Happy: a regular file's stat is returned."""
+        path = tmp_path / "a.md"
+        path.write_text("x")
+        assert stat_file(path).st_size == 1
+
+    def test_missing_directory_and_inline_text(self, tmp_path):
+        """Failure: missing paths, directories and non-path text give None."""
+        assert stat_file(tmp_path / "missing.md") is None
+        assert stat_file(tmp_path) is None
+        assert stat_file("Inline\0text") is None
+
+
+class TestFileCache:
+    """FileCache keeps one entry per path while the file is unchanged."""
+
+    def test_hit_until_file_changes(self, tmp_path):
+        """Happy: the stored value is returned until mtime or size changes."""
+        path = tmp_path / "a.md"
+        path.write_text("one")
+        cache = FileCache()
+        cache.set(str(path), stat_file(path), "parsed one")
+        assert cache.get(str(path), stat_file(path)) == "parsed one"
+
+        path.write_text("second")
+        assert cache.get(str(path), stat_file(path)) is None
+
+    def test_edit_replaces_entry(self, tmp_path):
+        """Happy: storing a changed file's value replaces its old entry."""
+        path = tmp_path / "a.md"
+        cache = FileCache(max_entries=2)
+        for text in ("one", "second", "third!"):
+            path.write_text(text)
+            cache.set(str(path), stat_file(path), text)
+        assert len(cache._entries) == 1
+        assert cache.get(str(path), stat_file(path)) == "third!"
+
+    def test_oldest_path_evicted(self, tmp_path):
+        """Failure: past max_entries the oldest path is dropped."""
+        cache = FileCache(max_entries=2)
+        paths = [tmp_path / f"{name}.md" for name in "abc"]
+        for path in paths:
+            path.write_text(path.name)
+            cache.set(str(path), stat_file(path), path.name)
+        assert cache.get(str(paths[0]), stat_file(paths[0])) is None
+        assert cache.get(str(paths[2]), stat_file(paths[2])) == "c.md"
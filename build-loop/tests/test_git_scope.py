@@ -0,0 +1,170 @@
+"""Tests for git diff collection in git_scope.py."""
+
+import logging
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from build_loop import git_scope
+from build_loop.git_scope import collect_diff, snapshot_head
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A git repo with one commit, used as the working directory."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "base.txt").write_text("base\n")
+    _git(tmp_path, "add", "base.txt")
+    _git(tmp_path, "commit", "-qm", "base")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestCollectDiff:
+    """Tests for collect_diff against a real repository."""
+
+    def test_committed_and_uncommitted_changes(self, repo):
+        """Happy: commits, working-tree edits and staged files are all listed once."""
+        start = snapshot_head()
+        (repo / "new.txt").write_text("new\n")
+        _git(repo, "add", "new.txt")
+        _git(repo, "commit", "-qm", "add new file")
+        (repo / "base.txt").write_text("edited\n")
+        (repo / "staged.txt").write_text("staged\n")
+        _git(repo, "add", "staged.txt")
+
+        diff = collect_diff(start)
+
+        assert diff.end_commit != start
+        assert diff.changed_files == [
+            "new.txt (added)", "base.txt (modified)", "staged.txt (added)",
+        ]
+        assert len(diff.commit_messages) == 1
+        assert diff.commit_messages[0].endswith("add new file")
+
+    def test_file_in_commit_and_working_tree_listed_once(self, repo):
+        """Happy: a committed file edited again keeps its committed status."""
+        start = snapshot_head()
+        (repo / "new.txt").write_text("new\n")
+        _git(repo, "add", "new.txt")
+        _git(repo, "commit", "-qm", "add new file")
+        (repo / "new.txt").write_text("edited\n")
+
+        diff = collect_diff(start)
+
+        assert diff.changed_files == ["new.txt (added)"]
+
+    def test_uncommitted_only(self, repo):
+        """Happy: with HEAD unchanged, only the working-tree diff is reported."""
+        start = snapshot_head()
+        (repo / "base.txt").write_text("edited\n")
+
+        diff = collect_diff(start)
+
+        assert diff.end_commit == start
+        assert diff.changed_files == ["base.txt (modified)"]
+        assert diff.commit_messages == []
+
+    def test_clean_tree_skips_diffs(self, repo):
+        """Happy: unchanged HEAD and clean tree return an empty diff after one status call."""
+        start = snapshot_head()
+        (repo / "untracked.txt").write_text("ignored\n")
+
+        with patch.object(git_scope, "_run_git", wraps=git_scope._run_git) as mock_git:
+            diff = collect_diff(start)
+
+        assert diff.changed_files == []
+        assert diff.commit_messages == []
+        assert [c.args[0][0] for c in mock_git.call_args_list] == ["rev-parse", "status"]
+
+    def test_not_a_repo_returns_none(self, tmp_path, monkeypatch):
+        """Failure: outside a git repo, collect_diff returns None."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+        assert collect_diff("abc123") is None
+
+
+class TestGitDiff:
+    """Tests for the GitDiff record."""
+
+    def test_slots_reject_unknown_attributes(self):
+        """Failure: GitDiff has no instance __dict__, so typos raise."""
+        diff = git_scope.GitDiff(start_commit="a", end_commit="b")
+        assert diff.changed_files == [] and diff.commit_messages == []
+        with pytest.raises(AttributeError):
+            diff.changed_file = ["x"]
+
+
+class TestRunGitParallel:
+    """Tests for _run_git_parallel."""
+
+    def test_results_in_command_order(self):
+        """Happy: each result lines up with its command."""
+        with patch.object(git_scope, "_run_git_bytes", side_effect=lambda args: args[0]):
+            assert git_scope._run_git_parallel([["a"], ["b"], ["c"]]) == ["a", "b", "c"]
+
+
+class TestParseNameStatus:
+    """Tests for _parse_name_status."""
+
+    def test_labels_known_statuses(self):
+        """Happy: A/M/D map to words; renames keep the new path."""
+        output = b"A\tnew.py\nM\tsrc/a.py\nD\told.py\nR087\tsrc/b.py\tsrc/c.py\nC100\tx.py\ty.py"
+        assert git_scope._parse_name_status(output) == [
+            ("new.py", "added"),
+            ("src/a.py", "modified"),
+            ("old.py", "deleted"),
+            ("src/c.py", "renamed"),
+            ("y.py", "copied"),
+        ]
+
+    def test_unknown_and_malformed_lines(self):
+        """Failure: unknown letters pass through; lines without a tab are skipped."""
+        assert git_scope._parse_name_status(b"T\tlink\ngarbage\n") == [("link", "T")]
+
+    def test_undecodable_path_is_preserved(self):
+        """Failure: non-UTF-8 path bytes survive via surrogateescape instead of raising."""
+        ((filepath, label),) = git_scope._parse_name_status(b"M\tcaf\xe9.txt")
+        assert label == "modified"
+        assert filepath.encode("utf-8", "surrogateescape") == b"caf\xe9.txt"
+
+
+class TestRunGitBytes:
+    """Tests for _run_git_bytes and the text wrapper."""
+
+    def test_returns_raw_stripped_bytes(self, repo):
+        """Happy: output comes back as bytes; _run_git decodes the same output."""
+        raw = git_scope._run_git_bytes(["rev-parse", "--short", "HEAD"])
+        assert isinstance(raw, bytes)
+        assert git_scope._run_git(["rev-parse", "--short", "HEAD"]) == raw.decode()
+
+    def test_commands_disable_pager_and_color(self, repo):
+        """Happy: every call carries --no-pager and color.ui=false."""
+        with patch.object(git_scope.subprocess, "run", wraps=subprocess.run) as mock_run:
+            git_scope._run_git(["status"])
+        argv = mock_run.call_args.args[0]
+        assert argv[:4] == ["git", "--no-pager", "-c", "color.ui=false"]
+        assert argv[4:] == ["status"]
+
+    def test_colored_log_config_is_ignored(self, repo):
+        """Failure: color.ui=always in repo config does not leak escape codes."""
+        _git(repo, "config", "color.ui", "always")
+        assert "\x1b" not in git_scope._run_git(["log", "--oneline"])
+
+    def test_failure_returns_none(self, repo):
+        """Failure: a non-zero exit gives None from both helpers."""
+        assert git_scope._run_git_bytes(["rev-parse", "no-such-ref"]) is None
+        assert git_scope._run_git(["rev-parse", "no-such-ref"]) is None
+
+    def test_failure_logged_at_debug(self, repo, caplog):
+        """Failure: with debug enabled, the command and git's stderr are logged."""
+        with caplog.at_level(logging.DEBUG, logger="build_loop.git_scope"):
+            git_scope._run_git_bytes(["rev-parse", "no-such-ref"])
+        assert "git rev-parse no-such-ref failed (exit 128)" in caplog.text
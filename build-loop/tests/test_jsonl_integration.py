@@ -230,7 +230,7 @@ class TestSessionIdCaptureHappy:
             "sessionId": "abc-123-def",
             "model": "claude-opus-4-6",
         }
-        process_stream_event(event, [], stats)
+        process_stream_event(event, [].append, stats)
         assert stats.session_id == "abc-123-def"
 
     def test_session_id_from_nested_session_field(self):
@@ -245,7 +245,7 @@ class TestSessionIdCaptureHappy:
                 "model": "claude-opus-4-6",
             },
         }
-        process_stream_event(event, [], stats)
+        process_stream_event(event, [].append, stats)
         assert stats.session_id == "xyz-789"
 
 
@@ -261,5 +261,5 @@ class TestSessionIdCaptureFailure:
             "type": "system",
             "model": "claude-opus-4-6",
         }
-        process_stream_event(event, [], stats)
+        process_stream_event(event, [].append, stats)
         assert stats.session_id == ""
@@ -0,0 +1,45 @@
+"""Tests for build-loop prompt construction in prompt.py."""
+
+from unittest.mock import patch
+
+import pytest
+
+from build_loop import prompt
+from build_loop.filecache import FileCache
+
+
+@pytest.fixture
+def template_file(tmp_path):
+    """A stand-in build.md template, with the template cache cleared."""
+    path = tmp_path / "build.md"
+    path.write_text("Tasks: {tasks_file_path}\nContext: {additional_context_paths_or_none}\n"
+                    "Progress: {progress_file_path}\n")
+    with patch.object(prompt, "_get_prompt_path", return_value=path), \
+         patch.object(prompt, "_TEMPLATE_CACHE", FileCache()):
+        yield path
+
+
+class TestLoadPromptTemplate:
+    """Tests for _load_prompt_template caching."""
+
+    def test_unchanged_template_read_once(self, template_file):
+        """Happy: repeated builds reuse the template until it changes."""
+        with patch("pathlib.Path.read_text", wraps=template_file.read_text) as mock_read:
+            first = prompt.build_prompt("/p/tasks.md", [])
+            second = prompt.build_prompt("/p/tasks.md", ["/p/scope.md"])
+        assert mock_read.call_count == 1
+        assert "Context: None" in first
+        assert "Context: `/p/scope.md`" in second
+
+    def test_edited_template_reloaded(self, template_file):
+        """Happy: an edit to the template between iterations is picked up."""
+        prompt.build_prompt("/p/tasks.md", [])
+        template_file.write_text("Edited {tasks_file_path} {progress_file_path} "
+                                 "{additional_context_paths_or_none}")
+        assert prompt.build_prompt("/p/tasks.md", []).startswith("Edited /p/tasks.md")
+
+    def test_missing_template_raises(self, template_file):
+        """Failure: a missing template raises FileNotFoundError."""
+        template_file.unlink()
+        with pytest.raises(FileNotFoundError, match="Build prompt template not found"):
+            prompt.build_prompt("/p/tasks.md", [])
@@ -0,0 +1,118 @@
+"""Tests for manifest frontmatter parsing in manifest.py."""
+
+import pytest
+
+from build_loop.manifest import _parse_yaml_frontmatter, load_manifest
+
+
+class TestParseYamlFrontmatter:
+    """Tests for _parse_yaml_frontmatter."""
+
+    def test_scalars_and_lists(self):
+        """Happy: block and inline lists, quotes, ints, bools and comments."""
+        content = (
+            "---\n"
+            "# generated by the planning pipeline\n"
+            "tasks: 'docs/tasks.md'\n"
+            "context:\n"
+            "  - docs/scope.md\n"
+            "  - docs/plan.md\n"
+            "extra: [a, \"b\"]\n"
+            "max_iterations: 15\n"
+            "validate: yes\n"
+            "---\n"
+            "# Build Manifest\n"
+        )
+        assert _parse_yaml_frontmatter(content) == {
+            "tasks": "docs/tasks.md",
+            "context": ["docs/scope.md", "docs/plan.md"],
+            "extra": ["a", "b"],
+            "max_iterations": 15,
+            "validate": True,
+        }
+
+    def test_missing_or_non_mapping_frontmatter(self):
+        """Failure: no frontmatter block, or a non-mapping one, gives {}."""
+        assert _parse_yaml_frontmatter("# Just markdown\n") == {}
+        assert _parse_yaml_frontmatter("---\n- a\n- b\n---\n") == {}
+
+
+class TestLoadManifestParsing:
+    """Tests for load_manifest() handling of frontmatter values."""
+
+    def test_empty_context_key(self, tmp_path):
+        """Happy: a context key with no items yields no context files."""
+        manifest_file = tmp_path / "build.md"
+        manifest_file.write_text("---\ntasks: tasks.md\ncontext:\n---\n")
+        manifest = load_manifest(str(manifest_file))
+        assert manifest.context == []
+        assert manifest.tasks == str(tmp_path.resolve() / "tasks.md")
+
+    def test_invalid_yaml_raises_value_error(self, tmp_path):
+        """Failure: malformed frontmatter is reported as a ValueError."""
+        manifest_file = tmp_path / "build.md"
+        manifest_file.write_text("---\ntasks: [unclosed\n---\n")
+        with pytest.raises(ValueError, match="Invalid YAML frontmatter"):
+            load_manifest(str(manifest_file))
+
+
+class TestLoadManifestCache:
+    """load_manifest() reuses results until the file changes."""
+
+    def test_unchanged_file_not_reparsed(self, tmp_path):
+        """Happy: a second load returns the cached manifest without parsing."""
+        from unittest.mock import patch
+
+        manifest_file = tmp_path / "build.md"
+        manifest_file.write_text("---\ntasks: tasks.md\n---\n")
+        first = load_manifest(str(manifest_file))
+        with patch("build_loop.manifest._parse_yaml_frontmatter") as mock_parse:
+            assert load_manifest(str(manifest_file)) is first
+        mock_parse.assert_not_called()
+
+    def test_edited_file_reloaded(self, tmp_path):
+        """Happy: changing the file's contents invalidates the cached entry."""
+        manifest_file = tmp_path / "build.md"
+        manifest_file.write_text("---\ntasks: tasks.md\n---\n")
+        assert load_manifest(str(manifest_file)).max_iterations == 10
+        manifest_file.write_text("---\ntasks: tasks.md\nmax_iterations: 3\n---\n")
+        assert load_manifest(str(manifest_file)).max_iterations == 3
+
+    def test_directory_is_not_a_manifest(self, tmp_path):
+        """Failure: a directory path raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_manifest(str(tmp_path))
+
+    def test_cached_manifest_is_immutable(self, tmp_path):
+        """Failure: the shared cached instance rejects assignment and new attributes."""
+        manifest_file = tmp_path / "build.md"
+        manifest_file.write_text("---\ntasks: tasks.md\n---\n")
+        manifest = load_manifest(str(manifest_file))
+        assert not hasattr(manifest, "__dict__")
+        with pytest.raises(AttributeError):
+            manifest.max_iterations = 1
+
+
+class TestLoadManifestPaths:
+    """Path resolution for manifest entries."""
+
+    def test_relative_entries_joined_to_manifest_dir(self, tmp_path):
+        """Happy: relative paths resolve against the manifest's directory."""
+        manifest_file = tmp_path / "build.md"
+        manifest_file.write_text(
+            "---\ntasks: ./specs/tasks.md\ncontext:\n  - scope.md\n  - /abs/plan.md\n---\n"
+        )
+        manifest = load_manifest(str(manifest_file))
+        base = tmp_path.resolve()
+        assert manifest.tasks == str(base / "specs" / "tasks.md")
+        assert manifest.context == [str(base / "scope.md"), "/abs/plan.md"]
+
+    def test_parent_reference_through_symlink(self, tmp_path):
+        """Happy: '..' after a symlinked directory follows the link like resolve()."""
+        (tmp_path / "real" / "sub").mkdir(parents=True)
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "link").symlink_to(tmp_path / "real" / "sub")
+        manifest_file = tmp_path / "docs" / "build.md"
+        manifest_file.write_text("---\ntasks: link/../tasks.md\n---\n")
+        manifest = load_manifest(str(manifest_file))
+        assert manifest.tasks == str(tmp_path.resolve() / "real" / "tasks.md")
@@ -0,0 +1,288 @@
+"""Tests for parallel stage groups and batched stages."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from build_loop.agent import AgentRunner, ClaudeRunner
+from build_loop.pipeline import ParallelStageConfig
+from build_loop.pipeline.completion import PromiseCompletion
+from build_loop.pipeline.executor import PipelineConfig, PipelineExecutor, PipelineStatus
+from build_loop.pipeline.loader import load_pipeline_from_dict
+from build_loop.pipeline.stage import Stage, StageConfig
+
+
+class _ScriptedRunner(AgentRunner):
+    """Runner whose output is looked up by prompt, tracking concurrency."""
+
+    name = "scripted"
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.in_flight = 0
+        self.peak = 0
+        self.prompts = []
+
+    def check_available(self):
+        return True
+
+    async def run_iteration_async(self, prompt, timeout=None, stats=None, denied_tools=None):
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        output = self.outputs[prompt]
+        # A list scripts successive outputs for the same prompt
+        return 0, output.pop(0) if isinstance(output, list) else output, ""
+
+
+def _hanging_process():
+    """Mock agent subprocess that streams nothing until it is killed."""
+    proc = MagicMock(returncode=None)
+    proc.stdin = MagicMock(drain=AsyncMock())
+    proc.stderr = MagicMock(read=AsyncMock(return_value=b""))
+    proc.wait = AsyncMock(return_value=-9)
+
+    async def never(*_args):
+        await asyncio.Event().wait()
+
+    def kill():
+        proc.returncode = -9
+
+    proc.stdout = MagicMock(read=never)
+    proc.kill = MagicMock(side_effect=kill)
+    return proc
+
+
+def _stage(name, transitions=None):
+    return StageConfig(
+        name=name,
+        prompt_template=f"{name} {{topic}}",
+        completion=PromiseCompletion(complete_signals=["DONE", "SHIP"]),
+        max_iterations=1,
+        transitions=transitions or {},
+    )
+
+
+def _config(group_transitions=None):
+    return PipelineConfig(
+        name="fanout",
+        stages={
+            "research_a": _stage("research_a"),
+            "research_b": _stage("research_b"),
+            "summarize": _stage("summarize"),
+        },
+        start_stage="research",
+        end_signals=["SHIP"],
+        parallel_groups={
+            "research": ParallelStageConfig(
+                name="research",
+                stages=["research_a", "research_b"],
+                transitions=group_transitions or {"DONE": "summarize"},
+            ),
+        },
+    )
+
+
+_OUTPUTS = {
+    "research_a x": "a [[PROMISE:DONE]]",
+    "research_b x": "b [[PROMISE:DONE]]",
+    "summarize x": "s [[PROMISE:SHIP]]",
+}
+
+
+class TestParallelGroupExecution:
+    """PipelineExecutor runs group members concurrently, then transitions."""
+
+    def test_members_overlap_then_transition(self):
+        """Happy: both members are in flight together and the group moves on."""
+        runner = _ScriptedRunner(_OUTPUTS)
+        executor = PipelineExecutor(config=_config(), runner=runner, context={"topic": "x"})
+
+        state = executor.run()
+
+        assert runner.peak == 2
+        assert state.status == PipelineStatus.COMPLETED
+        assert state.stage_history == [
+            ("research_a", "DONE"),
+            ("research_b", "DONE"),
+            ("summarize", "SHIP"),
+        ]
+        assert state.total_iterations == 3
+
+    def test_hook_context_changes_merged(self):
+        """Happy: keys set by member hooks reach the stages that follow."""
+        runner = _ScriptedRunner(_OUTPUTS)
+        seen = {}
+
+        def before(name, context):
+            context[f"{name}_started"] = True
+            if name == "summarize":
+                seen.update(context)
+
+        executor = PipelineExecutor(
+            config=_config(), runner=runner, context={"topic": "x"}, before_stage=before
+        )
+        executor.run()
+
+        assert seen["research_a_started"] and seen["research_b_started"]
+
+    def test_incomplete_member_fails_group(self):
+        """Failure: a member without a completion signal makes the group incomplete."""
+        runner = _ScriptedRunner({**_OUTPUTS, "research_b x": "b [[PROMISE:STUCK]]"})
+        executor = PipelineExecutor(config=_config(), runner=runner, context={"topic": "x"})
+
+        state = executor.run()
+
+        assert state.status == PipelineStatus.FAILED
+        assert state.stage_history[-1] == ("research_b", "STUCK")
+        assert "summarize x" not in runner.prompts
+
+    def test_raising_member_kills_sibling_agent(self):
+        """Failure: when one member raises, the other member's agent process is killed."""
+        proc = _hanging_process()
+        executor = PipelineExecutor(config=_config(), runner=ClaudeRunner(), context={"topic": "x"})
+
+        with patch("asyncio.create_subprocess_exec", return_value=proc), \
+             patch.object(
+                 executor._stages["research_b"], "run_async", side_effect=RuntimeError("boom")
+             ):
+            state = executor.run()
+
+        assert state.status == PipelineStatus.FAILED
+        proc.kill.assert_called_once()
+
+    def test_bad_template_fails_only_that_member(self, tmp_path):
+        """Failure: a member whose prompt can't be built fails; the others still finish."""
+        runner = _ScriptedRunner(_OUTPUTS)
+        config = _config()
+        config.stages["research_b"].prompt_template = str(tmp_path / "missing.md")
+        finished = []
+        executor = PipelineExecutor(
+            config=config, runner=runner, context={"topic": "x"},
+            after_stage=lambda name, ctx, result: finished.append(name),
+        )
+
+        state = executor.run()
+
+        assert finished == ["research_a", "research_b"]
+        assert state.stage_history == [("research_a", "DONE"), ("research_b", None)]
+        assert state.status == PipelineStatus.FAILED
+
+    def test_run_async_inside_event_loop(self):
+        """Happy: run_async can be awaited from a running loop."""
+        runner = _ScriptedRunner(_OUTPUTS)
+        executor = PipelineExecutor(config=_config(), runner=runner, context={"topic": "x"})
+
+        state = asyncio.run(executor.run_async())
+
+        assert state.status == PipelineStatus.COMPLETED
+
+
+class TestParallelGroupLoader:
+    """The YAML schema accepts parallel groups as stages and targets."""
+
+    def _data(self, members):
+        return {
+            "name": "fanout",
+            "start_stage": "research",
+            "stages": [
+                {"name": "a", "prompt": "A", "completion": {"type": "promise"}},
+                {"name": "b", "prompt": "B", "completion": {"type": "promise"}},
+            ],
+            "parallel": [{"name": "research", "stages": members}],
+        }
+
+    def test_group_loaded(self):
+        """Happy: a parallel group becomes a ParallelStageConfig."""
+        config = load_pipeline_from_dict(self._data(["a", "b"]))
+        assert config.parallel_groups["research"].stages == ["a", "b"]
+
+    def test_unknown_member_rejected(self):
+        """Failure: a group member that isn't a stage fails validation."""
+        with pytest.raises(ValueError, match="member 'c'"):
+            load_pipeline_from_dict(self._data(["a", "c"]))
+
+
+class TestBatchedStage:
+    """A stage with batch_key runs chunks of a context list concurrently."""
+
+    def _stage(self, runner):
+        config = StageConfig(
+            name="review",
+            prompt_template="Review:\n{files}",
+            completion=PromiseCompletion(complete_signals=["DONE"]),
+            max_iterations=2,
+            batch_key="files",
+            batch_size=2,
+        )
+        return Stage(config=config, runner=runner)
+
+    def test_chunks_run_concurrently(self):
+        """Happy: each chunk gets its own prompt and they overlap."""
+        runner = _ScriptedRunner({
+            "Review:\na\nb": "ok [[PROMISE:DONE]]",
+            "Review:\nc": "ok [[PROMISE:DONE]]",
+        })
+        result, iterations = self._stage(runner).run({"files": ["a", "b", "c"]})
+
+        assert result.is_complete is True
+        assert iterations == 1
+        assert runner.peak == 2
+
+    def test_only_incomplete_chunks_rerun(self):
+        """Happy: a chunk that completed is not sent again on the next iteration."""
+        runner = _ScriptedRunner({
+            "Review:\na\nb": ["ok [[PROMISE:DONE]]"],
+            "Review:\nc": ["still going", "ok [[PROMISE:DONE]]"],
+        })
+        result, iterations = self._stage(runner).run({"files": ["a", "b", "c"]})
+
+        assert result.is_complete is True
+        assert iterations == 2
+        assert runner.prompts.count("Review:\na\nb") == 1
+
+    def test_bad_template_gives_failed_result(self, tmp_path):
+        """Failure: a template that can't be loaded fails the stage instead of raising."""
+        runner = _ScriptedRunner({})
+        stage = self._stage(runner)
+        stage.config.prompt_template = str(tmp_path / "missing.md")
+
+        result, iterations = stage.run({"files": ["a", "b", "c"]})
+
+        assert result.is_complete is False
+        assert "missing.md" in result.artifacts["error"]
+        assert iterations == 1
+        assert runner.prompts == []
+
+    def test_non_list_value_runs_unbatched(self):
+        """Failure: without a list under batch_key the stage runs once as usual."""
+        runner = _ScriptedRunner({"Review:\nall": "[[PROMISE:DONE]]"})
+        result, iterations = self._stage(runner).run({"files": "all"})
+
+        assert result.is_complete is True
+        assert runner.prompts == ["Review:\nall"]
+
+    def test_raising_chunk_kills_other_agents(self):
+        """Failure: when one chunk's agent raises, the others are killed before the stage returns."""
+        proc = _hanging_process()
+
+        async def main():
+            with patch(
+                "asyncio.create_subprocess_exec",
+                side_effect=[proc, FileNotFoundError("claude")],
+            ):
+                result, _ = await self._stage(ClaudeRunner()).run_async(
+                    {"files": ["a", "b", "c"]}
+                )
+            # Checked while the loop is still running, before asyncio.run
+            # would cancel leftover tasks
+            proc.kill.assert_called_once()
+            return result
+
+        result = asyncio.run(main())
+
+        assert result.is_complete is False
+        assert "claude" in result.artifacts["error"]
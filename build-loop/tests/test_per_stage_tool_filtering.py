@@ -1,6 +1,6 @@
 """Tests for per-stage tool filtering: denied_tools flows from StageConfig through Stage to AgentRunner."""
 
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import AsyncMock, MagicMock, patch, call
 import subprocess
 
 import pytest
@@ -27,6 +27,17 @@ class _FakeCompletion(CompletionStrategy):
         return CompletionResult(is_complete=True, signal="DONE")
 
 
+def _fake_process():
+    """Create a mock asyncio subprocess that exits cleanly with no output."""
+    proc = MagicMock()
+    proc.stdin = MagicMock(drain=AsyncMock())
+    proc.stdout = MagicMock(read=AsyncMock(return_value=b""))
+    proc.stderr = MagicMock(read=AsyncMock(return_value=b""))
+    proc.returncode = 0
+    proc.wait = AsyncMock(return_value=0)
+    return proc
+
+
 def _make_stage(runner, denied_tools=None):
     """Create a Stage with a minimal config."""
     config = StageConfig(
@@ -50,15 +61,9 @@ class TestAgentRunnerSignature:
     def test_happy_claude_runner_accepts_denied_tools_kwarg(self):
         """Happy: ClaudeRunner.run_iteration() accepts denied_tools without TypeError."""
         runner = ClaudeRunner()
-        # Should not raise TypeError — just mock Popen so it doesn't actually run
-        with patch("subprocess.Popen") as mock_popen:
-            proc = MagicMock()
-            proc.stdin = MagicMock()
-            proc.stdout = iter([])
-            proc.stderr = MagicMock(read=MagicMock(return_value=""))
-            proc.returncode = 0
-            proc.wait = MagicMock()
-            mock_popen.return_value = proc
+        # Should not raise TypeError — just mock the subprocess so it doesn't actually run
+        with patch("asyncio.create_subprocess_exec") as mock_popen:
+            mock_popen.return_value = _fake_process()
 
             _exit, _out, _err = runner.run_iteration(
                 "test prompt", denied_tools=["WebFetch"]
@@ -68,16 +73,11 @@ class TestAgentRunnerSignature:
     def test_happy_codex_runner_accepts_denied_tools_kwarg(self):
         """Happy: CodexRunner.run_iteration() accepts denied_tools without TypeError."""
         runner = CodexRunner()
-        with patch("subprocess.Popen") as mock_popen, \
+        with patch("asyncio.create_subprocess_exec") as mock_popen, \
              patch("build_loop.agent.CodexRunner.check_available", return_value=True), \
-             patch("build_loop.codex_env.setup_codex_home", return_value="/tmp/codex"):
-            proc = MagicMock()
-            proc.stdin = MagicMock()
-            proc.stdout = iter([])
-            proc.stderr = MagicMock(read=MagicMock(return_value=""))
-            proc.returncode = 0
-            proc.wait = MagicMock()
-            mock_popen.return_value = proc
+             patch.dict("build_loop.agent._CODEX_HOMES", clear=True), \
+             patch("build_loop.agent.setup_codex_home", return_value="/tmp/codex"):
+            mock_popen.return_value = _fake_process()
 
             _exit, _out, _err = runner.run_iteration(
                 "test prompt", denied_tools=["SomeTool"]
@@ -94,20 +94,14 @@ class TestClaudeRunnerDeniedTools:
     """ClaudeRunner command construction honors per-stage denied_tools."""
 
     def _run_with_denied(self, denied_tools):
-        """Helper: run ClaudeRunner with given denied_tools, return Popen cmd."""
+        """Helper: run ClaudeRunner with given denied_tools, return spawned cmd."""
         runner = ClaudeRunner()
-        with patch("subprocess.Popen") as mock_popen:
-            proc = MagicMock()
-            proc.stdin = MagicMock()
-            proc.stdout = iter([])
-            proc.stderr = MagicMock(read=MagicMock(return_value=""))
-            proc.returncode = 0
-            proc.wait = MagicMock()
-            mock_popen.return_value = proc
+        with patch("asyncio.create_subprocess_exec") as mock_popen:
+            mock_popen.return_value = _fake_process()
 
             runner.run_iteration("prompt", denied_tools=denied_tools)
 
-            cmd = mock_popen.call_args[0][0]
+            cmd = list(mock_popen.call_args[0])
             return cmd
 
     def test_happy_uses_per_stage_denied_tools_when_provided(self):
@@ -140,15 +134,10 @@ class TestCodexRunnerDeniedTools:
     def test_happy_codex_ignores_denied_tools_no_crash(self):
         """Happy: CodexRunner doesn't crash when denied_tools is passed."""
         runner = CodexRunner()
-        with patch("subprocess.Popen") as mock_popen, \
-             patch("build_loop.codex_env.setup_codex_home", return_value="/tmp/codex"):
-            proc = MagicMock()
-            proc.stdin = MagicMock()
-            proc.stdout = iter([])
-            proc.stderr = MagicMock(read=MagicMock(return_value=""))
-            proc.returncode = 0
-            proc.wait = MagicMock()
-            mock_popen.return_value = proc
+        with patch("asyncio.create_subprocess_exec") as mock_popen, \
+             patch.dict("build_loop.agent._CODEX_HOMES", clear=True), \
+             patch("build_loop.agent.setup_codex_home", return_value="/tmp/codex"):
+            mock_popen.return_value = _fake_process()
 
             # Should NOT appear in the command
             _exit, _out, _err = runner.run_iteration(
@@ -157,7 +146,7 @@ class TestCodexRunnerDeniedTools:
             assert _exit == 0
 
             # Verify no --disallowedTools in codex command
-            cmd = mock_popen.call_args[0][0]
+            cmd = list(mock_popen.call_args[0])
             assert "--disallowedTools" not in cmd
 
 
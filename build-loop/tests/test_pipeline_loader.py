@@ -0,0 +1,135 @@
+"""Tests for YAML pipeline loading in pipeline/loader.py."""
+
+from unittest.mock import patch
+
+import pytest
+
+from build_loop.pipeline import schema
+from build_loop.pipeline.completion import CompositeCompletion, JsonCompletion, PromiseCompletion
+from build_loop.pipeline.loader import load_pipeline
+
+_PIPELINE_YAML = """\
+name: single
+start_stage: build
+stages:
+  - name: build
+    prompt: "Build {tasks_file_path}"
+    completion:
+      type: promise
+    max_iterations: {max_iterations}
+"""
+
+
+def _write(path, max_iterations=2):
+    path.write_text(_PIPELINE_YAML.replace("{max_iterations}", str(max_iterations)))
+
+
+class TestLoadPipelineCache:
+    """load_pipeline() reuses results until the file changes."""
+
+    def test_unchanged_file_not_reparsed(self, tmp_path):
+        """Happy: a second load returns the cached config without validating."""
+        pipeline_file = tmp_path / "single.yaml"
+        _write(pipeline_file)
+        first = load_pipeline(pipeline_file)
+        with patch.object(schema, "PipelineSchema") as mock_schema:
+            assert load_pipeline(str(pipeline_file)) is first
+        mock_schema.assert_not_called()
+
+    def test_edited_file_reloaded(self, tmp_path):
+        """Happy: changing the file's contents invalidates the cached entry."""
+        pipeline_file = tmp_path / "single.yaml"
+        _write(pipeline_file)
+        assert load_pipeline(pipeline_file).stages["build"].max_iterations == 2
+        _write(pipeline_file, max_iterations=15)
+        assert load_pipeline(pipeline_file).stages["build"].max_iterations == 15
+
+    def test_directory_is_not_a_pipeline(self, tmp_path):
+        """Failure: a directory path raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_pipeline(tmp_path)
+
+    def test_invalid_yaml_not_cached(self, tmp_path):
+        """Failure: bad YAML raises ValueError on every load."""
+        pipeline_file = tmp_path / "bad.yaml"
+        pipeline_file.write_text("name: [unclosed\n")
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid YAML"):
+                load_pipeline(pipeline_file)
+
+
+class TestLoadPipelineEncoding:
+    """load_pipeline() hands raw bytes to the YAML loader."""
+
+    def test_utf8_prompt_decoded(self, tmp_path):
+        """Happy: non-ASCII text in the file arrives intact."""
+        pipeline_file = tmp_path / "utf8.yaml"
+        pipeline_file.write_bytes(_PIPELINE_YAML.replace("Build", "Bâtir ✓").replace(
+            "{max_iterations}", "1").encode("utf-8"))
+        config = load_pipeline(pipeline_file)
+        assert config.stages["build"].prompt_template.startswith("Bâtir ✓")
+
+    def test_invalid_utf8_is_value_error(self, tmp_path):
+        """Failure: undecodable bytes are reported as invalid YAML."""
+        pipeline_file = tmp_path / "latin1.yaml"
+        pipeline_file.write_bytes(b"name: caf\xe9\n")
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            load_pipeline(pipeline_file)
+
+
+class TestLazySchemaImport:
+    """Pydantic is only imported once a pipeline is validated."""
+
+    def test_factories_do_not_import_pydantic(self):
+        """Happy: building a default pipeline leaves pydantic and yaml unloaded."""
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from build_loop.pipeline.loader import create_default_pipeline\n"
+            "create_default_pipeline('tasks.md')\n"
+            "print('pydantic' in sys.modules, 'build_loop.pipeline.schema' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        ).stdout
+        assert out.split() == ["False", "False"]
+
+    def test_schema_names_still_reachable(self):
+        """Happy: schema models remain importable from the loader module."""
+        from build_loop.pipeline.loader import PipelineSchema
+
+        assert PipelineSchema is schema.PipelineSchema
+
+
+class TestCompositeFlattening:
+    """Composite completion schemas are flattened when converted."""
+
+    def test_nested_composites_spliced(self):
+        """Happy: a composite inside a composite becomes one flat list."""
+        strategy = schema.CompletionSchema(type="composite", strategies=[
+            {"type": "json"},
+            {"type": "composite", "strategies": [{"type": "promise"}, {"type": "json"}]},
+        ]).to_strategy()
+
+        assert isinstance(strategy, CompositeCompletion)
+        assert [type(s) for s in strategy.strategies] == [
+            JsonCompletion, PromiseCompletion, JsonCompletion,
+        ]
+
+    def test_single_strategy_unwrapped(self):
+        """Happy: a one-entry composite is replaced by its only strategy."""
+        strategy = schema.CompletionSchema(
+            type="composite", strategies=[{"type": "promise", "signals": ["DONE"]}]
+        ).to_strategy()
+
+        assert isinstance(strategy, PromiseCompletion)
+        assert strategy.evaluate("[[PROMISE:DONE]]", 0).is_complete is True
+
+    def test_empty_composite_rejected(self):
+        """Failure: a composite without strategies still fails."""
+        with pytest.raises(ValueError, match="requires 'strategies'"):
+            schema.CompletionSchema(type="composite", strategies=[]).to_strategy()
@@ -0,0 +1,152 @@
+"""Tests for promise tag and JSON block detection in agent output."""
+
+from unittest.mock import MagicMock, patch
+
+from build_loop import loop
+from build_loop.loop import _PROMISE_TAIL_CHARS, detect_promise
+from build_loop.pipeline.completion import (
+    CompletionResult,
+    CompositeCompletion,
+    JsonCompletion,
+    PromiseCompletion,
+)
+
+_PADDING = "x" * (_PROMISE_TAIL_CHARS * 2)
+
+
+class TestDetectPromise:
+    """Tests for detect_promise."""
+
+    def test_promise_at_end_of_long_output(self):
+        """Happy: a trailing promise is found without scanning the whole output."""
+        output = _PADDING + "\n[[PROMISE: TASK_COMPLETE ]]"
+        with patch.object(loop, "_PROMISE_RE", MagicMock(wraps=loop._PROMISE_RE)) as spy:
+            assert detect_promise(output) == "TASK_COMPLETE"
+        spy.search.assert_called_once()
+        assert len(spy.search.call_args.args[0]) == _PROMISE_TAIL_CHARS
+
+    def test_promise_before_tail_still_found(self):
+        """Happy: a promise followed by lots of output falls back to a full scan."""
+        assert detect_promise("[[PROMISE:BUILD_COMPLETE]]" + _PADDING) == "BUILD_COMPLETE"
+
+    def test_no_promise(self):
+        """Failure: outputs without a tag return None, short or long."""
+        assert detect_promise("done") is None
+        assert detect_promise(_PADDING) is None
+
+
+class TestPromiseCompletionTail:
+    """PromiseCompletion.evaluate scans the tail before the whole output."""
+
+    def test_completion_signal_in_tail(self):
+        """Happy: a trailing completion signal completes the stage."""
+        result = PromiseCompletion().evaluate(_PADDING + "[[PROMISE:TASK_COMPLETE]]", 0)
+        assert result.is_complete is True
+        assert result.signal == "TASK_COMPLETE"
+
+    def test_completion_signal_before_tail(self):
+        """Happy: an earlier completion signal is found when the tail has none."""
+        output = "[[PROMISE:BUILD_COMPLETE]]" + _PADDING + "[[PROMISE:NOTE]]"
+        result = PromiseCompletion().evaluate(output, 0)
+        assert result.is_complete is True
+        assert result.signal == "BUILD_COMPLETE"
+
+    def test_no_completion_reports_last_signal(self):
+        """Failure: without a completion signal, the last tag seen is reported."""
+        output = "[[PROMISE:FIRST]]" + _PADDING + "[[PROMISE:LAST]]"
+        result = PromiseCompletion().evaluate(output, 0)
+        assert result.is_complete is False
+        assert result.signal == "LAST"
+
+    def test_scan_stops_at_first_completion_signal(self):
+        """Happy: the first completion signal wins, found in one finditer pass."""
+        output = "[[PROMISE:NOTE]] [[PROMISE:TASK_COMPLETE]] [[PROMISE:BUILD_COMPLETE]]"
+        with patch.object(PromiseCompletion, "PROMISE_PATTERN",
+                          MagicMock(wraps=PromiseCompletion.PROMISE_PATTERN)) as spy:
+            result = PromiseCompletion().evaluate(output, 0)
+        assert result.signal == "TASK_COMPLETE"
+        spy.finditer.assert_called_once()
+        spy.findall.assert_not_called()
+
+
+class TestLastJsonBlock:
+    """Tests for JsonCompletion.last_json_block."""
+
+    def test_returns_last_block(self):
+        """Happy: with several blocks, the last one decides the result."""
+        output = (
+            '```json\n{"status": "IN_PROGRESS"}\n```\n'
+            "more text\n"
+            '```json\n  {"status": "complete", "n": 2}  \n```\n'
+        )
+        assert JsonCompletion.last_json_block(output) == '{"status": "complete", "n": 2}'
+        result = JsonCompletion().evaluate(output, 0)
+        assert result.is_complete is True
+        assert result.artifacts == {"status": "complete", "n": 2}
+
+    def test_later_block_without_signal_field_skipped(self):
+        """Happy: a trailing JSON dump without "status" doesn't hide the signal."""
+        output = (
+            '```json\n{"status": "APPROVED"}\n```\n'
+            '```json\n{"files": ["a.py", "b.py"]}\n```\n'
+        )
+        result = JsonCompletion().evaluate(output, 0)
+        assert result.is_complete is True
+        assert result.signal == "APPROVED"
+
+    def test_no_block_with_signal_field_uses_last(self):
+        """Failure: without any status block, the last block still gives artifacts."""
+        output = '```json\n{"a": 1}\n```\n```json\n{"b": 2}\n```\n'
+        result = JsonCompletion().evaluate(output, 0)
+        assert result.is_complete is False
+        assert result.signal is None
+        assert result.artifacts == {"b": 2}
+
+    def test_no_block(self):
+        """Failure: output without a json fence yields None and no completion."""
+        assert JsonCompletion.last_json_block("```python\nx = 1\n```") is None
+        assert JsonCompletion().evaluate("plain", 0).is_complete is False
+
+    def test_malformed_block(self):
+        """Failure: invalid JSON (NaN, trailing comma) is incomplete, not an error."""
+        for body in ('{"status": NaN}', '{"status": "COMPLETE",}'):
+            output = "```json\n" + body + "\n```"
+            assert JsonCompletion().evaluate(output, 0).is_complete is False
+
+    def test_unhashable_status_value(self):
+        """Failure: a list or object status is incomplete, not a TypeError."""
+        for body in ('{"status": ["COMPLETE"]}', '{"status": {"s": 1}}'):
+            output = "```json\n" + body + "\n```"
+            assert JsonCompletion().evaluate(output, 0).is_complete is False
+
+
+class TestCompositeCompletion:
+    """Tests for CompositeCompletion.evaluate."""
+
+    def test_miss_evaluates_each_strategy_once(self):
+        """Failure: with no completion, the last result is returned without re-running."""
+        first = MagicMock(evaluate=MagicMock(return_value=CompletionResult(False, "A")))
+        last = MagicMock(evaluate=MagicMock(return_value=CompletionResult(False, "B")))
+        result = CompositeCompletion([first, last]).evaluate("out", 0)
+        assert result.signal == "B"
+        assert first.evaluate.call_count == 1
+        assert last.evaluate.call_count == 1
+
+    def test_no_strategies(self):
+        """Failure: an empty composite is never complete."""
+        assert CompositeCompletion([]).evaluate("out", 0) == CompletionResult(is_complete=False)
+
+
+class TestStrategySlots:
+    """Built-in strategies are slotted and carry no instance __dict__."""
+
+    def test_strategies_have_no_instance_dict(self):
+        """Happy: every built-in strategy keeps its config in slots."""
+        strategies = [
+            PromiseCompletion(),
+            JsonCompletion(),
+            CompositeCompletion([PromiseCompletion()]),
+        ]
+        for strategy in strategies:
+            assert not hasattr(strategy, "__dict__")
+        assert strategies[1].signal_field == "status"
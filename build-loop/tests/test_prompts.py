@@ -0,0 +1,110 @@
+"""Tests for interactive prompt helpers in cli.py."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+class TestPromptForAgent:
+    """Tests for prompt_for_agent()."""
+
+    @pytest.mark.parametrize("answer,expected", [
+        ("codex", "codex"), (" Claude ", "claude"), ("", "claude"),
+    ])
+    def test_accepts_known_agents(self, answer, expected):
+        """Happy: known agents (any case) are returned; empty uses the default."""
+        from build_loop.cli import prompt_for_agent
+
+        with patch("builtins.input", return_value=answer):
+            assert prompt_for_agent() == expected
+
+    def test_unknown_agent_falls_back(self, capsys):
+        """Failure: an unknown agent falls back to claude with a notice."""
+        from build_loop.cli import prompt_for_agent
+
+        with patch("builtins.input", return_value="gpt"):
+            assert prompt_for_agent() == "claude"
+        assert "Using default: claude" in capsys.readouterr().out
+
+
+class TestPromptForMaxIterations:
+    """Tests for prompt_for_max_iterations()."""
+
+    def test_positive_number_returned(self):
+        """Happy: a positive integer is used as-is."""
+        from build_loop.cli import prompt_for_max_iterations
+
+        with patch("builtins.input", return_value=" 25 "):
+            assert prompt_for_max_iterations() == 25
+
+    @pytest.mark.parametrize("answer", ["", "0", "ten"])
+    def test_bad_input_uses_default(self, answer):
+        """Failure: empty, non-positive and non-numeric input give 10."""
+        from build_loop.cli import prompt_for_max_iterations
+
+        with patch("builtins.input", return_value=answer):
+            assert prompt_for_max_iterations() == 10
+
+
+class TestPromptForValidate:
+    """Tests for prompt_for_validate()."""
+
+    @pytest.mark.parametrize("answer,expected", [
+        ("y", True), ("YES", True), (" yeah", True), ("", False), ("n", False), ("no", False),
+    ])
+    def test_yes_answers(self, answer, expected):
+        """Happy: answers starting with y (any case) enable validation."""
+        from build_loop.cli import prompt_for_validate
+
+        with patch("builtins.input", return_value=answer):
+            assert prompt_for_validate() is expected
+
+
+class TestPromptPathsNormalized:
+    """Prompted paths come back with the @ prefix stripped."""
+
+    def test_context_files_strip_at_prefix(self):
+        """Happy: each comma-separated path is trimmed and normalized."""
+        from build_loop.cli import prompt_for_context_files
+
+        with patch("builtins.input", return_value="@docs/a.md, b.md ,@"):
+            assert prompt_for_context_files() == ["docs/a.md", "b.md"]
+
+    def test_tasks_file_strips_at_prefix(self):
+        """Happy: the tasks path is normalized; a bare @ re-prompts."""
+        from build_loop.cli import prompt_for_tasks_file
+
+        with patch("builtins.input", side_effect=["@", "@docs/tasks.md"]):
+            assert prompt_for_tasks_file() == "docs/tasks.md"
+
+
+class TestMainNormalizesArgs:
+    """main() strips @ from --tasks/--context before anything uses them."""
+
+    def test_flag_paths_normalized_before_validation(self):
+        """Happy: validate_inputs sees normalized tasks and context paths."""
+        from build_loop.cli import main
+
+        with patch("sys.argv", ["spectre-build", "--tasks", "@t.md", "--context", "@c.md"]), \
+             patch("build_loop.cli.validate_inputs", side_effect=SystemExit(1)) as mock_validate, \
+             pytest.raises(SystemExit):
+            main()
+
+        mock_validate.assert_called_once_with("t.md", ["c.md"], 10)
+
+    def test_positional_yaml_runs_pipeline(self, tmp_path, monkeypatch):
+        """Happy: a leading pipeline YAML reaches run_pipeline as its path."""
+        from build_loop.cli import main
+
+        monkeypatch.chdir(tmp_path)
+        with patch("sys.argv", ["spectre-build", "p.yaml", "--tasks", "@t.md", "--no-notify"]), \
+             patch("build_loop.cli.validate_inputs"), \
+             patch("build_loop.cli.save_session"), \
+             patch("build_loop.cli.run_pipeline", return_value=(0, 1)) as mock_run, \
+             pytest.raises(SystemExit):
+            main()
+
+        pipeline_path, tasks_file, context_files = mock_run.call_args.args
+        assert pipeline_path == str(tmp_path.resolve() / "p.yaml")
+        assert tasks_file == str(tmp_path.resolve() / "t.md")
+        assert context_files == []
@@ -229,3 +229,74 @@ class TestFormatSessionSummaryShip:
 
         assert "Ship" not in summary
         assert "Parent" not in summary
+
+    def test_format_aligns_context_and_optional_fields(self):
+        """Happy: extra context files align under the first; optional rows keep their column."""
+        from build_loop.cli import format_session_summary
+
+        session = {
+            "tasks_file": "tasks.md",
+            "context_files": ["a.md", "b.md"],
+            "max_iterations": 3,
+            "manifest_path": "build.md",
+            "plan_clarifications_path": "clarif.md",
+        }
+
+        assert format_session_summary(session).splitlines() == [
+            "  Agent:      claude",
+            "  Tasks:      tasks.md",
+            "  Context:    a.md",
+            "              b.md",
+            "  Max iter:   3",
+            "  Manifest:   build.md",
+            "  Clarif:     clarif.md",
+        ]
+
+
+class TestSessionEncoding:
+    """save_session/load_session work with and without orjson."""
+
+    def test_round_trip_without_orjson(self, tmp_path):
+        """Happy: the stdlib json fallback writes and reads the session."""
+        from build_loop.cli import load_session, save_session
+
+        session_file = tmp_path / ".spectre" / "build-session.json"
+
+        with patch("build_loop.cli.get_session_path", return_value=session_file), \
+             patch.dict("sys.modules", {"orjson": None}):
+            save_session(tasks_file="tâches.md", context_files=[], max_iterations=3)
+            session = load_session()
+
+        assert session["tasks_file"] == "tâches.md"
+        assert session["max_iterations"] == 3
+
+    def test_load_session_invalid_json_returns_none(self, tmp_path):
+        """Failure: a corrupt session file loads as None."""
+        from build_loop.cli import load_session
+
+        session_file = tmp_path / "build-session.json"
+        session_file.write_text("{not json")
+
+        with patch("build_loop.cli.get_session_path", return_value=session_file):
+            assert load_session() is None
+
+
+class TestSessionCwd:
+    """Session paths resolve the working directory once."""
+
+    def test_save_session_reads_cwd_once(self, tmp_path):
+        """Happy: the session path and recorded cwd come from one lookup."""
+        from build_loop.cli import load_session, save_session
+
+        with patch("build_loop.cli.Path.cwd", return_value=tmp_path) as mock_cwd:
+            save_session(tasks_file="tasks.md", context_files=[], max_iterations=1)
+        assert mock_cwd.call_count == 1
+
+        session = load_session(tmp_path)
+        assert session["cwd"] == str(tmp_path)
+
+    def test_load_session_missing_in_given_cwd(self, tmp_path):
+        """Failure: no session file under the given cwd returns None."""
+        from build_loop.cli import load_session
+
+        assert load_session(tmp_path) is None
@@ -200,3 +200,43 @@ class TestShipAfterStageNoOps:
         result = CompletionResult(is_complete=True, signal="BUILD_COMPLETE")
         ship_after_stage("build", context, result)
         assert context == {"some_key": "value"}
+
+
+# ---------------------------------------------------------------------------
+# HEAD reuse between stages
+# ---------------------------------------------------------------------------
+
+
+class TestHeadReuseBetweenStages:
+    """HEAD read by an after-hook's diff is reused by the next before-hook only."""
+
+    def _run_clean_execute(self, context: dict) -> None:
+        from build_loop.git_scope import GitDiff
+
+        diff = GitDiff(start_commit="abc1234", end_commit="xyz9999")
+        result = CompletionResult(is_complete=True, signal="CLEAN_EXECUTE_COMPLETE")
+        with patch("build_loop.hooks.collect_diff", return_value=diff):
+            ship_after_stage("clean_execute", context, result)
+
+    def test_test_plan_reuses_clean_execute_head(self):
+        """Happy: test_plan takes its start commit from the clean_execute diff."""
+        context: dict = {"_phase_start_commit": "abc1234"}
+        self._run_clean_execute(context)
+
+        with patch("build_loop.hooks.snapshot_head") as mock_snapshot:
+            ship_before_stage("test_plan", context)
+
+        mock_snapshot.assert_not_called()
+        assert context["_phase_start_commit"] == "xyz9999"
+
+    def test_intervening_stage_discards_reused_head(self):
+        """Failure: any other before-hook drops the value so it cannot go stale."""
+        context: dict = {"_phase_start_commit": "abc1234"}
+        self._run_clean_execute(context)
+        ship_before_stage("test_verify", context)
+
+        with patch("build_loop.hooks.snapshot_head", return_value="fresh00") as mock_snapshot:
+            ship_before_stage("test_plan", context)
+
+        mock_snapshot.assert_called_once()
+        assert context["_phase_start_commit"] == "fresh00"
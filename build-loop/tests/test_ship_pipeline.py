@@ -217,13 +217,13 @@ class TestShipCompletionStatuses:
         """Failure: test_commit only accepts TEST_COMMIT_COMPLETE."""
         config = create_ship_pipeline()
         stage = config.stages["test_commit"]
-        assert stage.completion.complete_statuses == ["TEST_COMMIT_COMPLETE"]
+        assert stage.completion.complete_statuses == {"TEST_COMMIT_COMPLETE"}
 
     def test_rebase_statuses(self):
         """Failure: Rebase stage only accepts SHIP_COMPLETE."""
         config = create_ship_pipeline()
         rebase = config.stages["rebase"]
-        assert rebase.completion.complete_statuses == ["SHIP_COMPLETE"]
+        assert rebase.completion.complete_statuses == {"SHIP_COMPLETE"}
 
 
 class TestShipStageIterations:
@@ -0,0 +1,227 @@
+"""Tests for memoized stage results and shared stage template reads."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from build_loop.filecache import FileCache
+from build_loop.pipeline import executor as executor_module
+from build_loop.pipeline import stage as stage_module
+from build_loop.pipeline.completion import CompositeCompletion, JsonCompletion, PromiseCompletion
+from build_loop.pipeline.executor import (
+    PipelineConfig,
+    PipelineExecutor,
+    PipelineStatus,
+    StageCache,
+    StageCompletedEvent,
+    StageIterationEvent,
+    StageStartedEvent,
+)
+from build_loop.pipeline.stage import Stage, StageConfig
+
+
+def _config(enable_memoization=True, transitions=None):
+    return PipelineConfig(
+        name="research",
+        stages={
+            "research": StageConfig(
+                name="research",
+                prompt_template="Research {topic}",
+                completion=PromiseCompletion(complete_signals=["DONE", "AGAIN"]),
+                max_iterations=1,
+                transitions=transitions or {},
+            ),
+        },
+        start_stage="research",
+        end_signals=["DONE"],
+        enable_memoization=enable_memoization,
+    )
+
+
+def _runner(*outputs):
+    runner = MagicMock()
+    runner.name = "claude"
+    runner.run_iteration = MagicMock(side_effect=[(0, out, "") for out in outputs])
+    return runner
+
+
+class TestStageMemoization:
+    """PipelineExecutor reuses completed stage results when enabled."""
+
+    def test_rerun_with_same_prompt_hits_cache(self):
+        """Happy: a second run with the same inputs skips the agent."""
+        cache = StageCache()
+        runner = _runner("[[PROMISE:DONE]]")
+        for _ in range(2):
+            state = PipelineExecutor(
+                config=_config(), runner=runner, context={"topic": "x"}, cache=cache
+            ).run()
+            assert state.status == PipelineStatus.COMPLETED
+        assert runner.run_iteration.call_count == 1
+        assert state.total_iterations == 0
+
+    def test_separate_executors_share_default_cache(self):
+        """Happy: executors built without a cache reuse each other's results."""
+        runner = _runner("[[PROMISE:DONE]]")
+        with patch.object(executor_module, "_SHARED_CACHE", StageCache()):
+            for _ in range(2):
+                PipelineExecutor(config=_config(), runner=runner, context={"topic": "x"}).run()
+        assert runner.run_iteration.call_count == 1
+
+    def test_prompt_built_once(self):
+        """Happy: the prompt used for the cache key is the one sent to the agent."""
+        runner = _runner("no signal", "[[PROMISE:DONE]]")
+        executor = PipelineExecutor(
+            config=_config(), runner=runner, context={"topic": "x"}, cache=StageCache()
+        )
+        stage = executor._stages["research"]
+        stage.config.max_iterations = 2
+        with patch.object(stage, "build_prompt", wraps=stage.build_prompt) as build:
+            executor.run()
+        assert build.call_count == 1
+        assert runner.run_iteration.call_args.args[0] == "Research x"
+
+    def test_oldest_entry_evicted(self):
+        """Failure: past max_entries the oldest result is dropped."""
+        cache = StageCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, (MagicMock(), 1))
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    @pytest.mark.parametrize("change", ["runner", "denied_tools"])
+    def test_other_agent_or_tools_miss(self, change):
+        """Happy: a different agent or tool denylist re-runs the stage."""
+        cache = StageCache()
+        runners = [_runner("[[PROMISE:DONE]]"), _runner("[[PROMISE:DONE]]")]
+        if change == "runner":
+            runners[1].name = "codex"
+        for i, runner in enumerate(runners):
+            config = _config()
+            if change == "denied_tools" and i:
+                config.stages["research"].denied_tools = ["Bash"]
+            PipelineExecutor(
+                config=config, runner=runner, context={"topic": "x"}, cache=cache
+            ).run()
+        assert runners[1].run_iteration.call_count == 1
+
+    def test_different_prompt_misses(self):
+        """Happy: changing a context value used by the template re-runs the stage."""
+        cache = StageCache()
+        runner = _runner("[[PROMISE:DONE]]", "[[PROMISE:DONE]]")
+        for topic in ("x", "y"):
+            PipelineExecutor(
+                config=_config(), runner=runner, context={"topic": topic}, cache=cache
+            ).run()
+        assert runner.run_iteration.call_count == 2
+
+    def test_disabled_by_default(self):
+        """Failure: without enable_memoization, every run invokes the agent."""
+        cache = StageCache()
+        runner = _runner("[[PROMISE:DONE]]", "[[PROMISE:DONE]]")
+        for _ in range(2):
+            PipelineExecutor(
+                config=_config(enable_memoization=False),
+                runner=runner, context={"topic": "x"}, cache=cache,
+            ).run()
+        assert runner.run_iteration.call_count == 2
+
+    def test_incomplete_result_not_cached(self):
+        """Failure: an incomplete run is retried on the next run."""
+        cache = StageCache()
+        runner = _runner("no signal", "[[PROMISE:DONE]]")
+        for _ in range(2):
+            PipelineExecutor(
+                config=_config(), runner=runner, context={"topic": "x"}, cache=cache
+            ).run()
+        assert runner.run_iteration.call_count == 2
+
+    def test_loop_back_in_same_run_not_replayed(self):
+        """Failure: revisiting a stage within a run calls the agent again."""
+        cache = StageCache()
+        runner = _runner("[[PROMISE:AGAIN]]", "[[PROMISE:DONE]]")
+        state = PipelineExecutor(
+            config=_config(transitions={"AGAIN": "research"}),
+            runner=runner, context={"topic": "x"}, cache=cache,
+        ).run()
+        assert state.status == PipelineStatus.COMPLETED
+        assert runner.run_iteration.call_count == 2
+
+
+class TestMissingTemplate:
+    """A prompt that can't be built ends the stage as a failed iteration."""
+
+    @pytest.mark.parametrize("enable_memoization", [False, True])
+    def test_stage_fails_with_events_and_history(self, tmp_path, enable_memoization):
+        """Failure: the stage records a failed result instead of aborting the pipeline."""
+        config = _config(enable_memoization=enable_memoization)
+        config.stages["research"].prompt_template = str(tmp_path / "missing.md")
+        events, after = [], []
+        runner = _runner()
+        state = PipelineExecutor(
+            config=config, runner=runner, context={"topic": "x"}, cache=StageCache(),
+            on_event=events.append,
+            after_stage=lambda name, ctx, result: after.append(result),
+        ).run()
+
+        assert [type(e) for e in events] == [
+            StageStartedEvent, StageIterationEvent, StageCompletedEvent,
+        ]
+        assert state.stage_history == [("research", None)]
+        assert state.total_iterations == 1
+        assert "missing.md" in after[0].artifacts["error"]
+        runner.run_iteration.assert_not_called()
+
+
+class TestCompletionFingerprint:
+    """CompletionStrategy.fingerprint describes configuration stably."""
+
+    def test_equal_configs_match(self):
+        """Happy: same settings give the same text, regardless of signal order."""
+        first = PromiseCompletion(complete_signals=["A", "B"])
+        second = PromiseCompletion(complete_signals=["B", "A"])
+        assert first.fingerprint() == second.fingerprint()
+
+    def test_different_configs_differ(self):
+        """Happy: settings and nested strategies are part of the text."""
+        composite = CompositeCompletion([JsonCompletion(), PromiseCompletion()])
+        assert "JsonCompletion(" in composite.fingerprint()
+        assert (
+            PromiseCompletion(require_success=True).fingerprint()
+            != PromiseCompletion().fingerprint()
+        )
+
+
+class TestStageTemplateFiles:
+    """Template files are read once across Stage instances until they change."""
+
+    def _stage(self, path):
+        config = StageConfig(
+            name="s", prompt_template=str(path), completion=PromiseCompletion()
+        )
+        return Stage(config=config, runner=MagicMock())
+
+    def test_new_stage_reuses_read(self, tmp_path):
+        """Happy: a second Stage for the same file doesn't re-read it."""
+        template = tmp_path / "stage.md"
+        template.write_text("Do {thing}")
+        with patch.object(stage_module, "_TEMPLATE_FILES", FileCache()), \
+             patch("builtins.open", wraps=open) as mock_open:
+            assert self._stage(template).load_template() == "Do {thing}"
+            assert self._stage(template).load_template() == "Do {thing}"
+        assert mock_open.call_count == 1
+
+    def test_edited_file_reread(self, tmp_path):
+        """Happy: a changed file is read again by the next Stage."""
+        template = tmp_path / "stage.md"
+        template.write_text("one")
+        with patch.object(stage_module, "_TEMPLATE_FILES", FileCache()):
+            assert self._stage(template).load_template() == "one"
+            template.write_text("second")
+            assert self._stage(template).load_template() == "second"
+
+    def test_missing_md_and_inline(self, tmp_path):
+        """Failure: a missing .md path raises; other text is an inline template."""
+        with pytest.raises(FileNotFoundError):
+            self._stage(tmp_path / "missing.md").load_template()
+        assert self._stage("Inline {x}\nsecond line").load_template() == "Inline {x}\nsecond line"
@@ -95,7 +95,7 @@ class TestToolResultProcessing:
                 }],
             },
         }
-        process_stream_event(tool_use_event, [])
+        process_stream_event(tool_use_event, [].append)
 
         # Simulate error tool_result
         error_event = {
@@ -109,7 +109,7 @@ class TestToolResultProcessing:
                 }],
             },
         }
-        process_stream_event(error_event, [])
+        process_stream_event(error_event, [].append)
 
         output = capsys.readouterr().out
         assert "❌ Task error: Tool 'Task' is not allowed" in output
@@ -130,7 +130,7 @@ class TestToolResultProcessing:
                 }],
             },
         }
-        process_stream_event(tool_use_event, [])
+        process_stream_event(tool_use_event, [].append)
 
         result_event = {
             "type": "user",
@@ -142,7 +142,7 @@ class TestToolResultProcessing:
                 }],
             },
         }
-        process_stream_event(result_event, [])
+        process_stream_event(result_event, [].append)
 
         output = capsys.readouterr().out
         assert "✅ Task(spectre:dev) done: Implement auth flow" in output
@@ -160,7 +160,7 @@ class TestToolResultProcessing:
                 }],
             },
         }
-        process_stream_event(tool_use_event, [])
+        process_stream_event(tool_use_event, [].append)
 
         result_event = {
             "type": "user",
@@ -172,7 +172,7 @@ class TestToolResultProcessing:
                 }],
             },
         }
-        process_stream_event(result_event, [])
+        process_stream_event(result_event, [].append)
 
         output = capsys.readouterr().out
         # Should only have the Read dispatch line, no result line
@@ -185,7 +185,7 @@ class TestToolResultProcessing:
         _pending_tools["stale_id"] = {"name": "Read", "input": {}}
         assert len(_pending_tools) == 1
 
-        process_stream_event({"type": "system"}, [])
+        process_stream_event({"type": "system"}, [].append)
         assert len(_pending_tools) == 0
 
     def test_error_text_truncated(self, capsys):
@@ -204,7 +204,7 @@ class TestToolResultProcessing:
                 }],
             },
         }
-        process_stream_event(error_event, [])
+        process_stream_event(error_event, [].append)
 
         output = capsys.readouterr().out
         assert "..." in output
@@ -213,3 +213,20 @@ class TestToolResultProcessing:
         # The error text portion should be ≤120 chars
         error_text = error_line.split("error: ", 1)[1]
         assert len(error_text) <= 120
+
+    def test_assistant_text_is_emitted(self, capsys):
+        """Non-blank assistant text goes to the emit callback; blank text does not."""
+        emitted: list[str] = []
+        event = {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "text", "text": "Working on it [[PROMISE:TASK_COMPLETE]]"},
+                    {"type": "text", "text": "   "},
+                ],
+            },
+        }
+        process_stream_event(event, emitted.append)
+
+        assert emitted == ["Working on it [[PROMISE:TASK_COMPLETE]]"]
+        assert "💬 Working on it" in capsys.readouterr().out
@@ -0,0 +1,45 @@
+"""Tests for validate_inputs file checks in cli.py."""
+
+import os
+
+import pytest
+
+from build_loop.cli import validate_inputs
+
+
+class TestValidateInputs:
+    """Tests for validate_inputs."""
+
+    def test_readable_files_pass(self, tmp_path):
+        """Happy: existing regular files and a positive limit validate."""
+        tasks = tmp_path / "tasks.md"
+        ctx = tmp_path / "scope.md"
+        tasks.write_text("- [ ] task")
+        ctx.write_text("scope")
+        assert validate_inputs(str(tasks), [str(ctx)], 5) is True
+
+    def test_reports_every_problem(self, tmp_path, capsys):
+        """Failure: missing, directory and bad-limit errors are all listed."""
+        tasks = tmp_path / "tasks.md"
+        tasks.write_text("- [ ] task")
+        with pytest.raises(SystemExit):
+            validate_inputs(
+                str(tmp_path / "missing.md"),
+                [str(tmp_path), str(tasks / "child.md")],
+                0,
+            )
+        err = capsys.readouterr().err
+        assert "Tasks file not found" in err
+        assert "Context path is not a file" in err
+        assert "Context file not found" in err
+        assert "Max iterations must be positive: 0" in err
+
+    @pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() == 0, reason="needs POSIX permissions as non-root")
+    def test_unreadable_file(self, tmp_path, capsys):
+        """Failure: a file without read permission is reported."""
+        tasks = tmp_path / "tasks.md"
+        tasks.write_text("- [ ] task")
+        tasks.chmod(0)
+        with pytest.raises(SystemExit):
+            validate_inputs(str(tasks), [], 1)
+        assert "Tasks file is not readable" in capsys.readouterr().err